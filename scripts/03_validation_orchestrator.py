@@ -16,97 +16,77 @@ Why this matters:
 import json
 import sys
 from pathlib import Path
-from typing import Dict, List, Set
+from typing import Dict, List, Optional
 from datetime import datetime
 
+import provenance
+from provenance import Provenance
 
-def validate_evidence_item(
-    evidence_id: str,
-    evidence: Dict,
-    corpus_mapping: Dict,
-    min_sources: int = 3
-) -> Dict:
+
+# Metadata fields looked up in the corpus mapping, in match_details order
+VALIDATION_FIELDS = ["from_address", "to_address", "entity_name", "amount_usd", "url"]
+
+
+class CorpusIndex:
     """
-    Validate single evidence item against corpus.
+    Corpus mapping compiled once for validation.
 
-    Returns: {
-        "status": "admitted" | "flagged" | "rejected",
-        "corpus_sources": [file paths],
-        "source_count": int,
-        "reason": str
-    }
+    Every corpus file gets an integer ID from the shared provenance registry
+    and every term maps to a bitmap of those IDs, so per-item source counting
+    is a bitmap union and cardinality.
     """
-    metadata = evidence.get("metadata", {})
 
-    # Collect unique corpus source files
-    corpus_sources = set()
-    match_details = []
+    def __init__(self, corpus_mapping: Dict, registry: Optional[Provenance] = None):
+        self.provenance = registry if registry is not None else Provenance()
+        mappings = {
+            term: mapping for term, mapping in corpus_mapping.items()
+            if isinstance(mapping, dict)
+        }
 
-    # Check wallet addresses (blockchain evidence)
+        # New files are registered in path order
+        for path in sorted({m["file"] for mapping in mappings.values() for m in mapping.get("matches", [])}):
+            self.provenance.file_id(path)
+
+        # term -> (support bitmap, raw match count)
+        self.terms: Dict = {}
+        for term, mapping in mappings.items():
+            matches = mapping.get("matches", [])
+            self.terms[term] = (self.provenance.bitmap(m["file"] for m in matches), len(matches))
+
+    def __contains__(self, term) -> bool:
+        return term in self.terms
+
+    @property
+    def files(self) -> List[str]:
+        return self.provenance.files
+
+    def paths(self, bitmap) -> List[str]:
+        """Support bitmap -> sorted corpus paths"""
+        return self.provenance.paths(bitmap)
+
+
+def evidence_terms(metadata: Dict) -> List[tuple]:
+    """(field, term) pairs an evidence item is validated on"""
+    terms = []
     for field in ["from_address", "to_address"]:
         if field in metadata:
-            wallet = metadata[field].lower()
-            if wallet in corpus_mapping:
-                mapping = corpus_mapping[wallet]
-                files = set(m["file"] for m in mapping.get("matches", []))
-                corpus_sources.update(files)
-                match_details.append({
-                    "field": field,
-                    "value": wallet,
-                    "matches": len(mapping.get("matches", [])),
-                    "files": list(files)
-                })
-
-    # Check entity names
+            terms.append((field, metadata[field].lower()))
     if "entity_name" in metadata:
-        entity = metadata["entity_name"]
-        if entity in corpus_mapping:
-            mapping = corpus_mapping[entity]
-            files = set(m["file"] for m in mapping.get("matches", []))
-            corpus_sources.update(files)
-            match_details.append({
-                "field": "entity_name",
-                "value": entity,
-                "matches": len(mapping.get("matches", [])),
-                "files": list(files)
-            })
-
-    # Check amounts (for verification)
+        terms.append(("entity_name", metadata["entity_name"]))
     if "amount_usd" in metadata and metadata["amount_usd"] > 0:
-        amount = metadata["amount_usd"]
-        if amount in corpus_mapping:
-            mapping = corpus_mapping[amount]
-            files = set(m["file"] for m in mapping.get("matches", []))
-            corpus_sources.update(files)
-            match_details.append({
-                "field": "amount_usd",
-                "value": amount,
-                "matches": len(mapping.get("matches", [])),
-                "files": list(files)
-            })
-
-    # Check URLs
+        terms.append(("amount_usd", metadata["amount_usd"]))
     if "url" in metadata:
-        url = metadata["url"]
-        if url in corpus_mapping:
-            mapping = corpus_mapping[url]
-            files = set(m["file"] for m in mapping.get("matches", []))
-            corpus_sources.update(files)
-            match_details.append({
-                "field": "url",
-                "value": url,
-                "matches": len(mapping.get("matches", [])),
-                "files": list(files)
-            })
+        terms.append(("url", metadata["url"]))
+    return terms
 
-    # Decision logic
-    num_sources = len(corpus_sources)
 
+def _decide(num_sources: int, corpus_sources: List[str], match_details: List[Dict], min_sources: int) -> Dict:
+    """Admit/flag/reject decision for a counted source set"""
     if num_sources >= min_sources:
         # ADMIT: Sufficient corpus backing
         return {
             "status": "admitted",
-            "corpus_sources": sorted(list(corpus_sources)),
+            "corpus_sources": corpus_sources,
             "source_count": num_sources,
             "match_details": match_details,
             "reason": f"Validated across {num_sources} corpus sources (>= {min_sources} required)"
@@ -116,7 +96,7 @@ def validate_evidence_item(
         # FLAG: Some corpus backing but needs manual review
         return {
             "status": "flagged",
-            "corpus_sources": sorted(list(corpus_sources)),
+            "corpus_sources": corpus_sources,
             "source_count": num_sources,
             "match_details": match_details,
             "reason": f"Only {num_sources} source(s), requires manual review (need {min_sources})"
@@ -133,6 +113,74 @@ def validate_evidence_item(
         }
 
 
+def validate_all(evidence_index: Dict, index: CorpusIndex, min_sources: int = 3) -> Dict[str, Dict]:
+    """
+    Validate the whole inventory in one pass over a compiled CorpusIndex.
+
+    Items that hit the same terms share one union and one sorted path list,
+    so popular wallets/entities are resolved once rather than per item.
+    The shared lists are read-only; copy before mutating a validation.
+
+    Returns: {evidence_id: validation}
+    """
+    # Sorted paths per term, resolved on first use
+    term_paths: Dict = {}
+    # Hit key -> (support bitmap, source count, sorted corpus sources)
+    unions: Dict = {}
+
+    results = {}
+    for evidence_id, evidence in evidence_index.items():
+        hits = tuple(
+            (field, term) for field, term in evidence_terms(evidence.get("metadata", {}))
+            if term in index.terms
+        )
+
+        key = tuple(term for _, term in hits)
+        if key not in unions:
+            support = provenance.union(*(index.terms[term][0] for term in key))
+            unions[key] = (support, provenance.cardinality(support), index.paths(support))
+        support, num_sources, corpus_sources = unions[key]
+        index.provenance.add_support(evidence_id, support)
+
+        match_details = []
+        for field, term in hits:
+            if term not in term_paths:
+                term_paths[term] = index.paths(index.terms[term][0])
+            match_details.append({
+                "field": field,
+                "value": term,
+                "matches": index.terms[term][1],
+                "files": term_paths[term]
+            })
+
+        results[evidence_id] = _decide(num_sources, corpus_sources, match_details, min_sources)
+
+    return results
+
+
+def validate_evidence_item(
+    evidence_id: str,
+    evidence: Dict,
+    corpus_mapping,
+    min_sources: int = 3
+) -> Dict:
+    """
+    Validate single evidence item against corpus.
+
+    corpus_mapping may be the raw mapping or a CorpusIndex; pass an index
+    (or use validate_all) when validating more than one item.
+
+    Returns: {
+        "status": "admitted" | "flagged" | "rejected",
+        "corpus_sources": [file paths],
+        "source_count": int,
+        "reason": str
+    }
+    """
+    index = corpus_mapping if isinstance(corpus_mapping, CorpusIndex) else CorpusIndex(corpus_mapping)
+    return validate_all({evidence_id: evidence}, index, min_sources)[evidence_id]
+
+
 def main():
     # Paths
     evidence_path = "/Users/breydentaylor/certainly/visualizations/evidence_index.json"
@@ -159,8 +207,14 @@ def main():
     rejected = {}
     flagged = {}
 
+    index = CorpusIndex(corpus_mapping, Provenance.load())
+    print(f"   Compiled {len(index.terms)} terms over {len(index.files)} corpus files")
+    validations = validate_all(evidence_index, index)
+    index.provenance.save()
+    index.provenance.save_support()
+
     for evidence_id, evidence in evidence_index.items():
-        validation = validate_evidence_item(evidence_id, evidence, corpus_mapping)
+        validation = validations[evidence_id]
 
         # Add validation metadata to evidence
         evidence["validation"] = validation
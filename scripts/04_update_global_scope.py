@@ -20,25 +20,20 @@ from pathlib import Path
 from datetime import datetime
 from typing import Dict, List
 
+from validation_aggregates import load_aggregates
 
-def generate_agent_constraints(validation_results: Dict) -> Dict:
-    """Generate agent-specific constraints based on validation results."""
 
-    admitted = validation_results["admitted"]
-    rejected = validation_results["rejected"]
-    flagged = validation_results["flagged"]
+def generate_agent_constraints(aggregates: Dict) -> Dict:
+    """Generate agent-specific constraints based on validation aggregates."""
+
+    ids = aggregates["ids"]
+    admitted_by_category = aggregates["admitted_by_category"]
 
     constraints = {}
 
     # Blockchain_Forensics constraints
-    blockchain_admitted = [
-        eid for eid, ev in admitted.items()
-        if ev.get("category") == "blockchain"
-    ]
-    blockchain_rejected = [
-        eid for eid, ev in rejected.items()
-        if ev.get("category") == "blockchain"
-    ]
+    blockchain_admitted = admitted_by_category.get("blockchain", [])
+    blockchain_rejected = aggregates["rejected_by_category"].get("blockchain", [])
 
     constraints["Blockchain_Forensics"] = {
         "focus_on": blockchain_admitted,
@@ -51,17 +46,10 @@ def generate_agent_constraints(validation_results: Dict) -> Dict:
     }
 
     # Entity_Linker constraints
-    entity_admitted = [
-        eid for eid, ev in admitted.items()
-        if ev.get("category") == "entities"
-    ]
+    entity_admitted = admitted_by_category.get("entities", [])
 
     constraints["Entity_Linker"] = {
-        "validated_entities": [
-            ev["metadata"]["entity_name"]
-            for ev in admitted.values()
-            if "entity_name" in ev.get("metadata", {})
-        ],
+        "validated_entities": aggregates["validated_entities"],
         "requirement": "Focus only on entities with 3+ corpus mentions",
         "stats": {
             "validated_entities": len(entity_admitted)
@@ -70,22 +58,19 @@ def generate_agent_constraints(validation_results: Dict) -> Dict:
 
     # TIER_Auditor constraints
     constraints["TIER_Auditor"] = {
-        "pre_approved": list(admitted.keys()),
-        "manual_review_queue": list(flagged.keys()),
-        "auto_reject": list(rejected.keys()),
+        "pre_approved": ids["admitted"],
+        "manual_review_queue": ids["flagged"],
+        "auto_reject": ids["rejected"],
         "requirement": "Deep dive only on flagged items - admitted items are corpus-backed",
         "stats": {
-            "pre_approved": len(admitted),
-            "needs_review": len(flagged),
-            "auto_rejected": len(rejected)
+            "pre_approved": len(ids["admitted"]),
+            "needs_review": len(ids["flagged"]),
+            "auto_rejected": len(ids["rejected"])
         }
     }
 
     # URL_Analyst constraints
-    url_admitted = [
-        eid for eid, ev in admitted.items()
-        if ev.get("category") == "urls"
-    ]
+    url_admitted = admitted_by_category.get("urls", [])
 
     constraints["URL_Analyst"] = {
         "validated_urls": url_admitted,
@@ -98,18 +83,14 @@ def generate_agent_constraints(validation_results: Dict) -> Dict:
     return constraints
 
 
-def identify_data_quality_issues(validation_results: Dict) -> List[Dict]:
+def identify_data_quality_issues(aggregates: Dict) -> List[Dict]:
     """Identify patterns in rejected evidence."""
 
-    rejected = validation_results["rejected"]
+    data_quality = aggregates["data_quality"]
     issues = []
 
     # Issue 1: Missing tx_hash (blockchain)
-    missing_tx_hash = [
-        eid for eid, ev in rejected.items()
-        if ev.get("category") == "blockchain"
-        and "tx_hash" not in ev.get("metadata", {})
-    ]
+    missing_tx_hash = data_quality["missing_tx_hash"]
 
     if missing_tx_hash:
         issues.append({
@@ -121,11 +102,7 @@ def identify_data_quality_issues(validation_results: Dict) -> List[Dict]:
         })
 
     # Issue 2: Placeholder evidence (zero amounts)
-    placeholder_evidence = [
-        eid for eid, ev in rejected.items()
-        if ev.get("metadata", {}).get("amount_usd") == 0
-        or ev.get("metadata", {}).get("total_volume") == 0
-    ]
+    placeholder_evidence = data_quality["placeholder"]
 
     if placeholder_evidence:
         issues.append({
@@ -137,11 +114,7 @@ def identify_data_quality_issues(validation_results: Dict) -> List[Dict]:
         })
 
     # Issue 3: Unknown entities/platforms
-    unknown_items = [
-        eid for eid, ev in rejected.items()
-        if ev.get("metadata", {}).get("entity_name") == "unknown"
-        or ev.get("metadata", {}).get("exchange") == "unknown"
-    ]
+    unknown_items = data_quality["unknown_identifiers"]
 
     if unknown_items:
         issues.append({
@@ -165,27 +138,27 @@ def main():
     Path(global_scope_path).parent.mkdir(parents=True, exist_ok=True)
     Path(checkpoint_path).parent.mkdir(parents=True, exist_ok=True)
 
-    # Load validation results
+    # Load validation aggregates (one pass over the results, cached by content hash)
     print(f"Loading validation results from: {validation_path}")
-    with open(validation_path, 'r') as f:
-        validation_results = json.load(f)
+    aggregates = load_aggregates(validation_path)
+    counts = aggregates["counts"]
 
     # Generate agent constraints
     print("\n📋 Generating agent constraints...")
-    agent_constraints = generate_agent_constraints(validation_results)
+    agent_constraints = generate_agent_constraints(aggregates)
 
     # Identify data quality issues
     print("🔍 Identifying data quality issues...")
-    quality_issues = identify_data_quality_issues(validation_results)
+    quality_issues = identify_data_quality_issues(aggregates)
 
     # Build global scope state
     global_scope = {
         "last_updated": datetime.now().isoformat(),
-        "validation_summary": validation_results["validation_metadata"],
+        "validation_summary": aggregates["validation_metadata"],
         "agent_constraints": agent_constraints,
         "data_quality_issues": quality_issues,
-        "next_phase_ready": len(validation_results["admitted"]) > 0,
-        "manual_review_required": len(validation_results["flagged"]) > 0
+        "next_phase_ready": counts["admitted"] > 0,
+        "manual_review_required": counts["flagged"] > 0
     }
 
     # Write global scope state
@@ -197,9 +170,9 @@ def main():
     checkpoint = {
         "validation_phase_complete": True,
         "timestamp": datetime.now().isoformat(),
-        "admitted_evidence_count": len(validation_results["admitted"]),
-        "flagged_evidence_count": len(validation_results["flagged"]),
-        "rejected_evidence_count": len(validation_results["rejected"]),
+        "admitted_evidence_count": counts["admitted"],
+        "flagged_evidence_count": counts["flagged"],
+        "rejected_evidence_count": counts["rejected"],
         "ready_for_phase3": True
     }
 
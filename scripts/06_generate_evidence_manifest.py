@@ -19,73 +19,29 @@ from pathlib import Path
 from datetime import datetime
 from typing import Dict, List
 
+from validation_aggregates import load_aggregates
 
-def build_evidence_manifest(validation_results: Dict) -> Dict:
-    """Build prosecution-ready evidence manifest from admitted items."""
 
-    admitted = validation_results["admitted"]
+def build_evidence_manifest(aggregates: Dict) -> Dict:
+    """Build prosecution-ready evidence manifest from admitted items (tier-sorted in the aggregates)."""
 
-    # Sort by TIER priority (TIER 1 = highest)
-    tier_order = {"TIER 1": 1, "TIER 2": 2, "TIER 3": 3, "TIER 4": 4, "TIER 5": 5}
-    sorted_evidence = sorted(
-        admitted.items(),
-        key=lambda x: tier_order.get(x[1].get("tier", "TIER 5"), 5)
-    )
+    views = aggregates["manifest"]
+    total_admitted = aggregates["counts"]["admitted"]
 
     manifest = {
         "manifest_metadata": {
             "generated_at": datetime.now().isoformat(),
-            "total_evidence": len(admitted),
+            "total_evidence": total_admitted,
             "validation_source": "validated_evidence.json",
             "purpose": "Prosecution-ready evidence with corpus backing"
         },
-        "evidence_by_tier": {},
-        "evidence_by_category": {},
-        "rico_predicate_mapping": {},
+        "evidence_by_tier": views["evidence_by_tier"],
+        "evidence_by_category": views["evidence_by_category"],
+        "rico_predicate_mapping": views["rico_predicate_mapping"],
         "top_entities": [],
-        "evidence_items": {}
+        "evidence_items": views["evidence_items"]
     }
 
-    # Build evidence items with enhanced metadata
-    for evidence_id, evidence in sorted_evidence:
-        tier = evidence.get("tier", "TIER 5")
-        category = evidence.get("category", "unknown")
-
-        # Add to tier bucket
-        if tier not in manifest["evidence_by_tier"]:
-            manifest["evidence_by_tier"][tier] = []
-        manifest["evidence_by_tier"][tier].append(evidence_id)
-
-        # Add to category bucket
-        if category not in manifest["evidence_by_category"]:
-            manifest["evidence_by_category"][category] = []
-        manifest["evidence_by_category"][category].append(evidence_id)
-
-        # Map to RICO predicates
-        predicates = []
-        if category == "blockchain":
-            predicates.append("money_laundering")
-        if category in ["telegram", "urls"]:
-            predicates.append("wire_fraud")
-        if "medical" in str(evidence.get("metadata", {})).lower():
-            predicates.extend(["wire_fraud", "fraudulent_claims"])
-
-        for predicate in predicates:
-            if predicate not in manifest["rico_predicate_mapping"]:
-                manifest["rico_predicate_mapping"][predicate] = []
-            manifest["rico_predicate_mapping"][predicate].append(evidence_id)
-
-        # Store evidence with prosecution metadata
-        manifest["evidence_items"][evidence_id] = {
-            "tier": tier,
-            "category": category,
-            "rico_predicates": predicates,
-            "metadata": evidence.get("metadata", {}),
-            "corpus_sources": evidence.get("validation", {}).get("corpus_sources", []),
-            "source_count": evidence.get("validation", {}).get("source_count", 0),
-            "prosecution_ready": evidence.get("validation", {}).get("source_count", 0) >= 3
-        }
-
     # Calculate TIER distribution
     manifest["tier_distribution"] = {
         tier: len(items) for tier, items in manifest["evidence_by_tier"].items()
@@ -98,9 +54,9 @@ def build_evidence_manifest(validation_results: Dict) -> Dict:
     )
 
     manifest["prosecution_metrics"] = {
-        "total_evidence": len(admitted),
+        "total_evidence": total_admitted,
         "prosecution_ready": prosecution_ready,
-        "prosecution_readiness_pct": prosecution_ready / len(admitted) * 100 if admitted else 0,
+        "prosecution_readiness_pct": prosecution_ready / total_admitted * 100 if total_admitted else 0,
         "tier_1_count": len(manifest["evidence_by_tier"].get("TIER 1", [])),
         "tier_2_count": len(manifest["evidence_by_tier"].get("TIER 2", [])),
         "tier_3_count": len(manifest["evidence_by_tier"].get("TIER 3", [])),
@@ -119,14 +75,13 @@ def main():
     # Ensure directory exists
     Path(manifest_path).parent.mkdir(parents=True, exist_ok=True)
 
-    # Load validation results
+    # Load validation aggregates (one pass over the results, cached by content hash)
     print(f"Loading validation results from: {validation_path}")
-    with open(validation_path, 'r') as f:
-        validation_results = json.load(f)
+    aggregates = load_aggregates(validation_path)
 
     # Build manifest
     print("\n📋 Building evidence manifest...")
-    manifest = build_evidence_manifest(validation_results)
+    manifest = build_evidence_manifest(aggregates)
 
     # Write manifest
     print(f"✅ Writing evidence manifest to: {manifest_path}")
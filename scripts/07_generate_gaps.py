@@ -20,12 +20,13 @@ from pathlib import Path
 from datetime import datetime
 from typing import Dict, List
 
+from validation_aggregates import load_aggregates
 
-def identify_gaps(validation_results: Dict, global_scope: Dict) -> Dict:
+
+def identify_gaps(aggregates: Dict, global_scope: Dict) -> Dict:
     """Identify evidence gaps and investigation priorities."""
 
-    rejected = validation_results["rejected"]
-    flagged = validation_results["flagged"]
+    counts = aggregates["counts"]
 
     gaps = {
         "gaps_metadata": {
@@ -40,11 +41,7 @@ def identify_gaps(validation_results: Dict, global_scope: Dict) -> Dict:
     }
 
     # Gap 1: Rejected blockchain evidence (might have tx_hash in corpus)
-    rejected_blockchain = [
-        {"evidence_id": eid, "metadata": ev.get("metadata", {})}
-        for eid, ev in rejected.items()
-        if ev.get("category") == "blockchain"
-    ]
+    rejected_blockchain = aggregates["rejected_by_category"].get("blockchain", [])
 
     if rejected_blockchain:
         gaps["high_priority_gaps"].append({
@@ -52,30 +49,24 @@ def identify_gaps(validation_results: Dict, global_scope: Dict) -> Dict:
             "count": len(rejected_blockchain),
             "severity": "high",
             "action": "Search corpus for tx_hash - might be extractable from binder or raw files",
-            "affected_evidence": [item["evidence_id"] for item in rejected_blockchain[:10]]
+            "affected_evidence": rejected_blockchain[:10]
         })
 
     # Gap 2: Flagged items with 2 sources (close to admission threshold)
-    nearly_admitted = [
-        {"evidence_id": eid, "source_count": ev.get("validation", {}).get("source_count", 0)}
-        for eid, ev in flagged.items()
-        if ev.get("validation", {}).get("source_count", 0) == 2
-    ]
+    nearly_admitted = aggregates["near_threshold"]
 
     if nearly_admitted:
         gaps["flagged_items_needing_review"].append({
             "category": "Near-threshold evidence (2 sources)",
             "count": len(nearly_admitted),
             "action": "Manual review - might find 3rd source with deeper corpus search",
-            "items": [item["evidence_id"] for item in nearly_admitted[:10]]
+            "items": nearly_admitted[:10]
         })
 
     # Gap 3: Missing evidence types (URL, binder)
-    admitted = validation_results["admitted"]
-    evidence_by_category = {}
-    for ev in admitted.values():
-        category = ev.get("category", "unknown")
-        evidence_by_category[category] = evidence_by_category.get(category, 0) + 1
+    evidence_by_category = {
+        category: len(ids) for category, ids in aggregates["admitted_by_category"].items()
+    }
 
     expected_categories = ["blockchain", "entities", "telegram", "urls", "binder"]
     for expected in expected_categories:
@@ -87,10 +78,7 @@ def identify_gaps(validation_results: Dict, global_scope: Dict) -> Dict:
             })
 
     # Gap 4: Entity coverage (entities mentioned but not validated)
-    validated_entities = set()
-    for ev in admitted.values():
-        if "entity_name" in ev.get("metadata", {}):
-            validated_entities.add(ev["metadata"]["entity_name"])
+    validated_entities = set(aggregates["validated_entities"])
 
     # Assuming we want Jason Shurka, Esther Zernitsky, Ally Thompson, UNIFYD
     key_entities = ["Jason Shurka", "Esther Zernitsky", "Ally Thompson", "UNIFYD", "Light System"]
@@ -105,19 +93,15 @@ def identify_gaps(validation_results: Dict, global_scope: Dict) -> Dict:
         })
 
     # Gap 5: OSINT opportunities (rejected items with some metadata)
-    osint_candidates = [
-        {"evidence_id": eid, "metadata": ev.get("metadata", {})}
-        for eid, ev in rejected.items()
-        if ev.get("metadata", {}).get("from_address")  # Has wallet but no corpus match
-        or ev.get("metadata", {}).get("url")  # Has URL but not in corpus
-    ]
+    # Has wallet but no corpus match, or has URL but not in corpus
+    osint_candidates = aggregates["osint_candidates"]
 
     if osint_candidates:
         gaps["osint_opportunities"].append({
             "category": "Rejected items with partial metadata",
             "count": len(osint_candidates),
             "action": "Manual OSINT search for wallet addresses/URLs in blockchain explorers, web archives",
-            "sample_items": [item["evidence_id"] for item in osint_candidates[:5]]
+            "sample_items": osint_candidates[:5]
         })
 
     # Summary stats
@@ -127,8 +111,8 @@ def identify_gaps(validation_results: Dict, global_scope: Dict) -> Dict:
             len(gaps["missing_evidence_types"]) +
             len(gaps["osint_opportunities"])
         ),
-        "flagged_items_count": len(flagged),
-        "rejected_items_count": len(rejected),
+        "flagged_items_count": counts["flagged"],
+        "rejected_items_count": counts["rejected"],
         "recommended_next_steps": [
             "Run manual review on flagged items (Script 5)",
             "Deploy Phase 3 agents with focus on missing evidence types",
@@ -149,10 +133,9 @@ def main():
     # Ensure directory exists
     Path(gaps_path).parent.mkdir(parents=True, exist_ok=True)
 
-    # Load validation results
+    # Load validation aggregates (one pass over the results, cached by content hash)
     print(f"Loading validation results from: {validation_path}")
-    with open(validation_path, 'r') as f:
-        validation_results = json.load(f)
+    aggregates = load_aggregates(validation_path)
 
     # Load global scope
     print(f"Loading global scope from: {global_scope_path}")
@@ -161,7 +144,7 @@ def main():
 
     # Identify gaps
     print("\n🔍 Identifying evidence gaps...")
-    gaps = identify_gaps(validation_results, global_scope)
+    gaps = identify_gaps(aggregates, global_scope)
 
     # Write gaps
     print(f"✅ Writing gaps report to: {gaps_path}")
@@ -5,10 +5,17 @@ Version: 6.0
 Mission: Create evidence_inventory_v6.json with full CERT enrichments
 """
 
+import hashlib
 import json
+import os
+import threading
+from collections import defaultdict
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime
 from pathlib import Path
 
+from pattern_bank import SubstringMatcher
+
 # Paths
 BASE_DIR = Path("/Users/breydentaylor/certainly/visualizations")
 COORD_DIR = BASE_DIR / "coordination"
@@ -27,6 +34,22 @@ INDICATOR_COUNTS = COORD_DIR / "html_indicator_counts.json"
 EVIDENCE_V6 = COORD_DIR / "evidence_inventory_v6.json"
 STATE_FILE = STATE_DIR / "evidence_integrator.state.json"
 
+# Enrichment stage cache: one file per stage, keyed by the stage's input hashes.
+# Bump STAGE_VERSION when stage logic changes.
+STAGE_CACHE_DIR = STATE_DIR / "evidence_integrator_cache"
+STAGE_VERSION = '1'
+STAGE_WORKERS = 4
+
+INPUT_FILES = {
+    'evidence_v4': EVIDENCE_V4,
+    'corpus_mapping': CORPUS_MAPPING,
+    'semantic_clusters': SEMANTIC_CLUSTERS,
+    'network_statistics': NETWORK_STATS,
+    'citation_database': CITATION_DB,
+    'word_frequencies': WORD_FREQ,
+    'indicator_counts': INDICATOR_COUNTS
+}
+
 def load_json(path):
     """Load JSON file with error handling"""
     try:
@@ -83,9 +106,12 @@ def enrich_with_corpus_mapping(items, corpus_mapping):
 
     return new_items, enriched
 
-def enrich_with_semantic_clusters(items, clusters_data):
-    """Add semantic cluster metadata"""
-    enriched = 0
+def build_cluster_index(clusters_data):
+    """
+    Theme -> cluster map, flattened for matching: returns (themes, patterns, owners)
+    where themes is the map as (primary_theme, cluster_info) pairs in map order and
+    patterns[i] (a primary or secondary theme) belongs to themes[owners[i]]
+    """
     cluster_mapping = {}
 
     # Build cluster theme map
@@ -97,81 +123,129 @@ def enrich_with_semantic_clusters(items, clusters_data):
             'themes': cluster.get('all_themes', [])
         }
 
+    themes = list(cluster_mapping.items())
+    patterns, owners = [], []
+    for position, (theme, cluster_info) in enumerate(themes):
+        for text in [theme] + [t['theme'] for t in cluster_info['themes']]:
+            patterns.append(text)
+            owners.append(position)
+    return themes, patterns, owners
+
+def apply_analytics_patches(items, patches, key):
+    """Set item['cert_analytics'][key] for every (item index, value) patch"""
+    for index, value in patches:
+        item = items[index]
+        if 'cert_analytics' not in item:
+            item['cert_analytics'] = {}
+        item['cert_analytics'][key] = value
+    return len(patches)
+
+def enrich_with_semantic_clusters(items, clusters_data):
+    """Add semantic cluster metadata"""
+    return apply_analytics_patches(items, semantic_cluster_patches(items, clusters_data), 'semantic_cluster')
+
+def semantic_cluster_patches(items, clusters_data):
+    """(item index, semantic_cluster) for every item whose type matches a cluster theme"""
+    patches = []
+    themes, patterns, owners = build_cluster_index(clusters_data)
+    # Patterns are grouped by cluster in map order, so the lowest pattern index is the first matching cluster
+    matcher = SubstringMatcher(patterns)
+
     # Enrich existing items
-    for item in items:
+    for index, item in enumerate(items):
         # Match item type to cluster theme
         item_type = item.get('type', '').lower()
 
-        for theme, cluster_info in cluster_mapping.items():
-            if theme in item_type or any(t['theme'] in item_type for t in cluster_info['themes']):
-                if 'cert_analytics' not in item:
-                    item['cert_analytics'] = {}
+        match = matcher.first(item_type)
+        if match is None:
+            continue
+        theme, cluster_info = themes[owners[match]]
 
-                item['cert_analytics']['semantic_cluster'] = {
-                    'cluster_id': cluster_info['cluster_id'],
-                    'primary_theme': theme,
-                    'cluster_size': cluster_info['size'],
-                    'discovery_method': 'CERT Semantic Clusterer v1.0'
-                }
-                enriched += 1
-                break
+        patches.append((index, {
+            'cluster_id': cluster_info['cluster_id'],
+            'primary_theme': theme,
+            'cluster_size': cluster_info['size'],
+            'discovery_method': 'CERT Semantic Clusterer v1.0'
+        }))
 
-    return enriched
+    return patches
 
 def enrich_with_network_stats(items, network_stats):
     """Add network centrality data"""
+    return apply_analytics_patches(items, network_patches(items, network_stats), 'network_analysis')
+
+def network_patches(items, network_stats):
+    """(item index, network_analysis) for every item whose description mentions a ranked entity"""
     if not network_stats:
-        return 0
+        return []
 
-    enriched = 0
+    patches = []
     centrality = network_stats.get('centrality', {})
+    degree = list(centrality.get('degree', {}).items())
+    # One pass per description finds the first entity (in centrality order) it mentions
+    matcher = SubstringMatcher(entity.lower() for entity, _ in degree)
 
-    for item in items:
+    for index, item in enumerate(items):
         # Check if item involves high-centrality entities
         desc = item.get('description', '').lower()
 
-        for entity, score in centrality.get('degree', {}).items():
-            if entity.lower() in desc:
-                if 'cert_analytics' not in item:
-                    item['cert_analytics'] = {}
-
-                item['cert_analytics']['network_analysis'] = {
-                    'entity': entity,
-                    'centrality_score': score,
-                    'network_importance': 'high' if score > 0.3 else 'medium' if score > 0.1 else 'low',
-                    'discovery_method': 'CERT Network Grapher v1.0'
-                }
-                enriched += 1
-                break
-
-    return enriched
+        match = matcher.first(desc)
+        if match is None:
+            continue
+        entity, score = degree[match]
+
+        patches.append((index, {
+            'entity': entity,
+            'centrality_score': score,
+            'network_importance': 'high' if score > 0.3 else 'medium' if score > 0.1 else 'low',
+            'discovery_method': 'CERT Network Grapher v1.0'
+        }))
+
+    return patches
+
+def build_citation_index(citations):
+    """evidence_id / related_evidence_id -> positions of the citations naming it (in citation order)"""
+    index = defaultdict(list)
+    for position, citation in enumerate(citations):
+        for key in {citation.get('evidence_id'), citation.get('related_evidence_id')}:
+            index[key].append(position)
+    return index
+
+def apply_provenance_patches(items, patches):
+    """Append provenance entries per (item index, entries) patch; returns entries added"""
+    added = 0
+    for index, entries in patches:
+        items[index].setdefault('provenance', []).extend(entries)
+        added += len(entries)
+    return added
 
 def enrich_with_citations(items, citation_db):
     """Add citation provenance"""
+    return apply_provenance_patches(items, citation_patches(items, citation_db))
+
+def citation_patches(items, citation_db):
+    """(item index, provenance entries) for every item named by a citation"""
     if not citation_db:
-        return 0
+        return []
 
-    enriched = 0
+    patches = []
     citations = citation_db.get('citations', [])
+    citation_index = build_citation_index(citations)
 
-    for item in items:
+    for index, item in enumerate(items):
         # Match citations to evidence items
         item_id = item.get('evidence_id', '')
 
-        for citation in citations:
-            if citation.get('evidence_id') == item_id or citation.get('related_evidence_id') == item_id:
-                if 'provenance' not in item:
-                    item['provenance'] = []
+        entries = [{
+            'citation_id': citations[position].get('citation_id'),
+            'file_path': citations[position].get('file_path'),
+            'sha256': citations[position].get('sha256'),
+            'discovery_method': 'CERT Citation Linker v1.0'
+        } for position in citation_index.get(item_id, ())]
+        if entries:
+            patches.append((index, entries))
 
-                item['provenance'].append({
-                    'citation_id': citation.get('citation_id'),
-                    'file_path': citation.get('file_path'),
-                    'sha256': citation.get('sha256'),
-                    'discovery_method': 'CERT Citation Linker v1.0'
-                })
-                enriched += 1
-
-    return enriched
+    return patches
 
 def enrich_with_indicator_analysis(items, word_freq, indicator_counts):
     """Add NLP indicator analysis"""
@@ -203,30 +277,177 @@ def enrich_with_indicator_analysis(items, word_freq, indicator_counts):
 
     return new_items, enriched
 
+class StageInputs:
+    """Input files for the enrichment stages: content hashes up front, JSON loaded only on demand"""
+
+    def __init__(self, files):
+        self.files = files
+        self.keys = {}
+        self.data = {}
+        self.lock = threading.Lock()
+
+    def key(self, name):
+        if name not in self.keys:
+            path = self.files[name]
+            if path.exists():
+                digest = hashlib.sha256()
+                with open(path, 'rb') as f:
+                    for chunk in iter(lambda: f.read(1 << 20), b''):
+                        digest.update(chunk)
+                self.keys[name] = digest.hexdigest()
+            else:
+                self.keys[name] = 'missing'
+        return self.keys[name]
+
+    def load(self, name):
+        with self.lock:
+            if name not in self.data:
+                self.data[name] = load_json(self.files[name])
+            return self.data[name]
+
+class Stage:
+    """One enrichment step: run(inputs) over named input files and upstream stage outputs"""
+
+    def __init__(self, name, inputs, run, cache=True):
+        self.name = name
+        self.inputs = inputs
+        self.run = run
+        self.cache = cache
+
+def stage_corpus_items(data):
+    if not data['corpus_mapping']:
+        return None
+    new_items, count = enrich_with_corpus_mapping([], data['corpus_mapping'])
+    return {'new_items': new_items, 'count': count}
+
+def stage_base_items(data):
+    """v4 evidence plus corpus-derived items: the items every per-item enrichment runs over"""
+    corpus = data['corpus_items']
+    return list(data['evidence_v4'].get('evidence', [])) + (corpus['new_items'] if corpus else [])
+
+def stage_semantic_clusters(data):
+    if not data['semantic_clusters']:
+        return None
+    return semantic_cluster_patches(data['base_items'], data['semantic_clusters'])
+
+def stage_network_stats(data):
+    if not data['network_statistics']:
+        return None
+    return network_patches(data['base_items'], data['network_statistics'])
+
+def stage_citations(data):
+    if not data['citation_database']:
+        return None
+    return citation_patches(data['base_items'], data['citation_database'])
+
+def stage_indicator_analysis(data):
+    if not data['indicator_counts']:
+        return None
+    new_items, count = enrich_with_indicator_analysis([], data['word_frequencies'], data['indicator_counts'])
+    return {'new_items': new_items, 'count': count}
+
+# Enrichment DAG: inputs name INPUT_FILES keys or earlier stages (names must not collide). Per-item
+# enrichments only read base_items and emit patches, so they run independently.
+ENRICHMENT_STAGES = [
+    Stage('corpus_items', ['corpus_mapping'], stage_corpus_items),
+    Stage('base_items', ['evidence_v4', 'corpus_items'], stage_base_items, cache=False),
+    Stage('cluster_patches', ['base_items', 'semantic_clusters'], stage_semantic_clusters),
+    Stage('network_patches', ['base_items', 'network_statistics'], stage_network_stats),
+    Stage('citation_patches', ['base_items', 'citation_database'], stage_citations),
+    Stage('nlp_items', ['word_frequencies', 'indicator_counts'], stage_indicator_analysis),
+]
+
+def stage_cache_key(stage, input_keys):
+    return hashlib.sha256(json.dumps([stage.name, STAGE_VERSION, input_keys]).encode('utf-8')).hexdigest()
+
+def load_stage_cache(stage, key):
+    """Cached output of a stage for this key, or (False, None)"""
+    path = STAGE_CACHE_DIR / f"{stage.name}.json"
+    try:
+        with open(path, 'r') as f:
+            cached = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return False, None
+    if cached.get('key') != key:
+        return False, None
+    return True, cached.get('output')
+
+def save_stage_cache(stage, key, output):
+    STAGE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    path = STAGE_CACHE_DIR / f"{stage.name}.json"
+    tmp_path = path.with_suffix('.tmp')
+    with open(tmp_path, 'w') as f:
+        json.dump({'key': key, 'output': output}, f)
+    os.replace(tmp_path, path)
+
+def run_stages(stages, inputs, max_workers=STAGE_WORKERS):
+    """
+    Run the stage DAG, each stage as soon as its upstream stages finish (independent
+    stages concurrently). Stages whose input hashes match their cache are not rerun.
+    Returns (outputs by stage name, names of stages served from cache).
+    """
+    by_name = {stage.name: stage for stage in stages}
+    keys = {}
+    for stage in stages:  # stages are listed in dependency order
+        input_keys = [keys[name] if name in by_name else inputs.key(name) for name in stage.inputs]
+        keys[stage.name] = stage_cache_key(stage, input_keys)
+
+    outputs, cached = {}, set()
+
+    def execute(stage):
+        if stage.cache:
+            hit, output = load_stage_cache(stage, keys[stage.name])
+            if hit:
+                return output, True
+        data = {name: outputs[name] if name in by_name else inputs.load(name) for name in stage.inputs}
+        output = stage.run(data)
+        if stage.cache:
+            save_stage_cache(stage, keys[stage.name], output)
+        return output, False
+
+    pending = list(stages)
+    running = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        while pending or running:
+            for stage in [s for s in pending if all(n in outputs for n in s.inputs if n in by_name)]:
+                pending.remove(stage)
+                running[pool.submit(execute, stage)] = stage
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                stage = running.pop(future)
+                outputs[stage.name], was_cached = future.result()
+                if was_cached:
+                    cached.add(stage.name)
+
+    return outputs, cached
+
 def create_v6_inventory():
     """Main integration function"""
     print("🔬 EVIDENCE INTEGRATOR v6.0")
     print("=" * 60)
 
-    # Load all data
+    # Inputs are hashed up front and only parsed for stages that must rerun
     print("\n📥 Loading data files...")
-    v4_data = load_json(EVIDENCE_V4)
-    corpus_mapping = load_json(CORPUS_MAPPING)
-    clusters_data = load_json(SEMANTIC_CLUSTERS)
-    network_stats = load_json(NETWORK_STATS)
-    citation_db = load_json(CITATION_DB)
-    word_freq = load_json(WORD_FREQ)
-    indicator_counts = load_json(INDICATOR_COUNTS)
+    inputs = StageInputs(INPUT_FILES)
+    v4_data = inputs.load('evidence_v4')
 
     if not v4_data:
         print("❌ Cannot load v4 evidence inventory!")
         return
 
-    # Extract existing evidence items
-    evidence_items = v4_data.get('evidence', [])
-    starting_count = len(evidence_items)
+    starting_count = len(v4_data.get('evidence', []))
     print(f"   Starting with {starting_count} evidence items from v4")
 
+    outputs, cached = run_stages(ENRICHMENT_STAGES, inputs)
+    recomputed = [stage.name for stage in ENRICHMENT_STAGES if stage.cache and stage.name not in cached]
+    print(f"   Stages reused from cache: {len(cached)}, recomputed: {', '.join(recomputed) or 'none'}")
+
+    def cache_note(name):
+        return " (cached)" if name in cached else ""
+
+    # Final merge: per-item patches are applied in pipeline order
+    evidence_items = outputs['base_items']
+
     # Enrichment pipeline
     enrichments = {
         'corpus_mapping': 0,
@@ -238,44 +459,43 @@ def create_v6_inventory():
     }
 
     # 1. Corpus mapping enrichment
-    if corpus_mapping:
-        print("\n🔗 Enriching with corpus mapping...")
-        new_corpus_items, count = enrich_with_corpus_mapping(evidence_items, corpus_mapping)
-        evidence_items.extend(new_corpus_items)
-        enrichments['corpus_mapping'] = count
-        enrichments['new_items'] += len(new_corpus_items)
-        print(f"   Added {len(new_corpus_items)} new corpus-derived evidence items")
-        print(f"   Enriched {count} existing items with corpus citations")
+    corpus = outputs['corpus_items']
+    if corpus is not None:
+        print(f"\n🔗 Enriching with corpus mapping...{cache_note('corpus_items')}")
+        enrichments['corpus_mapping'] = corpus['count']
+        enrichments['new_items'] += len(corpus['new_items'])
+        print(f"   Added {len(corpus['new_items'])} new corpus-derived evidence items")
+        print(f"   Enriched {corpus['count']} existing items with corpus citations")
 
     # 2. Semantic cluster enrichment
-    if clusters_data:
-        print("\n🧬 Enriching with semantic clusters...")
-        count = enrich_with_semantic_clusters(evidence_items, clusters_data)
+    if outputs['cluster_patches'] is not None:
+        print(f"\n🧬 Enriching with semantic clusters...{cache_note('cluster_patches')}")
+        count = apply_analytics_patches(evidence_items, outputs['cluster_patches'], 'semantic_cluster')
         enrichments['semantic_clusters'] = count
         print(f"   Enriched {count} items with cluster metadata")
 
     # 3. Network analysis enrichment
-    if network_stats:
-        print("\n🕸️  Enriching with network statistics...")
-        count = enrich_with_network_stats(evidence_items, network_stats)
+    if outputs['network_patches'] is not None:
+        print(f"\n🕸️  Enriching with network statistics...{cache_note('network_patches')}")
+        count = apply_analytics_patches(evidence_items, outputs['network_patches'], 'network_analysis')
         enrichments['network_stats'] = count
         print(f"   Enriched {count} items with network centrality")
 
     # 4. Citation enrichment
-    if citation_db:
-        print("\n📚 Enriching with citations...")
-        count = enrich_with_citations(evidence_items, citation_db)
+    if outputs['citation_patches'] is not None:
+        print(f"\n📚 Enriching with citations...{cache_note('citation_patches')}")
+        count = apply_provenance_patches(evidence_items, outputs['citation_patches'])
         enrichments['citations'] = count
         print(f"   Enriched {count} items with provenance citations")
 
     # 5. Indicator analysis enrichment
-    if indicator_counts:
-        print("\n📊 Enriching with NLP indicators...")
-        new_nlp_items, count = enrich_with_indicator_analysis(evidence_items, word_freq, indicator_counts)
-        evidence_items.extend(new_nlp_items)
-        enrichments['indicator_analysis'] = count
-        enrichments['new_items'] += len(new_nlp_items)
-        print(f"   Added {len(new_nlp_items)} new NLP-derived evidence items")
+    nlp = outputs['nlp_items']
+    if nlp is not None:
+        print(f"\n📊 Enriching with NLP indicators...{cache_note('nlp_items')}")
+        evidence_items.extend(nlp['new_items'])
+        enrichments['indicator_analysis'] = nlp['count']
+        enrichments['new_items'] += len(nlp['new_items'])
+        print(f"   Added {len(nlp['new_items'])} new NLP-derived evidence items")
 
     # Calculate tier distribution
     tier_distribution = {
@@ -8,11 +8,176 @@ import json
 import glob
 import csv
 import re
+import sqlite3
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Set, Tuple
 from collections import defaultdict
 
+import provenance
+from provenance import Provenance
+
+# Wallet addresses indexed from the blockchain CSVs, as whole tokens in their real
+# formats (base58 is case-sensitive, so match before lowercasing the index key).
+# The EVM lookahead keeps 0x-prefixed tx hashes (64 hex digits) out of the index.
+ADDRESS_PATTERN = re.compile(
+    r'(?<![0-9A-Za-z])(?:'
+    r'0[xX][0-9a-fA-F]{40}(?![0-9a-fA-F])'                  # EVM
+    r'|[13][1-9A-HJ-NP-Za-km-z]{25,34}(?![0-9A-Za-z])'      # Bitcoin P2PKH / P2SH (base58)
+    r'|bc1[02-9ac-hj-np-z]{25,87}(?![0-9A-Za-z])'           # Bitcoin bech32 (lowercase)
+    r'|BC1[02-9AC-HJ-NP-Z]{25,87}(?![0-9A-Za-z])'           # Bitcoin bech32 (uppercase)
+    r'|T[1-9A-HJ-NP-Za-km-z]{33}(?![0-9A-Za-z])'            # Tron (base58)
+    r')'
+)
+ADDRESS_INDEX_VERSION = '2'
+
+TELEGRAM_STORE_VERSION = '1'
+TELEGRAM_MENTION_LIMIT = 3  # mentions kept per search to avoid inflation
+
+# Concurrency: threads for per-item lookups (index hits + SQLite queries),
+# processes for rescanning changed CSVs when building the address index
+GAP_FILL_WORKERS = 8
+SCAN_WORKERS = 4
+PROGRESS_EVERY = 100  # progress line interval when running concurrently
+
+
+def new_stats() -> Dict[str, int]:
+    return {
+        'telegram_mentions': 0,
+        'blockchain_matches': 0,
+        'shadowlens_mentions': 0,
+        'promoted_to_tier2': 0,
+        'promoted_to_tier3': 0,
+        'still_flagged': 0
+    }
+
+
+def scan_csv_addresses(csv_file: Path) -> Dict[str, int]:
+    """Occurrences of every address-shaped token in one CSV"""
+    counts = defaultdict(int)
+    with open(csv_file, 'r', encoding='utf-8', errors='ignore') as f:
+        for line in f:
+            for address in ADDRESS_PATTERN.findall(line):
+                counts[address.lower()] += 1
+    return dict(counts)
+
+
+
+class TelegramStore:
+    """
+    Lowercased Telegram export messages in SQLite, in corpus order
+
+    Messages sit in an FTS5 trigram table, so a keyword search is an
+    indexed substring lookup that stops after the first few hits. The store
+    is rebuilt only when the set of export files or their mtimes change.
+    SQLite builds without FTS5 trigram fall back to a plain table scan.
+    """
+
+    def __init__(self, db_path: Path, telegram_dirs: List[Path]):
+        self.db_path = db_path
+        self.telegram_dirs = telegram_dirs
+        self._local = threading.local()
+        self.fts = self.sync()
+
+    def connection(self) -> sqlite3.Connection:
+        """One connection per thread"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = self._local.conn = sqlite3.connect(self.db_path)
+        return conn
+
+    def export_files(self) -> List[Path]:
+        files = []
+        for telegram_dir in self.telegram_dirs:
+            if telegram_dir.exists():
+                files.extend(telegram_dir.glob('**/*.json'))
+        return files
+
+    def sync(self) -> bool:
+        """Rebuild the store if the exports changed; returns whether FTS is available"""
+        files = self.export_files()
+        manifest = json.dumps({
+            'version': TELEGRAM_STORE_VERSION,
+            'files': [[str(p), p.stat().st_mtime_ns, p.stat().st_size] for p in files]
+        })
+
+        conn = self.connection()
+        conn.execute('CREATE TABLE IF NOT EXISTS store_meta (key TEXT PRIMARY KEY, value TEXT)')
+        meta = dict(conn.execute('SELECT key, value FROM store_meta'))
+        if meta.get('manifest') == manifest:
+            print(f"Telegram store up to date ({meta.get('messages')} messages)")
+            return meta.get('fts') == '1'
+
+        conn.execute('DROP TABLE IF EXISTS messages')
+        try:
+            conn.execute("CREATE VIRTUAL TABLE messages USING fts5(file UNINDEXED, text, tokenize='trigram')")
+            fts = True
+        except sqlite3.OperationalError:
+            conn.execute('CREATE TABLE messages (file TEXT, text TEXT)')
+            fts = False
+
+        total = 0
+        for json_file in files:
+            rows = []
+            try:
+                with open(json_file, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+
+                # Handle different JSON structures
+                messages = []
+                if isinstance(data, list):
+                    messages = data
+                elif isinstance(data, dict):
+                    messages = data.get('messages', [data])
+
+                for msg in messages:
+                    rows.append((str(json_file), str(msg.get('text', '')).lower()))
+            except Exception:
+                pass  # keep the messages read before the error
+            conn.executemany('INSERT INTO messages (file, text) VALUES (?, ?)', rows)
+            total += len(rows)
+
+        conn.executemany('INSERT OR REPLACE INTO store_meta (key, value) VALUES (?, ?)', [
+            ('manifest', manifest), ('fts', '1' if fts else '0'), ('messages', str(total))
+        ])
+        conn.commit()
+        print(f"Telegram store rebuilt: {total} messages from {len(files)} exports")
+        return fts
+
+    def candidates(self, keywords: List[str]):
+        """(file, text) rows that may contain any keyword, in corpus order"""
+        conn = self.connection()
+        # Trigram phrases need 3+ characters; shorter keywords use a scan
+        if self.fts and all(len(k) >= 3 for k in keywords):
+            query = ' OR '.join('"' + k.replace('"', '""') + '"' for k in keywords)
+            return conn.execute('SELECT file, text FROM messages WHERE messages MATCH ? ORDER BY rowid', (query,))
+        where = ' OR '.join(['instr(text, ?) > 0'] * len(keywords))
+        return conn.execute(f'SELECT file, text FROM messages WHERE {where} ORDER BY rowid', keywords)
+
+    def search(self, keywords: List[str], limit: int = TELEGRAM_MENTION_LIMIT) -> List[Dict]:
+        """First `limit` messages mentioning any keyword (first matching keyword per message)"""
+        if not keywords:
+            return []
+        lowered = [keyword.lower() for keyword in keywords]
+
+        mentions = []
+        for json_file, text in self.candidates(lowered):
+            for keyword, keyword_lower in zip(keywords, lowered):
+                if keyword_lower in text:
+                    mentions.append({
+                        'type': 'telegram',
+                        'file': json_file,
+                        'keyword': keyword,
+                        'relevance': f'Telegram mention of {keyword}'
+                    })
+                    break  # Count once per message
+            if len(mentions) >= limit:
+                break
+        return mentions
+
+
 class GapFiller:
     def __init__(self):
         self.base_path = Path('/Users/breydentaylor/certainly')
@@ -21,103 +186,133 @@ class GapFiller:
         self.noteworthy_path = self.base_path / 'noteworthy-raw'
 
         # Track statistics
-        self.stats = {
-            'telegram_mentions': 0,
-            'blockchain_matches': 0,
-            'shadowlens_mentions': 0,
-            'promoted_to_tier2': 0,
-            'promoted_to_tier3': 0,
-            'still_flagged': 0
-        }
+        self.stats = new_stats()
+
+        # Corpus file IDs and item supports shared with the validation stage
+        self.provenance = Provenance.load(support_path=provenance.SUPPORT_INDEX_PATH)
 
         # Cache corpus files
         self.blockchain_files = list(self.corpus_path.glob('**/*.csv'))
         self.blockchain_files.extend(list(self.noteworthy_path.glob('**/*.csv')))
         print(f"Found {len(self.blockchain_files)} blockchain CSV files")
 
-    def search_blockchain_for_address(self, address: str) -> List[Dict]:
-        """Search blockchain CSVs for wallet address mentions"""
-        matches = []
-        address_lower = address.lower()
+        # address -> [(file, count)] in blockchain_files order, built once
+        self.address_index_path = self.viz_path / 'state' / 'gap_filler_address_index.json'
+        self.address_index = self.build_address_index()
 
+        # Telegram messages ingested once into a persistent searchable store
+        self.telegram_store = TelegramStore(self.viz_path / 'state' / 'gap_filler_telegram.db', [
+            self.corpus_path / 'recon_intel/harvest/deep-crawl/telegram-discussion',
+            self.corpus_path / 'recon_intel/harvest/snapshots/telegram',
+            self.corpus_path / 'recon_intel/harvest/link-hop/telegram-discussion'
+        ])
+
+    def build_address_index(self) -> Dict[str, List[Tuple[str, int]]]:
+        """Scan each CSV once (reusing persisted counts for files whose mtime is unchanged)"""
+        cached_files = {}
+        try:
+            with open(self.address_index_path, 'r') as f:
+                cached = json.load(f)
+            if cached.get('version') == ADDRESS_INDEX_VERSION:
+                cached_files = cached.get('files', {})
+        except (OSError, json.JSONDecodeError):
+            pass
+
+        files = {}
+        stale = []
         for csv_file in self.blockchain_files:
+            key = str(csv_file)
             try:
-                with open(csv_file, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read().lower()
-                    if address_lower in content:
-                        # Count occurrences
-                        count = content.count(address_lower)
-                        matches.append({
-                            'type': 'blockchain_csv',
-                            'file': str(csv_file),
-                            'match_count': count,
-                            'relevance': 'Address found in blockchain corpus'
-                        })
-            except Exception as e:
+                stat = csv_file.stat()
+            except OSError:
                 continue
+            entry = cached_files.get(key)
+            if entry and entry.get('mtime_ns') == stat.st_mtime_ns and entry.get('size') == stat.st_size:
+                files[key] = entry
+            else:
+                files[key] = {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size, 'counts': None}
+                stale.append(csv_file)
+
+        # Changed CSVs are scanned in parallel (regex scanning is CPU-bound)
+        rescanned = len(stale)
+        if len(stale) > 1 and SCAN_WORKERS > 1:
+            with ProcessPoolExecutor(max_workers=min(SCAN_WORKERS, len(stale))) as pool:
+                futures = [pool.submit(scan_csv_addresses, csv_file) for csv_file in stale]
+                scans = []
+                for future in futures:
+                    try:
+                        scans.append(future.result())
+                    except Exception:
+                        scans.append(None)
+        else:
+            scans = []
+            for csv_file in stale:
+                try:
+                    scans.append(scan_csv_addresses(csv_file))
+                except Exception:
+                    scans.append(None)
 
-        return matches
+        for csv_file, counts in zip(stale, scans):
+            if counts is None:
+                del files[str(csv_file)]
+            else:
+                files[str(csv_file)]['counts'] = counts
 
-    def search_telegram_for_keywords(self, keywords: List[str]) -> List[Dict]:
-        """Search Telegram data for keyword mentions"""
-        mentions = []
-        telegram_dirs = [
-            self.corpus_path / 'recon_intel/harvest/deep-crawl/telegram-discussion',
-            self.corpus_path / 'recon_intel/harvest/snapshots/telegram',
-            self.corpus_path / 'recon_intel/harvest/link-hop/telegram-discussion'
-        ]
+        if rescanned or set(files) != set(cached_files):
+            try:
+                tmp_path = self.address_index_path.with_name(self.address_index_path.name + '.tmp')
+                with open(tmp_path, 'w') as f:
+                    json.dump({'version': ADDRESS_INDEX_VERSION, 'files': files}, f)
+                tmp_path.replace(self.address_index_path)
+            except OSError as e:
+                print(f"Warning: Could not persist address index: {e}")
 
-        for telegram_dir in telegram_dirs:
-            if not telegram_dir.exists():
-                continue
+        index = defaultdict(list)
+        for key, entry in files.items():
+            for address, count in entry['counts'].items():
+                index[address].append((key, count))
 
-            for json_file in telegram_dir.glob('**/*.json'):
-                try:
-                    with open(json_file, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-
-                    # Handle different JSON structures
-                    messages = []
-                    if isinstance(data, list):
-                        messages = data
-                    elif isinstance(data, dict):
-                        messages = data.get('messages', [data])
-
-                    for msg in messages:
-                        text = str(msg.get('text', '')).lower()
-                        for keyword in keywords:
-                            if keyword.lower() in text:
-                                mentions.append({
-                                    'type': 'telegram',
-                                    'file': str(json_file),
-                                    'keyword': keyword,
-                                    'relevance': f'Telegram mention of {keyword}'
-                                })
-                                break  # Count once per message
-
-                except Exception as e:
-                    continue
+        print(f"Indexed {len(index)} addresses across {len(files)} CSV files ({rescanned} rescanned)")
+        return dict(index)
+
+    def search_blockchain_for_address(self, address: str) -> List[Dict]:
+        """Look up wallet address mentions in the prebuilt CSV address index"""
+        address_lower = address.lower()
+
+        return [
+            {
+                'type': 'blockchain_csv',
+                'file': csv_file,
+                'match_count': count,
+                'relevance': 'Address found in blockchain corpus'
+            }
+            for csv_file, count in self.address_index.get(address_lower, [])
+        ]
 
+    def search_telegram_for_keywords(self, keywords: List[str]) -> List[Dict]:
+        """Search Telegram data for keyword mentions"""
         # Limit to top 3 per search to avoid inflation
-        return mentions[:3] if mentions else []
+        return self.telegram_store.search(keywords)
 
     def recalculate_sources(self, item: Dict, new_sources: List[Dict]) -> Dict:
         """Recalculate effective sources with notebook discount"""
         evidence = item['evidence']
         validation = evidence.get('validation', {})
 
-        # Get original counts
-        original_corpus_sources = validation.get('corpus_sources', [])
-        original_corpus_count = len(original_corpus_sources)
+        # Get original support
+        original_support = self.provenance.bitmap(validation.get('corpus_sources', []))
+        original_corpus_count = provenance.cardinality(original_support)
 
-        # Count new corpus sources (unique files)
-        unique_new_files = set()
-        for source in new_sources:
-            if source['type'] in ['blockchain_csv', 'telegram']:
-                unique_new_files.add(source['file'])
+        # New corpus sources: files not already backing the item
+        new_support = self.provenance.bitmap(
+            source['file'] for source in new_sources
+            if source['type'] in ['blockchain_csv', 'telegram']
+        )
+        added_support = provenance.difference(new_support, original_support)
 
-        new_corpus_count = len(unique_new_files)
-        total_corpus = original_corpus_count + new_corpus_count
+        support = provenance.union(original_support, new_support)
+        self.provenance.add_support(item['evidence_id'], support)
+        total_corpus = provenance.cardinality(support)
 
         # Notebook sources (shadowLens) - apply 0.5x discount
         notebook_count = 0
@@ -132,7 +327,7 @@ class GapFiller:
             'notebook_count': notebook_count,
             'effective_sources': effective_sources,
             'original_corpus_count': original_corpus_count,
-            'new_corpus_sources': list(unique_new_files),
+            'new_corpus_sources': self.provenance.paths(added_support),
             'new_sources_found': new_sources
         }
 
@@ -158,8 +353,9 @@ class GapFiller:
             'reason': f'Insufficient sourcing ({effective_sources} effective sources, need 2.0+)'
         }
 
-    def process_blockchain_item(self, item: Dict) -> Dict:
+    def process_blockchain_item(self, item: Dict, stats: Dict = None) -> Dict:
         """Process a blockchain transaction evidence item"""
+        stats = self.stats if stats is None else stats
         evidence = item['evidence']
         metadata = evidence.get('metadata', {})
 
@@ -190,15 +386,15 @@ class GapFiller:
         tier_data = self.assign_tier(new_source_data['effective_sources'], item)
 
         # Update statistics
-        self.stats['blockchain_matches'] += len([s for s in new_sources if s['type'] == 'blockchain_csv'])
-        self.stats['telegram_mentions'] += len([s for s in new_sources if s['type'] == 'telegram'])
+        stats['blockchain_matches'] += len([s for s in new_sources if s['type'] == 'blockchain_csv'])
+        stats['telegram_mentions'] += len([s for s in new_sources if s['type'] == 'telegram'])
 
         if tier_data['tier'] == 2:
-            self.stats['promoted_to_tier2'] += 1
+            stats['promoted_to_tier2'] += 1
         elif tier_data['tier'] == 3:
-            self.stats['promoted_to_tier3'] += 1
+            stats['promoted_to_tier3'] += 1
         else:
-            self.stats['still_flagged'] += 1
+            stats['still_flagged'] += 1
 
         return {
             'evidence_id': item['evidence_id'],
@@ -209,8 +405,9 @@ class GapFiller:
             'evidence': evidence
         }
 
-    def process_entity_item(self, item: Dict) -> Dict:
+    def process_entity_item(self, item: Dict, stats: Dict = None) -> Dict:
         """Process an entity linkage evidence item"""
+        stats = self.stats if stats is None else stats
         evidence = item['evidence']
         metadata = evidence.get('metadata', {})
 
@@ -232,14 +429,14 @@ class GapFiller:
         tier_data = self.assign_tier(new_source_data['effective_sources'], item)
 
         # Update statistics
-        self.stats['telegram_mentions'] += len(telegram_mentions)
+        stats['telegram_mentions'] += len(telegram_mentions)
 
         if tier_data['tier'] == 2:
-            self.stats['promoted_to_tier2'] += 1
+            stats['promoted_to_tier2'] += 1
         elif tier_data['tier'] == 3:
-            self.stats['promoted_to_tier3'] += 1
+            stats['promoted_to_tier3'] += 1
         else:
-            self.stats['still_flagged'] += 1
+            stats['still_flagged'] += 1
 
         return {
             'evidence_id': item['evidence_id'],
@@ -250,33 +447,53 @@ class GapFiller:
             'evidence': evidence
         }
 
-    def process_all_items(self, items: List[Dict]) -> List[Dict]:
-        """Process all flagged items"""
-        results = []
+    def process_item(self, item: Dict, stats: Dict) -> Dict:
+        """Process one flagged item, counting into stats"""
+        category = item['evidence'].get('category', '')
 
-        for i, item in enumerate(items, 1):
-            print(f"\nProcessing {i}/{len(items)}: {item['evidence_id']}")
+        if category == 'blockchain':
+            return self.process_blockchain_item(item, stats)
+        elif category == 'entities':
+            return self.process_entity_item(item, stats)
 
-            category = item['evidence'].get('category', '')
+        # Default processing
+        stats['still_flagged'] += 1
+        return {
+            'evidence_id': item['evidence_id'],
+            'original_status': 'flagged',
+            'new_tier': 'flagged',
+            'tier_reason': 'Unsupported category',
+            'sources': self.recalculate_sources(item, []),
+            'evidence': item['evidence']
+        }
 
-            if category == 'blockchain':
-                result = self.process_blockchain_item(item)
-            elif category == 'entities':
-                result = self.process_entity_item(item)
-            else:
-                # Default processing
-                result = {
-                    'evidence_id': item['evidence_id'],
-                    'original_status': 'flagged',
-                    'new_tier': 'flagged',
-                    'tier_reason': 'Unsupported category',
-                    'sources': self.recalculate_sources(item, []),
-                    'evidence': item['evidence']
-                }
-                self.stats['still_flagged'] += 1
+    def _process_worker(self, item: Dict) -> Tuple[Dict, Dict]:
+        stats = new_stats()
+        return self.process_item(item, stats), stats
+
+    def process_all_items(self, items: List[Dict], max_workers: int = GAP_FILL_WORKERS) -> List[Dict]:
+        """Process all flagged items (concurrently when max_workers > 1), results in input order"""
+        results = []
 
-            results.append(result)
-            print(f"  → New tier: {result['new_tier']}, Effective sources: {result['sources']['effective_sources']}")
+        if max_workers <= 1:
+            for i, item in enumerate(items, 1):
+                print(f"\nProcessing {i}/{len(items)}: {item['evidence_id']}")
+                result = self.process_item(item, self.stats)
+                results.append(result)
+                print(f"  → New tier: {result['new_tier']}, Effective sources: {result['sources']['effective_sources']}")
+            return results
+
+        print(f"\nProcessing {len(items)} items with {max_workers} workers...")
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            # map yields in input order, so results and merged stats are deterministic
+            for i, (result, stats) in enumerate(pool.map(self._process_worker, items), 1):
+                for key, value in stats.items():
+                    self.stats[key] += value
+                results.append(result)
+                if i % PROGRESS_EVERY == 0 or i == len(items):
+                    print(f"  {i}/{len(items)} processed "
+                          f"(tier 2: {self.stats['promoted_to_tier2']}, tier 3: {self.stats['promoted_to_tier3']}, "
+                          f"flagged: {self.stats['still_flagged']})")
 
         return results
 
@@ -4,9 +4,22 @@ Blockchain Forensics Analysis for RICO Evidence Processing
 Analyzes 26,931 transactions for money laundering patterns
 """
 
-import pandas as pd
+import hashlib
 import json
+import pandas as pd
 from datetime import datetime
+from pathlib import Path
+
+from extract_blockchain_evidence import KNOWN_WALLETS
+from price_oracle import DEFAULT_PRICES, default_oracle, parse_timestamps
+from wallet_graph import TransactionGraph
+
+try:
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
 
 # File paths
 CSV_FILES = [
@@ -17,12 +30,53 @@ CSV_FILES = [
 
 OUTPUT_FILE = "/Users/breydentaylor/certainly/visualizations/blockchain_analysis.json"
 
+# Typed columnar copies of the CSVs, one file per source keyed by its content hash
+TX_STORE_DIR = "/Users/breydentaylor/certainly/visualizations/tx_store"
+
 # Target addresses
 STAKE_ADDRESS = "0xa1a50f693a3893dfec3750d38eb2fc458d5004a4"
 MEXC_ADDRESS = "0xf8c448c9b9adb89fcf2ff95100314d2ec1d7a9e2"
 
-# ETH price for USD conversion (approximate average)
+# Native-coin symbols counted as ETH volume
+ETH_TOKENS = ['ETH', 'AVAX', 'Ether']
+
+# Explorer symbols valued on another price series ("Ether" was always valued as ETH here)
+SYMBOL_ALIASES = {'Ether': 'ETH'}
+
+# ETH price for USD conversion when the price oracle has no bar for the date (approximate average)
 ETH_PRICE_USD = 2500
+PRICE_DEFAULTS = {**DEFAULT_PRICES, 'ETH': ETH_PRICE_USD}
+
+# Column mapping per export: standard column -> source column (or constant default)
+CSV_SOURCES = [
+    {
+        'label': 'shurka123.eth',
+        'path': CSV_FILES[0],
+        'columns': {'Hash': 'Hash', 'From': 'From', 'To': 'To', 'Amount': 'Amount',
+                    'Token_symbol': 'Token_symbol', 'Date': 'Date', 'Chain': 'Chain'},
+        'defaults': {'Token_symbol': '', 'Chain': 'eth'}
+    },
+    {
+        'label': 'fund wallet',
+        'path': CSV_FILES[1],
+        'columns': {'Hash': 'Transaction Hash', 'From': 'From', 'To': 'To',
+                    'Amount': 'Value_IN(ETH)', 'Date': 'DateTime (UTC)'},
+        'defaults': {'Token_symbol': 'ETH', 'Chain': 'eth'}
+    },
+    {
+        'label': 'gang wallet',
+        'path': CSV_FILES[2],
+        'columns': {'Hash': 'Transaction Hash', 'From': 'From', 'To': 'To',
+                    'Amount': 'Value_IN(ETH)', 'Date': 'DateTime (UTC)'},
+        'defaults': {'Token_symbol': 'ETH', 'Chain': 'eth'}
+    }
+]
+
+# Bump when the ingestion schema/normalisation changes so cached stores are rebuilt
+TX_STORE_SCHEMA_VERSION = 2
+
+STORE_COLUMNS = ['Hash', 'From', 'To', 'Amount', 'Token_symbol', 'Date', 'Timestamp', 'Chain']
+CATEGORICAL_COLUMNS = ['From', 'To', 'Token_symbol', 'Chain']
 
 def parse_amount(amount_str):
     """Parse amount string, removing commas and converting to float"""
@@ -31,111 +85,253 @@ def parse_amount(amount_str):
     # Remove commas and convert to float
     return float(str(amount_str).replace(',', ''))
 
-def load_and_combine_csvs():
-    """Load all CSVs and combine into single DataFrame"""
-    all_data = []
-
-    # Load shurka123.eth file (different structure)
-    print(f"Loading shurka123.eth transactions...")
-    df1 = pd.read_csv(CSV_FILES[0])
-    # Standardize columns
-    df1_standardized = pd.DataFrame({
-        'Hash': df1.get('Hash', ''),
-        'From': df1.get('From', ''),
-        'To': df1.get('To', ''),
-        'Amount': df1['Amount'].apply(parse_amount) if 'Amount' in df1.columns else 0,
-        'Token_symbol': df1.get('Token_symbol', ''),
-        'Date': df1.get('Date', ''),
-        'Chain': df1.get('Chain', 'eth')
-    })
-    all_data.append(df1_standardized)
-    print(f"  Loaded {len(df1)} transactions from shurka123.eth")
-
-    # Load fund transactions
-    print(f"Loading fund transactions...")
-    df2 = pd.read_csv(CSV_FILES[1])
-    # Standardize columns
-    df2_standardized = pd.DataFrame({
-        'Hash': df2.get('Transaction Hash', ''),
-        'From': df2.get('From', ''),
-        'To': df2.get('To', ''),
-        'Amount': df2['Value_IN(ETH)'].apply(parse_amount) if 'Value_IN(ETH)' in df2.columns else 0,
-        'Token_symbol': 'ETH',
-        'Date': df2.get('DateTime (UTC)', ''),
-        'Chain': 'eth'
+def parse_amounts(amounts):
+    """Vectorized parse_amount over a whole column"""
+    cleaned = amounts.astype('string').str.replace(',', '', regex=False)
+    return pd.to_numeric(cleaned, errors='coerce').fillna(0.0).astype('float64')
+
+def file_sha256(path):
+    """Content hash of a source file"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+def normalize_transactions(raw, source):
+    """Map one export onto the standard typed schema"""
+    columns = source['columns']
+    defaults = source.get('defaults', {})
+    n = len(raw)
+
+    def column(name):
+        src = columns.get(name)
+        if src is not None and src in raw.columns:
+            return raw[src]
+        return pd.Series([defaults.get(name, '')] * n, index=raw.index, dtype='object')
+
+    df = pd.DataFrame({
+        'Hash': column('Hash').fillna('').astype(str),
+        'From': column('From').fillna('').astype(str).str.lower(),
+        'To': column('To').fillna('').astype(str).str.lower(),
+        'Amount': parse_amounts(column('Amount')) if columns.get('Amount') in raw.columns else 0.0,
+        'Token_symbol': column('Token_symbol').fillna('').astype(str),
+        'Date': column('Date').fillna('').astype(str),
+        'Chain': column('Chain').fillna(defaults.get('Chain', '')).astype(str)
     })
-    all_data.append(df2_standardized)
-    print(f"  Loaded {len(df2)} transactions from fund wallet")
-
-    # Load gang transactions
-    print(f"Loading gang transactions...")
-    df3 = pd.read_csv(CSV_FILES[2])
-    # Standardize columns
-    df3_standardized = pd.DataFrame({
-        'Hash': df3.get('Transaction Hash', ''),
-        'From': df3.get('From', ''),
-        'To': df3.get('To', ''),
-        'Amount': df3['Value_IN(ETH)'].apply(parse_amount) if 'Value_IN(ETH)' in df3.columns else 0,
-        'Token_symbol': 'ETH',
-        'Date': df3.get('DateTime (UTC)', ''),
-        'Chain': 'eth'
-    })
-    all_data.append(df3_standardized)
-    print(f"  Loaded {len(df3)} transactions from gang wallet")
-
-    # Combine all data
-    combined_df = pd.concat(all_data, ignore_index=True)
-
-    # Ensure From/To addresses are lowercase for comparison
-    combined_df['From'] = combined_df['From'].str.lower()
-    combined_df['To'] = combined_df['To'].str.lower()
-
-    print(f"\nTotal combined transactions: {len(combined_df)}")
-
-    return combined_df
+    # Exports mix date formats; parse each row on its own (naive UTC)
+    df['Timestamp'] = parse_timestamps(df['Date'])
+    # Addresses/symbols repeat heavily: store them dictionary-encoded
+    for name in CATEGORICAL_COLUMNS:
+        df[name] = df[name].astype('category')
+    return df[STORE_COLUMNS]
+
+def ingest_csv(source, store_dir):
+    """Convert one transaction CSV into the columnar store, reusing it if the source is unchanged"""
+    source_hash = file_sha256(source['path'])[:16]
+    suffix = 'parquet' if HAS_PYARROW else 'pkl'
+    store_file = store_dir / f"{Path(source['path']).stem[:60]}-v{TX_STORE_SCHEMA_VERSION}-{source_hash}.{suffix}"
+
+    if store_file.exists():
+        print(f"  Using cached store for {source['label']} ({store_file.name})")
+        return store_file
+
+    print(f"  Ingesting {source['label']} into {store_file.name}...")
+    raw = pd.read_csv(source['path'], dtype=str, keep_default_na=False)
+    df = normalize_transactions(raw, source)
+
+    tmp_file = store_file.with_suffix(store_file.suffix + '.tmp')
+    if HAS_PYARROW:
+        df.to_parquet(tmp_file, engine='pyarrow', index=False)
+    else:
+        df.to_pickle(tmp_file)
+    tmp_file.replace(store_file)
+
+    # Drop stale versions of the same source
+    for stale in store_dir.glob(f"{Path(source['path']).stem[:60]}-v*"):
+        if stale != store_file:
+            stale.unlink()
+
+    print(f"  Loaded {len(df)} transactions from {source['label']}")
+    return store_file
+
+def apply_filters(df, filters):
+    """In-memory equivalent of pyarrow DNF filters (used without pyarrow)"""
+    if not filters:
+        return df
+    if not isinstance(filters[0], list):
+        filters = [filters]
+
+    ops = {
+        '==': lambda col, v: col == v,
+        '=': lambda col, v: col == v,
+        '!=': lambda col, v: col != v,
+        '>=': lambda col, v: col >= v,
+        '>': lambda col, v: col > v,
+        '<=': lambda col, v: col <= v,
+        '<': lambda col, v: col < v,
+        'in': lambda col, v: col.isin(v),
+    }
+    mask = pd.Series(False, index=df.index)
+    for conjunction in filters:
+        part = pd.Series(True, index=df.index)
+        for name, op, value in conjunction:
+            part &= ops[op](df[name], value)
+        mask |= part
+    return df[mask]
+
+class TransactionStore:
+    """Typed, dictionary-encoded transaction store queried with predicate pushdown"""
+
+    def __init__(self, store_files):
+        self.store_files = [str(f) for f in store_files]
+        if HAS_PYARROW:
+            self.dataset = ds.dataset(self.store_files, format='parquet')
+            self.frame = None
+        else:
+            self.dataset = None
+            self.frame = pd.concat([pd.read_pickle(f) for f in self.store_files], ignore_index=True)
+            for name in CATEGORICAL_COLUMNS:
+                self.frame[name] = self.frame[name].astype(str).astype('category')
+
+    def query(self, filters=None, columns=None):
+        """Rows matching DNF filters, e.g. [('To', '==', addr)] or [[...], [...]] for OR"""
+        if self.dataset is not None:
+            expression = pq.filters_to_expression(filters) if filters else None
+            table = self.dataset.to_table(columns=columns, filter=expression)
+            df = table.to_pandas()
+        else:
+            df = apply_filters(self.frame, filters)
+            df = df[columns] if columns else df
+        # Present addresses as plain strings to callers
+        for name in CATEGORICAL_COLUMNS:
+            if name in df.columns:
+                df[name] = df[name].astype(str)
+        return df.reset_index(drop=True)
+
+    def count(self, filters=None):
+        """Number of rows matching filters"""
+        if self.dataset is not None:
+            expression = pq.filters_to_expression(filters) if filters else None
+            return self.dataset.count_rows(filter=expression)
+        return len(apply_filters(self.frame, filters))
+
+def load_transaction_store(store_dir=TX_STORE_DIR):
+    """Ingest every transaction CSV (cached by source hash) and open the combined store"""
+    store_dir = Path(store_dir)
+    store_dir.mkdir(parents=True, exist_ok=True)
+    if not HAS_PYARROW:
+        print("⚠️  pyarrow not installed, using pickled DataFrames without predicate pushdown")
+
+    print("Loading transaction store...")
+    store_files = [ingest_csv(source, store_dir) for source in CSV_SOURCES]
+    store = TransactionStore(store_files)
+
+    print(f"\nTotal combined transactions: {store.count()}")
+
+    return store
 
-def identify_large_transfers(df, threshold_eth=200):
+def load_and_combine_csvs():
+    """Load all CSVs and combine into single DataFrame"""
+    return load_transaction_store().query()
+
+class RecordStream:
+    """Sized, re-iterable list-of-dicts view over a DataFrame, exported in column-wise batches"""
+
+    def __init__(self, df, fields, casts, batch_size=50000):
+        # fields: output key -> source column; casts: output key -> Python type
+        self.frame = df[list(fields.values())].rename(columns={v: k for k, v in fields.items()})
+        self.frame = self.frame.astype(casts)
+        self.batch_size = batch_size
+
+    def __len__(self):
+        return len(self.frame)
+
+    def __iter__(self):
+        for start in range(0, len(self.frame), self.batch_size):
+            yield from self.frame.iloc[start:start + self.batch_size].to_dict('records')
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return self.frame.iloc[key].to_dict('records')
+        return self.frame.iloc[key].to_dict()
+
+    def to_list(self):
+        return self.frame.to_dict('records')
+
+def write_json_stream(f, obj, indent=2, level=0):
+    """
+    Write obj as JSON (same layout as json.dump(indent=...)) without building
+    the document in memory; RecordStreams and generators are written item by item
+    """
+    pad = '\n' + ' ' * (indent * (level + 1))
+    close = '\n' + ' ' * (indent * level)
+
+    if isinstance(obj, dict):
+        if not obj:
+            f.write('{}')
+            return
+        f.write('{')
+        for i, (key, value) in enumerate(obj.items()):
+            f.write((',' if i else '') + pad + json.dumps(str(key)) + ': ')
+            write_json_stream(f, value, indent, level + 1)
+        f.write(close + '}')
+    elif isinstance(obj, (list, tuple, RecordStream)) or hasattr(obj, '__next__'):
+        empty = True
+        for item in obj:
+            f.write(('[' if empty else ',') + pad)
+            write_json_stream(f, item, indent, level + 1)
+            empty = False
+        f.write('[]' if empty else close + ']')
+    else:
+        f.write(json.dumps(obj))
+
+def usd_values(txs):
+    """Per-transaction USD value from the price oracle (as-of the transaction time)"""
+    if len(txs) == 0:
+        return pd.Series([], dtype='float64', index=txs.index)
+    values = default_oracle().usd_values(txs['Amount'], txs['Token_symbol'], txs['Timestamp'],
+                                         defaults=PRICE_DEFAULTS, aliases=SYMBOL_ALIASES)
+    return pd.Series(values, index=txs.index)
+
+def identify_large_transfers(store, threshold_eth=200):
     """Identify transactions >= threshold ETH"""
     print(f"\n=== Identifying transfers >= {threshold_eth} ETH ===")
 
-    # Filter for ETH/AVAX transactions
-    eth_txs = df[df['Token_symbol'].isin(['ETH', 'AVAX', 'Ether'])].copy()
-
-    # Filter by threshold
-    large_txs = eth_txs[eth_txs['Amount'] >= threshold_eth].copy()
+    # ETH/AVAX transactions over the threshold, filtered in the store
+    large_txs = store.query(
+        filters=[('Token_symbol', 'in', ETH_TOKENS), ('Amount', '>=', threshold_eth)],
+        columns=['Hash', 'Amount', 'Token_symbol', 'From', 'To', 'Date', 'Timestamp', 'Chain']
+    )
 
     # Calculate USD value
-    large_txs['Amount_USD'] = large_txs['Amount'] * ETH_PRICE_USD
+    large_txs['Amount_USD'] = usd_values(large_txs)
 
     # Sort by amount
     large_txs = large_txs.sort_values('Amount', ascending=False)
 
     print(f"Found {len(large_txs)} large transfers (>= {threshold_eth} ETH)")
 
-    # Convert to list of dicts
-    large_transfers_list = []
-    for _, row in large_txs.iterrows():
-        large_transfers_list.append({
-            'hash': row['Hash'],
-            'amount_eth': float(row['Amount']),
-            'amount_usd': float(row['Amount_USD']),
-            'from': row['From'],
-            'to': row['To'],
-            'date': str(row['Date']),
-            'chain': row['Chain']
-        })
-
-    return large_transfers_list
-
-def identify_stake_deposits(df):
+    # Column-wise export (no per-row Series)
+    return RecordStream(
+        large_txs,
+        fields={'hash': 'Hash', 'amount_eth': 'Amount', 'amount_usd': 'Amount_USD',
+                'from': 'From', 'to': 'To', 'date': 'Date', 'chain': 'Chain'},
+        casts={'amount_eth': float, 'amount_usd': float, 'date': str}
+    )
+
+def identify_stake_deposits(store):
     """Identify Stake.com deposits"""
     print(f"\n=== Identifying Stake.com deposits ===")
 
-    stake_txs = df[df['To'] == STAKE_ADDRESS.lower()].copy()
+    stake_txs = store.query(
+        filters=[('To', '==', STAKE_ADDRESS.lower())],
+        columns=['Hash', 'Amount', 'Token_symbol', 'From', 'Date', 'Timestamp']
+    )
 
     # Calculate totals
     total_eth = stake_txs['Amount'].sum()
-    total_usd = total_eth * ETH_PRICE_USD
+    total_usd = usd_values(stake_txs).sum()
 
     print(f"Found {len(stake_txs)} deposits to Stake.com")
     print(f"Total ETH: {total_eth:.4f}")
@@ -145,22 +341,21 @@ def identify_stake_deposits(df):
         'count': len(stake_txs),
         'total_eth': float(total_eth),
         'total_usd': float(total_usd),
-        'transactions': [
-            {
-                'hash': row['Hash'],
-                'amount_eth': float(row['Amount']),
-                'from': row['From'],
-                'date': str(row['Date'])
-            }
-            for _, row in stake_txs.iterrows()
-        ]
+        'transactions': RecordStream(
+            stake_txs,
+            fields={'hash': 'Hash', 'amount_eth': 'Amount', 'from': 'From', 'date': 'Date'},
+            casts={'amount_eth': float, 'date': str}
+        )
     }
 
-def identify_mexc_usage(df):
+def identify_mexc_usage(store):
     """Identify MEXC exchange usage"""
     print(f"\n=== Identifying MEXC exchange usage ===")
 
-    mexc_txs = df[(df['To'] == MEXC_ADDRESS.lower()) | (df['From'] == MEXC_ADDRESS.lower())].copy()
+    mexc_txs = store.query(
+        filters=[[('To', '==', MEXC_ADDRESS.lower())], [('From', '==', MEXC_ADDRESS.lower())]],
+        columns=['Hash', 'Amount', 'From', 'To', 'Date']
+    )
 
     # Calculate totals
     total_eth = mexc_txs['Amount'].sum()
@@ -171,36 +366,37 @@ def identify_mexc_usage(df):
     return {
         'count': len(mexc_txs),
         'total_eth': float(total_eth),
-        'transactions': [
-            {
-                'hash': row['Hash'],
-                'amount_eth': float(row['Amount']),
-                'from': row['From'],
-                'to': row['To'],
-                'date': str(row['Date'])
-            }
-            for _, row in mexc_txs.iterrows()
-        ]
+        'transactions': RecordStream(
+            mexc_txs,
+            fields={'hash': 'Hash', 'amount_eth': 'Amount', 'from': 'From', 'to': 'To', 'date': 'Date'},
+            casts={'amount_eth': float, 'date': str}
+        )
     }
 
-def cluster_wallets(df):
+def cluster_wallets(store):
     """Cluster wallets by transaction patterns"""
     print(f"\n=== Clustering wallets by activity ===")
 
     # Filter for ETH/AVAX only to avoid token distortion
-    eth_only = df[df['Token_symbol'].isin(['ETH', 'AVAX', 'Ether'])].copy()
+    eth_only = store.query(
+        filters=[('Token_symbol', 'in', ETH_TOKENS)],
+        columns=['Hash', 'From', 'To', 'Amount', 'Token_symbol', 'Timestamp']
+    )
+    # Rows without a sender have From == '' in the store; keep them out of the clusters
+    eth_only = eth_only[eth_only['From'] != ''].copy()
+
+    # Calculate USD value per transaction
+    eth_only['Amount_USD'] = usd_values(eth_only)
 
     # Group by From address
     wallet_groups = eth_only.groupby('From').agg({
         'Amount': 'sum',
         'Hash': 'count',
-        'To': lambda x: list(set(x))
+        'To': lambda x: list(set(x)),
+        'Amount_USD': 'sum'
     }).reset_index()
 
-    wallet_groups.columns = ['wallet', 'total_volume_eth', 'tx_count', 'related_wallets']
-
-    # Calculate USD value
-    wallet_groups['total_volume_usd'] = wallet_groups['total_volume_eth'] * ETH_PRICE_USD
+    wallet_groups.columns = ['wallet', 'total_volume_eth', 'tx_count', 'related_wallets', 'total_volume_usd']
 
     # Sort by volume
     wallet_groups = wallet_groups.sort_values('total_volume_eth', ascending=False)
@@ -208,26 +404,92 @@ def cluster_wallets(df):
     print(f"Identified {len(wallet_groups)} unique wallets (ETH/AVAX only)")
 
     # Convert to list of dicts (top 50 only)
-    wallet_clusters = []
-    for _, row in wallet_groups.head(50).iterrows():
-        wallet_clusters.append({
-            'main_wallet': row['wallet'],
-            'related_wallets': row['related_wallets'][:20],  # Limit related wallets
-            'total_volume_eth': float(row['total_volume_eth']),
-            'total_volume_usd': float(row['total_volume_usd']),
-            'transaction_count': int(row['tx_count'])
-        })
-
-    return wallet_clusters
-
-def calculate_total_proceeds(df):
+    top_wallets = wallet_groups.head(50).copy()
+    top_wallets['related_wallets'] = top_wallets['related_wallets'].str[:20]  # Limit related wallets
+    return RecordStream(
+        top_wallets,
+        fields={'main_wallet': 'wallet', 'related_wallets': 'related_wallets',
+                'total_volume_eth': 'total_volume_eth', 'total_volume_usd': 'total_volume_usd',
+                'transaction_count': 'tx_count'},
+        casts={'total_volume_eth': float, 'total_volume_usd': float, 'transaction_count': int}
+    ).to_list()
+
+def trace_wallet_flows(store, taint_hops=3, max_path_hops=4):
+    """Multi-hop flow tracing over the full ETH/AVAX transaction graph"""
+    print(f"\n=== Tracing multi-hop wallet flows ===")
+
+    eth_only = store.query(
+        filters=[('Token_symbol', 'in', ETH_TOKENS)],
+        columns=['Hash', 'From', 'To', 'Amount']
+    )
+    graph = TransactionGraph.from_frame(eth_only)
+    print(f"Transaction graph: {graph.node_count} wallets, {graph.edge_count} edges")
+
+    # Co-spend clusters: senders appearing together in the same transaction hash
+    labels = graph.cospend_clusters(eth_only['Hash'], eth_only['From'])
+    cluster_frame = pd.DataFrame({
+        'wallet': graph.addresses,
+        'cluster': labels,
+        'volume_eth': graph.out_volume
+    })
+    clusters = cluster_frame.groupby('cluster').agg(
+        wallets=('wallet', list), size=('wallet', 'size'), total_volume_eth=('volume_eth', 'sum')
+    )
+    clusters = clusters[clusters['size'] > 1].sort_values('total_volume_eth', ascending=False)
+    print(f"Co-spend clusters with 2+ wallets: {len(clusters)}")
+
+    # Taint from known entity wallets; exchanges absorb but don't forward taint
+    seeds = graph.nodes_for(KNOWN_WALLETS.keys())
+    exchanges = graph.nodes_for([STAKE_ADDRESS, MEXC_ADDRESS])
+    taint = graph.taint(seeds, hops=taint_hops, sinks=exchanges)
+    tainted = pd.DataFrame({
+        'wallet': graph.addresses,
+        'taint': taint['taint'],
+        'hop': taint['hop'],
+        'received_eth': graph.in_volume
+    })
+    tainted = tainted[tainted['hop'] > 0].sort_values(['taint', 'received_eth'], ascending=False)
+    print(f"Wallets within {taint_hops} hops of known wallets: {len(tainted)}")
+
+    # Shortest laundering paths from known wallets to exchange deposit addresses
+    exchange_paths = graph.paths_to(seeds, exchanges, max_hops=max_path_hops)
+    print(f"Paths from known wallets to Stake.com/MEXC (<= {max_path_hops} hops): {len(exchange_paths)}")
+
+    return {
+        'graph': {'wallets': graph.node_count, 'edges': graph.edge_count},
+        'cospend_clusters': [
+            {
+                'wallets': row['wallets'],
+                'size': int(row['size']),
+                'total_volume_eth': float(row['total_volume_eth'])
+            }
+            for row in clusters.head(50).to_dict('records')
+        ],
+        'tainted_wallets': RecordStream(
+            tainted.head(500),
+            fields={'wallet': 'wallet', 'hop': 'hop', 'taint': 'taint', 'received_eth': 'received_eth'},
+            casts={'hop': int, 'taint': float, 'received_eth': float}
+        ),
+        'exchange_paths': exchange_paths,
+        'parameters': {'taint_hops': taint_hops, 'max_path_hops': max_path_hops}
+    }
+
+def calculate_total_volume_eth(store):
+    """Total ETH/AVAX volume across the store"""
+    eth_txs = store.query(filters=[('Token_symbol', 'in', ETH_TOKENS)], columns=['Amount'])
+    return float(eth_txs['Amount'].sum())
+
+def calculate_total_proceeds(store):
     """Calculate total proceeds in USD"""
     print(f"\n=== Calculating total proceeds ===")
 
-    # Sum all ETH/AVAX amounts
-    eth_txs = df[df['Token_symbol'].isin(['ETH', 'AVAX', 'Ether'])]
+    # Sum all ETH/AVAX amounts, valued at each transaction's date
+    eth_txs = store.query(
+        filters=[('Token_symbol', 'in', ETH_TOKENS)],
+        columns=['Amount', 'Token_symbol', 'Timestamp']
+    )
     total_eth = eth_txs['Amount'].sum()
-    total_usd = total_eth * ETH_PRICE_USD
+    total_usd = usd_values(eth_txs).sum()
 
     print(f"Total ETH volume: {total_eth:,.4f}")
     print(f"Total USD value: ${total_usd:,.2f}")
@@ -239,48 +501,57 @@ def main():
     print("BLOCKCHAIN FORENSICS ANALYSIS FOR RICO EVIDENCE")
     print("=" * 80)
 
-    # Step 1: Load and combine data
-    df = load_and_combine_csvs()
+    # Step 1: Ingest CSVs into the columnar store (cached by source hash)
+    store = load_transaction_store()
+    total_transactions = store.count()
 
     # Step 2: Identify large transfers (>= 200 ETH)
-    large_transfers = identify_large_transfers(df, threshold_eth=200)
+    large_transfers = identify_large_transfers(store, threshold_eth=200)
 
     # Step 3: Identify Stake.com deposits
-    stake_deposits = identify_stake_deposits(df)
+    stake_deposits = identify_stake_deposits(store)
 
     # Step 4: Identify MEXC usage
-    mexc_usage = identify_mexc_usage(df)
+    mexc_usage = identify_mexc_usage(store)
 
     # Step 5: Cluster wallets
-    wallet_clusters = cluster_wallets(df)
+    wallet_clusters = cluster_wallets(store)
+
+    # Step 6: Trace multi-hop flows (co-spend clusters, taint, exchange paths)
+    flow_tracing = trace_wallet_flows(store)
 
-    # Step 6: Calculate total proceeds
-    total_proceeds = calculate_total_proceeds(df)
+    # Step 7: Calculate total proceeds
+    total_proceeds = calculate_total_proceeds(store)
 
-    # Step 7: Generate analysis JSON
+    # Step 8: Generate analysis JSON
     print(f"\n=== Generating blockchain_analysis.json ===")
 
     analysis_data = {
         'analysis_date': datetime.now().isoformat(),
-        'total_transactions': len(df),
+        'total_transactions': total_transactions,
         'large_transfers': large_transfers,
         'stake_deposits': stake_deposits,
         'mexc_usage': mexc_usage,
         'wallet_clusters': wallet_clusters,
+        'flow_tracing': flow_tracing,
         'total_proceeds_usd': total_proceeds,
         'summary': {
             'large_transfers_count': len(large_transfers),
             'stake_deposits_count': stake_deposits['count'],
             'mexc_usage_count': mexc_usage['count'],
             'unique_wallets': len(wallet_clusters),
-            'total_volume_eth': float(df[df['Token_symbol'].isin(['ETH', 'AVAX', 'Ether'])]['Amount'].sum()),
+            'total_volume_eth': calculate_total_volume_eth(store),
             'tier1_threshold_eth': 200
         }
     }
 
-    # Save to JSON
-    with open(OUTPUT_FILE, 'w') as f:
-        json.dump(analysis_data, f, indent=2)
+    # Save to JSON (transaction lists are streamed, never built as one document);
+    # written to a temp file first so a failed run keeps the previous report
+    output_file = Path(OUTPUT_FILE)
+    tmp_file = output_file.with_suffix(output_file.suffix + '.tmp')
+    with open(tmp_file, 'w') as f:
+        write_json_stream(f, analysis_data, indent=2)
+    tmp_file.replace(output_file)
 
     print(f"Analysis saved to: {OUTPUT_FILE}")
 
@@ -288,10 +559,11 @@ def main():
     print("\n" + "=" * 80)
     print("SUMMARY STATISTICS")
     print("=" * 80)
-    print(f"Total Transactions Analyzed: {len(df):,}")
+    print(f"Total Transactions Analyzed: {total_transactions:,}")
     print(f"Large Transfers (>= 200 ETH): {len(large_transfers)}")
     print(f"Stake.com Deposits: {stake_deposits['count']} (${stake_deposits['total_usd']:,.2f})")
     print(f"MEXC Exchange Usage: {mexc_usage['count']} transactions")
+    print(f"Known-wallet -> exchange paths: {len(flow_tracing['exchange_paths'])}")
     print(f"Total Proceeds: ${total_proceeds:,.2f}")
 
     print("\n=== TOP 5 LARGEST TRANSFERS ===")
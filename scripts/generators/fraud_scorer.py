@@ -4,63 +4,78 @@ RICO Fraud Scorer for Telegram Posts
 Analyzes posts for fraud indicators and generates fraud scores 0-100
 """
 
+import hashlib
 import json
-import re
+import sys
 import pandas as pd
 from pathlib import Path
 from typing import Dict, List, Tuple
 
-# Fraud detection keywords
-FRAUD_KEYWORDS = [
-    'healing', 'energy', 'quantum', 'frequency', 'scalar', 'biophoton',
-    'cellular', 'detox', 'cure', 'disease', 'fda', 'approved', 'clinical',
-    'proven', 'guaranteed', 'miracle', 'revolutionary', 'breakthrough'
-]
-
-# Call-to-Action patterns
-CTA_PATTERNS = [
-    r'\bjoin\b', r'\bsubscribe\b', r'\bwatch\b', r'\blive\b', r'\bbuy\b',
-    r'\bsale\b', r'\bannouncement\b', r'\bmembership\b', r'\bfree trial\b',
-    r'\bdiscount\b', r'\bearly access\b', r'\bregister\b', r'\bdonate\b',
-    r'\bget your ticket\b', r'\bgrab your\b', r'\bsecure your\b',
-    r'\bbook a session\b', r'\bget yours\b', r'\bcheck it out\b'
-]
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from pattern_bank import (
+    BANK, CTA_PATTERNS, DISCLAIMER_KEYWORDS, MEDICAL_CLAIM_KEYWORDS,
+    MEDICAL_SPECIFICITY_TERMS, PATTERN_BANK_VERSION, TELEGRAM_DETECTORS,
+    TELEGRAM_FRAUD_KEYWORDS, TELEGRAM_PRICE_PATTERN, Hit, hits_by_pattern_order, normalize
+)
+
+# Fraud detection keywords, CTA, medical and price patterns live in the shared pattern bank
+FRAUD_KEYWORDS = TELEGRAM_FRAUD_KEYWORDS
+PRICE_PATTERN = TELEGRAM_PRICE_PATTERN
+
+# Fraud scoring formula weights
+SCORE_WEIGHTS = {
+    'fraud_keyword': 5,
+    'cta': 10,
+    'price_claim': 20,
+    'medical_claim': 40,
+    'medical_specificity': 15
+}
+
+# Bump when the scoring logic changes in a way the rule tables don't capture
+SCORER_REVISION = 1
+
+
+def scoring_rules_version() -> str:
+    """Fingerprint of every rule table and weight that affects a post's score"""
+    rules = {
+        'revision': SCORER_REVISION,
+        'pattern_bank_version': PATTERN_BANK_VERSION,
+        'fraud_keywords': FRAUD_KEYWORDS,
+        'cta_patterns': CTA_PATTERNS,
+        'medical_claim_keywords': MEDICAL_CLAIM_KEYWORDS,
+        'disclaimer_keywords': DISCLAIMER_KEYWORDS,
+        'medical_specificity_terms': MEDICAL_SPECIFICITY_TERMS,
+        'price_pattern': PRICE_PATTERN,
+        'weights': SCORE_WEIGHTS
+    }
+    payload = json.dumps(rules, sort_keys=True).encode('utf-8')
+    return hashlib.sha256(payload).hexdigest()[:16]
 
-# Medical claim patterns (without disclaimer)
-MEDICAL_CLAIM_KEYWORDS = ['healing', 'cure', 'disease', 'treatment', 'remedy']
-DISCLAIMER_KEYWORDS = ['consult', 'physician', 'doctor', 'medical advice', 'not intended to diagnose']
 
-# Price pattern (looking for $1000+)
-PRICE_PATTERN = r'\$\s*([0-9,]+)'
+def scan_post(text: str) -> Dict[str, List[Hit]]:
+    """Normalise a post once and run every Telegram detector over it"""
+    return BANK.match(normalize(text), TELEGRAM_DETECTORS)
 
 
-def count_fraud_keywords(text: str) -> Tuple[int, List[str]]:
+def count_fraud_keywords(text: str, hits: Dict[str, List[Hit]] = None) -> Tuple[int, List[str]]:
     """Count fraud keywords in text (case-insensitive)"""
-    text_lower = text.lower()
-    found_keywords = []
-    for keyword in FRAUD_KEYWORDS:
-        count = len(re.findall(r'\b' + keyword + r'\b', text_lower))
-        if count > 0:
-            found_keywords.extend([keyword] * count)
+    hits = hits if hits is not None else scan_post(text)
+    found_keywords = [hit.label for hit in hits_by_pattern_order(hits['telegram_fraud_keyword'])]
     return len(found_keywords), found_keywords
 
 
-def detect_cta_phrases(text: str) -> Tuple[int, List[str]]:
+def detect_cta_phrases(text: str, hits: Dict[str, List[Hit]] = None) -> Tuple[int, List[str]]:
     """Detect CTA phrases in text (case-insensitive)"""
-    text_lower = text.lower()
-    found_ctas = []
-    for pattern in CTA_PATTERNS:
-        matches = re.findall(pattern, text_lower)
-        if matches:
-            found_ctas.extend(matches if isinstance(matches, list) else [matches])
+    hits = hits if hits is not None else scan_post(text)
+    found_ctas = [hit.text for hit in hits_by_pattern_order(hits['cta'])]
     return len(found_ctas), found_ctas
 
 
-def check_price_claim(text: str) -> Tuple[bool, int]:
+def check_price_claim(text: str, hits: Dict[str, List[Hit]] = None) -> Tuple[bool, int]:
     """Check for price mentions over $1000"""
-    prices = re.findall(PRICE_PATTERN, text)
-    for price_str in prices:
-        price_clean = price_str.replace(',', '')
+    hits = hits if hits is not None else scan_post(text)
+    for hit in hits['telegram_price']:
+        price_clean = hit.value.replace(',', '')
         try:
             price = int(price_clean)
             if price >= 1000:
@@ -70,29 +85,22 @@ def check_price_claim(text: str) -> Tuple[bool, int]:
     return False, 0
 
 
-def check_medical_claim(text: str) -> Tuple[bool, int]:
+def check_medical_claim(text: str, hits: Dict[str, List[Hit]] = None) -> Tuple[bool, int]:
     """Check for medical claims without disclaimers"""
-    text_lower = text.lower()
+    hits = hits if hits is not None else scan_post(text)
 
     # Check for medical claim keywords
-    has_medical_claim = any(
-        re.search(r'\b' + keyword + r'\b', text_lower)
-        for keyword in MEDICAL_CLAIM_KEYWORDS
-    )
+    has_medical_claim = bool(hits['medical_claim'])
 
     if not has_medical_claim:
         return False, 0
 
     # Check for disclaimers
-    has_disclaimer = any(
-        disclaimer in text_lower
-        for disclaimer in DISCLAIMER_KEYWORDS
-    )
+    has_disclaimer = bool(hits['disclaimer'])
 
     if has_medical_claim and not has_disclaimer:
         # Calculate specificity score (0-1) based on medical terms
-        medical_terms = ['cellular', 'quantum', 'frequency', 'energy', 'biophoton', 'scalar']
-        specificity_count = sum(1 for term in medical_terms if term in text_lower)
+        specificity_count = len({hit.label for hit in hits['medical_specificity']})
         specificity_score = min(1.0, specificity_count / 3)  # Normalize to 0-1
         return True, specificity_score
 
@@ -101,18 +109,19 @@ def check_medical_claim(text: str) -> Tuple[bool, int]:
 
 def calculate_fraud_score(text: str) -> Dict:
     """Calculate comprehensive fraud score for a post"""
-    fraud_keyword_count, fraud_keywords_found = count_fraud_keywords(text)
-    cta_count, cta_phrases_found = detect_cta_phrases(text)
-    has_price_claim, price_value = check_price_claim(text)
-    has_medical_claim, medical_specificity = check_medical_claim(text)
+    hits = scan_post(text)
+    fraud_keyword_count, fraud_keywords_found = count_fraud_keywords(text, hits)
+    cta_count, cta_phrases_found = detect_cta_phrases(text, hits)
+    has_price_claim, price_value = check_price_claim(text, hits)
+    has_medical_claim, medical_specificity = check_medical_claim(text, hits)
 
     # Apply fraud scoring formula
     score = min(100, (
-        fraud_keyword_count * 5 +
-        cta_count * 10 +
-        (20 if has_price_claim else 0) +
-        (40 if has_medical_claim else 0) +
-        int(medical_specificity * 15)
+        fraud_keyword_count * SCORE_WEIGHTS['fraud_keyword'] +
+        cta_count * SCORE_WEIGHTS['cta'] +
+        (SCORE_WEIGHTS['price_claim'] if has_price_claim else 0) +
+        (SCORE_WEIGHTS['medical_claim'] if has_medical_claim else 0) +
+        int(medical_specificity * SCORE_WEIGHTS['medical_specificity'])
     ))
 
     # Determine tier recommendation
@@ -139,9 +148,80 @@ def calculate_fraud_score(text: str) -> Dict:
     }
 
 
-def process_ndjson_file(input_file: str) -> pd.DataFrame:
-    """Process NDJSON file and generate fraud scores"""
+def load_score_cache(cache_file: Path) -> Dict:
+    """Load the per-post score cache, discarding it if the scoring rules changed"""
+    rules_version = scoring_rules_version()
+    empty = {'rules_version': rules_version, 'posts': {}}
+
+    if not cache_file or not cache_file.exists():
+        return empty
+
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except (json.JSONDecodeError, OSError) as e:
+        print(f"Ignoring unreadable score cache {cache_file}: {e}")
+        return empty
+
+    if cache.get('rules_version') != rules_version:
+        print(f"Scoring rules changed ({cache.get('rules_version')} -> {rules_version}), rescoring all posts")
+        return empty
+
+    return cache
+
+
+def save_score_cache(cache: Dict, cache_file: Path):
+    """Persist the score cache atomically so an interrupted run can't corrupt it"""
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = cache_file.with_suffix(cache_file.suffix + '.tmp')
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        json.dump(cache, f)
+    tmp_file.replace(cache_file)
+
+
+def post_cache_key(post: Dict, line_num: int) -> str:
+    """Stable identity for a post: externalId/uid, falling back to line number"""
+    external_id = post.get('externalId', '')
+    uid = post.get('uid', '')
+    if external_id or uid:
+        return f"{external_id}|{uid}"
+    return f"line:{line_num}"
+
+
+def body_hash(body: str) -> str:
+    """Content hash of a post body"""
+    return hashlib.sha256(body.encode('utf-8')).hexdigest()
+
+
+def score_post(body: str) -> Dict:
+    """Score a post body into the cached (CSV-ready) score columns"""
+    fraud_data = calculate_fraud_score(body)
+    return {
+        'fraud_score': fraud_data['fraud_score'],
+        'fraud_keywords': '|'.join(fraud_data['fraud_keywords'][:10]),  # Limit for CSV
+        'fraud_keyword_count': fraud_data['fraud_keyword_count'],
+        'cta_phrases': '|'.join(fraud_data['cta_phrases'][:10]),  # Limit for CSV
+        'cta_count': fraud_data['cta_count'],
+        'has_price_claim': fraud_data['has_price_claim'],
+        'price_value': fraud_data['price_value'],
+        'has_medical_claim': fraud_data['has_medical_claim'],
+        'medical_specificity_score': fraud_data['medical_specificity_score'],
+        'tier_recommendation': fraud_data['tier_recommendation']
+    }
+
+
+def process_ndjson_file(input_file: str, cache_file: Path = None) -> pd.DataFrame:
+    """
+    Process NDJSON file and generate fraud scores
+
+    When cache_file is given, only new or changed posts are scored; the rest
+    are read back from the cache. Posts no longer in the export are pruned.
+    """
+    cache = load_score_cache(cache_file)
+    cached_posts = cache['posts']
+    seen_posts = {}
     results = []
+    scored = 0
 
     with open(input_file, 'r', encoding='utf-8') as f:
         for line_num, line in enumerate(f, 1):
@@ -151,24 +231,21 @@ def process_ndjson_file(input_file: str) -> pd.DataFrame:
                 external_id = post.get('externalId', '')
                 uid = post.get('uid', '')
 
-                # Calculate fraud score
-                fraud_data = calculate_fraud_score(body)
+                key = post_cache_key(post, line_num)
+                digest = body_hash(body)
+                entry = cached_posts.get(key)
+
+                if entry is None or entry['body_hash'] != digest:
+                    entry = {'body_hash': digest, 'scores': score_post(body)}
+                    scored += 1
+                seen_posts[key] = entry
 
                 # Build result row
                 result = {
                     'post_id': line_num,
                     'external_id': external_id,
                     'date': uid,
-                    'fraud_score': fraud_data['fraud_score'],
-                    'fraud_keywords': '|'.join(fraud_data['fraud_keywords'][:10]),  # Limit for CSV
-                    'fraud_keyword_count': fraud_data['fraud_keyword_count'],
-                    'cta_phrases': '|'.join(fraud_data['cta_phrases'][:10]),  # Limit for CSV
-                    'cta_count': fraud_data['cta_count'],
-                    'has_price_claim': fraud_data['has_price_claim'],
-                    'price_value': fraud_data['price_value'],
-                    'has_medical_claim': fraud_data['has_medical_claim'],
-                    'medical_specificity_score': fraud_data['medical_specificity_score'],
-                    'tier_recommendation': fraud_data['tier_recommendation']
+                    **entry['scores']
                 }
 
                 results.append(result)
@@ -180,6 +257,12 @@ def process_ndjson_file(input_file: str) -> pd.DataFrame:
                 print(f"Error parsing line {line_num}: {e}")
                 continue
 
+    print(f"Scored {scored} new/changed posts, reused {len(results) - scored} cached scores")
+
+    if cache_file:
+        cache['posts'] = seen_posts
+        save_score_cache(cache, cache_file)
+
     return pd.DataFrame(results)
 
 
@@ -194,10 +277,11 @@ def main():
     output_dir = Path('/Users/breydentaylor/certainly/visualizations')
     output_full = output_dir / 'fraud_scores.csv'
     output_top100 = output_dir / 'fraud_scores_top100.csv'
+    score_cache = output_dir / 'fraud_score_cache.json'
 
-    # Process posts
+    # Process posts (incrementally, against the per-post score cache)
     print(f"\nProcessing: {input_file}")
-    df = process_ndjson_file(input_file)
+    df = process_ndjson_file(input_file, cache_file=score_cache)
 
     # Sort by fraud score descending
     df_sorted = df.sort_values('fraud_score', ascending=False).reset_index(drop=True)
@@ -122,7 +122,7 @@ for platform, count in hr_by_platform.items():
 
 critical_risk = df[df['fraud_score'] >= 50]
 print(f"\n  CRITICAL-risk URLs (score >= 50): {len(critical_risk)}")
-for idx, row in critical_risk.head(10).iterrows():
+for idx, row in critical_risk.nlargest(10, 'fraud_score').iterrows():
     print(f"    Score {row['fraud_score']}: {row['url'][:80]}")
 
 print("\n" + "="*100)
@@ -6,17 +6,18 @@ Generate detailed report of top 50 most fraudulent URLs
 import pandas as pd
 
 CSV_FILE = "/Users/breydentaylor/certainly/visualizations/url_classifications.csv"
+TOP_CSV_FILE = "/Users/breydentaylor/certainly/visualizations/url_classifications_top50.csv"
 
-# Read CSV
-df = pd.read_csv(CSV_FILE)
+# The full CSV is written in crawl order; url_analysis.py ranks the top 50 separately
+top_50 = pd.read_csv(TOP_CSV_FILE)
 
-# Get top 50
-top_50 = df.head(50)
+# Count rows without materialising the full CSV
+total_urls = sum(len(chunk) for chunk in pd.read_csv(CSV_FILE, usecols=['url'], chunksize=100_000))
 
 print("="*100)
 print("TOP 50 MOST FRAUDULENT URLs - DETAILED REPORT")
 print("="*100)
-print(f"\nTotal URLs analyzed: {len(df)}")
+print(f"\nTotal URLs analyzed: {total_urls}")
 print(f"Top 50 shown below (sorted by fraud score)")
 print()
 
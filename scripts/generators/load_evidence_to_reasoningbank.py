@@ -5,15 +5,115 @@ Loads 150+ classified evidence pieces with metadata and validation paths.
 """
 
 import json
+import sqlite3
 import subprocess
 import sys
 from pathlib import Path
 from typing import Dict, List, Any
 from datetime import datetime
 
+# Columns of claude-flow's memory_entries table that the in-process writer touches
+MEMORY_ENTRY_COLUMNS = {'key', 'value', 'namespace', 'metadata', 'updated_at'}
+
+UPSERT_MEMORY_ENTRY = """
+    INSERT INTO memory_entries (key, value, namespace, metadata)
+    VALUES (?, ?, ?, ?)
+    ON CONFLICT(key, namespace) DO UPDATE SET
+        value = excluded.value,
+        metadata = excluded.metadata,
+        updated_at = strftime('%s', 'now')
+"""
+
+
+class MemorySchemaError(RuntimeError):
+    """memory.db has no claude-flow memory_entries table the in-process writer can upsert into"""
+
+
+def check_memory_schema(conn):
+    """Raise MemorySchemaError unless memory_entries has the expected columns and UNIQUE(key, namespace)"""
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(memory_entries)")}
+    if not columns:
+        raise MemorySchemaError("memory_entries table not found (run claude-flow once to create it)")
+    missing = MEMORY_ENTRY_COLUMNS - columns
+    if missing:
+        raise MemorySchemaError(f"memory_entries is missing columns: {', '.join(sorted(missing))}")
+
+    for _, name, unique, _, partial in conn.execute("PRAGMA index_list(memory_entries)"):
+        if unique and not partial:
+            indexed = {row[2] for row in conn.execute(f'PRAGMA index_info("{name}")')}
+            if indexed == {'key', 'namespace'}:
+                return
+    raise MemorySchemaError("memory_entries has no UNIQUE(key, namespace) constraint to upsert on")
+
+
+class MemoryStoreWriter:
+    """In-process writer for the claude-flow memory table: every store joins one open transaction"""
+
+    def __init__(self, db_path: str):
+        if not Path(db_path).exists():
+            raise MemorySchemaError(f"{db_path} does not exist")
+        self.conn = sqlite3.connect(db_path)
+        try:
+            check_memory_schema(self.conn)
+        except MemorySchemaError:
+            self.conn.close()
+            raise
+        self.pending = 0
+
+    def store(self, key: str, value: str, namespace: str, metadata: str):
+        """Upsert one entry (visible to other readers after commit)"""
+        self.conn.execute(UPSERT_MEMORY_ENTRY, (key, value, namespace, metadata))
+        self.pending += 1
+
+    def commit(self) -> int:
+        """Commit every entry stored since the last commit; returns how many"""
+        self.conn.commit()
+        committed, self.pending = self.pending, 0
+        return committed
+
+    def close(self):
+        self.commit()
+        self.conn.close()
+
+
+class CliMemoryStore:
+    """Fallback writer: one `npx claude-flow@alpha memory store` call per entry (committed immediately)"""
+
+    def __init__(self):
+        self.pending = 0
+
+    def store(self, key: str, value: str, namespace: str, metadata: str):
+        result = subprocess.run([
+            'npx', 'claude-flow@alpha', 'memory', 'store',
+            key, value,
+            '--namespace', namespace,
+            '--metadata', metadata
+        ], capture_output=True, text=True, timeout=30)
+        if result.returncode != 0:
+            raise RuntimeError(f"claude-flow memory store failed for {key}: {result.stderr.strip()}")
+        self.pending += 1
+
+    def commit(self) -> int:
+        committed, self.pending = self.pending, 0
+        return committed
+
+    def close(self):
+        pass
+
+
+def open_memory_store(db_path: str):
+    """In-process writer when memory.db has the expected schema, else the claude-flow CLI"""
+    try:
+        return MemoryStoreWriter(db_path)
+    except MemorySchemaError as e:
+        print(f"Warning: {e}; falling back to one claude-flow CLI call per item")
+        return CliMemoryStore()
+
+
 class ReasoningBankLoader:
     def __init__(self, memory_db_path: str):
         self.memory_db_path = memory_db_path
+        self.writer = open_memory_store(memory_db_path)
         self.evidence_loaded = {
             'tier1': 0,
             'tier2': 0,
@@ -32,53 +132,48 @@ class ReasoningBankLoader:
 
     def store_evidence(self, evidence_id: str, content: Any, tier: int,
                       category: str, metadata: Dict) -> bool:
-        """Store evidence using claude-flow memory API"""
-        try:
-            # Prepare content as JSON string
-            if isinstance(content, dict) or isinstance(content, list):
-                content_str = json.dumps(content)
-            else:
-                content_str = str(content)
-
-            # Prepare metadata
-            meta_json = json.dumps({
-                **metadata,
-                'tier': tier,
-                'category': category,
-                'loaded_at': datetime.now().isoformat(),
-                'evidence_id': evidence_id
-            })
-
-            # Store using npx claude-flow memory API
-            namespace = f'evidence_tier{tier}'
-
-            result = subprocess.run([
-                'npx', 'claude-flow@alpha', 'memory', 'store',
-                evidence_id, content_str,
-                '--namespace', namespace,
-                '--metadata', meta_json
-            ], capture_output=True, text=True, timeout=30)
-
-            if result.returncode == 0:
-                self.evidence_loaded[f'tier{tier}'] += 1
-                self.category_counts[category] += 1
-
-                # Add to evidence index
-                self.evidence_index[evidence_id] = {
-                    'tier': tier,
-                    'category': category,
-                    'namespace': namespace,
-                    'metadata': metadata
-                }
-
-                return True
-            else:
-                print(f"Warning: Failed to store {evidence_id}: {result.stderr}")
-                return False
-
-        except Exception as e:
-            print(f"Error storing {evidence_id}: {str(e)}")
-            return False
+        """
+        Store evidence in the claude-flow memory table (pending until commit()).
+        Write errors propagate: the open transaction is never committed half-loaded.
+        """
+        # Prepare content as JSON string
+        if isinstance(content, dict) or isinstance(content, list):
+            content_str = json.dumps(content)
+        else:
+            content_str = str(content)
+
+        # Prepare metadata
+        meta_json = json.dumps({
+            **metadata,
+            'tier': tier,
+            'category': category,
+            'loaded_at': datetime.now().isoformat(),
+            'evidence_id': evidence_id
+        })
+
+        # Store in the claude-flow memory table (committed in one transaction by commit())
+        namespace = f'evidence_tier{tier}'
+        self.writer.store(evidence_id, content_str, namespace, meta_json)
+
+        self.evidence_loaded[f'tier{tier}'] += 1
+        self.category_counts[category] += 1
+
+        # Add to evidence index
+        self.evidence_index[evidence_id] = {
+            'tier': tier,
+            'category': category,
+            'namespace': namespace,
+            'metadata': metadata
+        }
+
+        return True
+
+    def commit(self) -> int:
+        """Write every stored evidence item to memory.db in a single transaction"""
+        return self.writer.commit()
+
+    def close(self):
+        self.writer.close()
 
     def load_blockchain_evidence(self, data: Dict) -> int:
         """Load top 100 blockchain transactions by value (TIER 1-2)"""
@@ -479,6 +574,10 @@ def main():
     entity_count = loader.create_synthetic_entities()
     print(f"  ✓ Loaded {entity_count} entity nodes")
 
+    committed = loader.commit()
+    loader.close()
+    print(f"\n  ✓ Committed {committed} evidence items to {memory_db}")
+
     # Generate reports
     print("\n[7/7] Generating reports...")
     report = loader.generate_report()
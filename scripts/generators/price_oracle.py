@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Local Price Oracle for USD Valuation of Blockchain Evidence
+Time-indexed OHLC lookups (daily or hourly bars) with vectorized as-of joins
+over whole transaction columns and an LRU cache for scalar lookups
+
+The bundled data/price_history_daily.csv holds the monthly approximations the
+extractors used previously, expanded to one bar per day. Dropping a finer
+export (same columns: symbol,date,open,high,low,close) in its place makes
+every valuation use it without code changes.
+"""
+
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+PRICE_HISTORY_FILE = Path(__file__).resolve().parent / "data" / "price_history_daily.csv"
+
+# Fallback prices when no bar covers the transaction time
+DEFAULT_PRICES = {
+    "ETH": 2000.00,
+    "AVAX": 30.00,
+    "FTM": 0.40,
+    "SPELL": 0.001
+}
+
+
+def parse_timestamps(values: pd.Series) -> pd.Series:
+    """Parse explorer date strings (or datetimes) to naive UTC timestamps (unparseable -> NaT)"""
+    if pd.api.types.is_datetime64_any_dtype(values):
+        parsed = values if values.dt.tz is not None else values.dt.tz_localize("UTC")
+    else:
+        parsed = pd.to_datetime(values.fillna("").astype(str), errors="coerce", utc=True, format="mixed")
+    return parsed.dt.tz_convert(None).astype("datetime64[ns]")
+
+
+class PriceOracle:
+    """As-of price lookups against an OHLC table, valued at the bar close"""
+
+    def __init__(self, bars: pd.DataFrame, defaults: Optional[Dict[str, float]] = None,
+                 bar_interval: pd.Timedelta = pd.Timedelta(days=1), cache_size: int = 65536):
+        bars = bars.copy()
+        bars["timestamp"] = parse_timestamps(bars["date"])
+        self.bars = bars.dropna(subset=["timestamp"]).sort_values("timestamp")[["symbol", "timestamp", "close"]]
+        self.defaults = dict(DEFAULT_PRICES if defaults is None else defaults)
+        # A bar prices transactions until the next bar is due; older bars are stale
+        self.bar_interval = bar_interval
+        self.price = lru_cache(maxsize=cache_size)(self._price)
+
+    @classmethod
+    def load(cls, path: Union[str, Path] = PRICE_HISTORY_FILE, **kwargs) -> "PriceOracle":
+        """Load an OHLC table from CSV"""
+        bars = pd.read_csv(path, dtype={"symbol": str, "date": str})
+        return cls(bars, **kwargs)
+
+    def _price(self, token_symbol: str, date_str: str) -> float:
+        """Scalar lookup (cached): close of the bar covering date_str, else the symbol default"""
+        prices = self.prices(pd.Series([token_symbol]), pd.Series([date_str]))
+        return float(prices[0])
+
+    def prices(self, symbols: pd.Series, dates: pd.Series, defaults: Optional[Dict[str, float]] = None,
+               aliases: Optional[Dict[str, str]] = None) -> np.ndarray:
+        """
+        Vectorized as-of join: one price per (symbol, date) row; undated rows get the default.
+        aliases maps an export's own symbols onto price series (e.g. {"Ether": "ETH"});
+        it is per caller because exports disagree on which symbols are priceable.
+        """
+        defaults = self.defaults if defaults is None else defaults
+        symbols = symbols.astype(str)
+        if aliases:
+            symbols = symbols.map(lambda s: aliases.get(s, s))
+        frame = pd.DataFrame({
+            "symbol": symbols.to_numpy(),
+            "timestamp": parse_timestamps(dates).to_numpy(),
+            "row": np.arange(len(symbols))
+        })
+
+        result = frame["symbol"].map(defaults).astype("float64").fillna(0.0).to_numpy(copy=True)
+
+        dated = frame.dropna(subset=["timestamp"]).sort_values("timestamp")
+        if len(dated) and len(self.bars):
+            joined = pd.merge_asof(
+                dated, self.bars, on="timestamp", by="symbol",
+                direction="backward", tolerance=self.bar_interval - pd.Timedelta(microseconds=1)
+            )
+            matched = joined.dropna(subset=["close"])
+            result[matched["row"].to_numpy()] = matched["close"].to_numpy()
+
+        return result
+
+    def usd_values(self, amounts: pd.Series, symbols: pd.Series, dates: pd.Series,
+                   defaults: Optional[Dict[str, float]] = None,
+                   aliases: Optional[Dict[str, str]] = None) -> np.ndarray:
+        """Vectorized amount * as-of price, rounded to cents"""
+        amounts = pd.to_numeric(amounts, errors="coerce").fillna(0.0).to_numpy(dtype=np.float64)
+        return np.round(amounts * self.prices(symbols, dates, defaults, aliases), 2)
+
+
+_DEFAULT_ORACLE = None
+
+
+def default_oracle() -> PriceOracle:
+    """Process-wide oracle over the bundled price history"""
+    global _DEFAULT_ORACLE
+    if _DEFAULT_ORACLE is None:
+        _DEFAULT_ORACLE = PriceOracle.load()
+    return _DEFAULT_ORACLE
@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+"""
+Streaming Reader for shadowlens_evidence.json
+Yields evidence_items one at a time in constant memory, with an optional
+byte-offset ID index (persisted next to the file) for random access
+"""
+
+import codecs
+import json
+import re
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+CHUNK_SIZE = 1 << 16
+WHITESPACE = ' \t\n\r'
+MAX_VALUE_CHARS = 64 << 20  # larger single values are treated as malformed input
+
+# Structural characters outside strings, and the characters that matter inside one
+_STRUCTURAL = re.compile(r'[\[\]{}"]')
+_STRING_SPECIAL = re.compile(r'["\\]')
+_SCALAR_END = re.compile(r'[\s,\]}:]')
+
+_decoder = json.JSONDecoder()
+
+
+class _Stream:
+    """Incrementally decoded UTF-8 text buffer that tracks absolute byte offsets"""
+
+    def __init__(self, f, chunk_size: int = CHUNK_SIZE):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.utf8 = codecs.getincrementaldecoder('utf-8')()
+        self.buf = ''
+        self.pos = 0
+        self.base_bytes = 0  # byte offset of buf[0]
+        self.eof = False
+
+    def fill(self) -> bool:
+        """Read another chunk; False at end of file"""
+        if self.eof:
+            return False
+        data = self.f.read(self.chunk_size)
+        if not data:
+            self.eof = True
+            self.buf += self.utf8.decode(b'', final=True)
+            return False
+        self.buf += self.utf8.decode(data)
+        return True
+
+    def compact(self):
+        """Drop consumed text so the buffer stays bounded"""
+        if self.pos:
+            self.base_bytes += len(self.buf[:self.pos].encode('utf-8'))
+            self.buf = self.buf[self.pos:]
+            self.pos = 0
+
+    def byte_offset(self) -> int:
+        return self.base_bytes + len(self.buf[:self.pos].encode('utf-8'))
+
+    def peek(self) -> str:
+        """Next non-whitespace character (consumes the whitespace)"""
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            self.compact()
+            if not self.fill():
+                raise ValueError("Unexpected end of JSON document")
+
+    def expect(self, char: str):
+        if self.peek() != char:
+            raise ValueError(f"Expected {char!r} at byte {self.byte_offset()}, found {self.buf[self.pos]!r}")
+        self.pos += 1
+
+    def _fill_capped(self) -> bool:
+        """fill(), refusing to buffer a single value past MAX_VALUE_CHARS"""
+        if len(self.buf) - self.pos > MAX_VALUE_CHARS:
+            raise ValueError(f"JSON value at byte {self.byte_offset()} exceeds {MAX_VALUE_CHARS} characters")
+        return self.fill()
+
+    def _container_end(self) -> int:
+        """
+        End of the string/array/object starting at the cursor. Scanning resumes where
+        it stopped after each fill, so a value spanning N chunks is scanned once.
+        """
+        buf_pos = self.pos
+        depth, in_string = 0, False
+        while True:
+            buf = self.buf
+            if in_string:
+                m = _STRING_SPECIAL.search(buf, buf_pos)
+                if m is None or m.end() == len(buf) and m.group() == '\\':
+                    buf_pos = len(buf) if m is None else m.start()
+                elif m.group() == '\\':
+                    buf_pos = m.end() + 1  # skip the escaped character
+                    continue
+                else:
+                    in_string = False
+                    buf_pos = m.end()
+                    if depth == 0:
+                        return buf_pos
+                    continue
+            else:
+                m = _STRUCTURAL.search(buf, buf_pos)
+                if m is not None:
+                    char = m.group()
+                    buf_pos = m.end()
+                    if char == '"':
+                        in_string = True
+                    elif char in '[{':
+                        depth += 1
+                    else:
+                        depth -= 1
+                        if depth == 0:
+                            return buf_pos
+                    continue
+                buf_pos = len(buf)
+            if not self._fill_capped():
+                raise ValueError(f"Unexpected end of JSON document in value at byte {self.byte_offset()}")
+
+    def value(self) -> Any:
+        """Decode the next complete JSON value, reading more input as needed"""
+        first = self.peek()
+        self.compact()
+        if first in '"[{':
+            # Find the value's extent first, then decode it exactly once
+            self._container_end()
+            value, self.pos = _decoder.raw_decode(self.buf, self.pos)
+            return value
+        # Numbers and literals end at the next delimiter; make sure it is buffered
+        # ("-2.5e" alone would decode as -2.5)
+        scan_from = self.pos
+        while not self.eof and _SCALAR_END.search(self.buf, scan_from) is None:
+            scan_from = len(self.buf)
+            self._fill_capped()
+        value, self.pos = _decoder.raw_decode(self.buf, self.pos)
+        return value
+
+
+def _iter_object(stream: _Stream) -> Iterator[Tuple[str, int]]:
+    """Yield (key, value byte offset) per member of the object at the cursor; the caller consumes the value"""
+    stream.expect('{')
+    if stream.peek() == '}':
+        stream.pos += 1
+        return
+    while True:
+        key = stream.value()
+        stream.expect(':')
+        stream.peek()
+        yield key, stream.byte_offset()
+        separator = stream.peek()
+        stream.pos += 1
+        if separator == '}':
+            return
+        if separator != ',':
+            raise ValueError(f"Expected ',' or '}}' at byte {stream.byte_offset()}")
+
+
+def _iter_items(stream: _Stream) -> Iterator[Tuple[str, int, int, Dict]]:
+    """Yield (evidence_id, offset, length, item) from an evidence_items object or array"""
+    if stream.peek() == '[':
+        stream.pos += 1
+        index = 0
+        if stream.peek() == ']':
+            stream.pos += 1
+            return
+        while True:
+            offset = stream.byte_offset()
+            item = stream.value()
+            length = stream.byte_offset() - offset
+            evidence_id = item.get('evidence_id', str(index)) if isinstance(item, dict) else str(index)
+            yield evidence_id, offset, length, item
+            index += 1
+            separator = stream.peek()
+            stream.pos += 1
+            if separator == ']':
+                return
+            if separator != ',':
+                raise ValueError(f"Expected ',' or ']' at byte {stream.byte_offset()}")
+    else:
+        for evidence_id, offset in _iter_object(stream):
+            item = stream.value()
+            yield evidence_id, offset, stream.byte_offset() - offset, item
+
+
+def _scan(path: Path, collect_metadata: Optional[Dict] = None) -> Iterator[Tuple[str, int, int, Dict]]:
+    """Walk the top-level document, streaming evidence_items and decoding other keys whole"""
+    with open(path, 'rb') as f:
+        stream = _Stream(f)
+        for key, _ in _iter_object(stream):
+            if key == 'evidence_items':
+                yield from _iter_items(stream)
+            else:
+                value = stream.value()
+                if collect_metadata is not None:
+                    collect_metadata[key] = value
+
+
+def iter_evidence_items(path: Path) -> Iterator[Tuple[str, Dict]]:
+    """Yield (evidence_id, item) for every shadowLens evidence item, one at a time"""
+    for evidence_id, _, _, item in _scan(Path(path)):
+        yield evidence_id, item
+
+
+def iter_members(path: Path, keys, collect_metadata: Optional[Dict] = None) -> Iterator[Tuple[str, str, Any]]:
+    """
+    Yield (top-level key, member key, value) for every member of the named
+    top-level objects (e.g. the admitted/flagged/rejected buckets of
+    validated_evidence.json); other top-level values go to collect_metadata
+    """
+    with open(Path(path), 'rb') as f:
+        stream = _Stream(f)
+        for key, _ in _iter_object(stream):
+            if key in keys and stream.peek() == '{':
+                for member, _ in _iter_object(stream):
+                    yield key, member, stream.value()
+            else:
+                value = stream.value()
+                if collect_metadata is not None:
+                    collect_metadata[key] = value
+
+
+def load_metadata(path: Path) -> Dict:
+    """Top-level keys other than evidence_items (items are streamed past, not kept)"""
+    metadata = {}
+    for _ in _scan(Path(path), collect_metadata=metadata):
+        pass
+    return metadata
+
+
+class EvidenceIndex:
+    """evidence_id -> (byte offset, length) index for random access into the evidence file"""
+
+    def __init__(self, path: Path, index_path: Optional[Path] = None):
+        self.path = Path(path)
+        self.index_path = index_path or self.path.with_name(self.path.name + '.idx.json')
+        self.offsets = self._load_or_build()
+
+    def _fingerprint(self) -> Dict:
+        stat = self.path.stat()
+        return {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+
+    def _load_or_build(self) -> Dict[str, Tuple[int, int]]:
+        fingerprint = self._fingerprint()
+        if self.index_path.exists():
+            try:
+                with open(self.index_path, 'r') as f:
+                    cached = json.load(f)
+                if cached.get('source') == fingerprint:
+                    return {k: tuple(v) for k, v in cached['offsets'].items()}
+            except (json.JSONDecodeError, OSError, KeyError):
+                pass
+
+        offsets = {evidence_id: (offset, length) for evidence_id, offset, length, _ in _scan(self.path)}
+        try:
+            with open(self.index_path, 'w') as f:
+                json.dump({'source': fingerprint, 'offsets': offsets}, f)
+        except OSError as e:
+            print(f"Warning: Could not persist evidence index {self.index_path}: {e}")
+        return offsets
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    def __contains__(self, evidence_id: str) -> bool:
+        return evidence_id in self.offsets
+
+    def ids(self):
+        return self.offsets.keys()
+
+    def get(self, evidence_id: str) -> Optional[Dict]:
+        """Read and decode a single evidence item by ID"""
+        if evidence_id not in self.offsets:
+            return None
+        offset, length = self.offsets[evidence_id]
+        with open(self.path, 'rb') as f:
+            f.seek(offset)
+            return json.loads(f.read(length).decode('utf-8'))
@@ -4,11 +4,17 @@ TIER_Auditor Phase 3 - Final Evidence Validation
 Applies notebook discount (0.5x) and EESystem safeguards
 """
 
+import hashlib
 import json
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List, Any
+from itertools import chain, islice
+from typing import Dict, Iterable, Iterator, List, Any, Optional, Tuple
+
+from shadowlens_reader import iter_evidence_items
 
 # Paths
 BASE_DIR = Path("/Users/breydentaylor/certainly/visualizations")
@@ -20,6 +26,46 @@ NOTEBOOK_DISCOUNT = 0.5  # shadowLens sources count as 0.5x
 TIER2_THRESHOLD = 3.0    # effective sources
 TIER3_THRESHOLD = 2.0    # effective sources
 
+# EESystem safeguard patterns (matched against the lowercased evidence JSON)
+EESYSTEM_PATTERNS = [
+    r'\beesystem\b',
+    r'\benergy enhancement system\b',
+    r'\bdr\.?\s*sandra\s*rose\s*michael\b',
+    r'\bmichael\s*scalar\b'
+]
+TLS_CONTEXT_PATTERNS = [
+    r'\bthe light system\b',
+    r'\btls\b',
+    r'jason.*stole.*testimonial',
+    r'jason.*used.*eesystem.*testimonial',
+    r'fraudulently.*used.*eesystem'
+]
+EESYSTEM_FRAUD_PATTERNS = [
+    r'eesystem.*\b(fraud|scam|pseudoscience|fake)\b',
+    r'\b(fraud|scam|pseudoscience|fake)\b.*eesystem',
+    r'energy enhancement.*\b(fraud|scam|pseudoscience|fake)\b'
+]
+PROTECTIVE_PATTERNS = [
+    r'conflict.*eesystem',
+    r'eesystem.*conflict',
+    r'jason.*defraud.*eesystem',
+    r'eesystem.*victim',
+    r'versus.*eesystem',
+    r'unifyd.*eesystem.*conflict'
+]
+
+_EESYSTEM_RES = [re.compile(p, re.IGNORECASE) for p in EESYSTEM_PATTERNS]
+_TLS_CONTEXT_RES = [re.compile(p, re.IGNORECASE) for p in TLS_CONTEXT_PATTERNS]
+_EESYSTEM_FRAUD_RES = [re.compile(p, re.IGNORECASE) for p in EESYSTEM_FRAUD_PATTERNS]
+_PROTECTIVE_RES = [re.compile(p, re.IGNORECASE) for p in PROTECTIVE_PATTERNS]
+
+# Audit memoisation: bump AUDIT_RULES_REVISION when audit logic changes without
+# touching the thresholds or patterns above (those are hashed automatically)
+AUDIT_RULES_REVISION = '1'
+AUDIT_CACHE_FILE = STATE_DIR / "tier_audit_cache.json"
+PARALLEL_MIN_ITEMS = 500  # fewer cache misses than this (per window) are audited in-process
+AUDIT_WINDOW = 5000       # items hashed/audited per batch, bounding memory while streaming
+
 def load_json(filepath: Path) -> Any:
     """Load JSON file safely"""
     try:
@@ -29,6 +75,33 @@ def load_json(filepath: Path) -> Any:
         print(f"Warning: Could not load {filepath}: {e}")
         return None
 
+def iter_shadowlens_items(filepath: Path) -> Optional[Iterator[Tuple[str, Dict]]]:
+    """Stream shadowLens evidence_items one at a time (None if the file has none or can't be read)"""
+    try:
+        items = iter_evidence_items(filepath)
+        first = next(items, None)
+    except Exception as e:
+        print(f"Warning: Could not load {filepath}: {e}")
+        return None
+    return None if first is None else chain([first], items)
+
+def iter_all_evidence(shadowlens_items: Iterable[Tuple[str, Dict]],
+                      later_sources: Dict[str, Dict]) -> Iterator[Tuple[str, Dict]]:
+    """
+    Streamed shadowLens items followed by the other sources, in the order (and with
+    the precedence) of dict.update over shadowLens then later_sources: a later item
+    with a shadowLens ID takes the shadowLens item's place
+    """
+    seen = set()
+    for evidence_id, evidence in shadowlens_items:
+        if evidence_id in seen:
+            continue
+        seen.add(evidence_id)
+        yield evidence_id, later_sources.get(evidence_id, evidence)
+    for evidence_id, evidence in later_sources.items():
+        if evidence_id not in seen:
+            yield evidence_id, evidence
+
 def save_json(data: Any, filepath: Path):
     """Save JSON with pretty formatting"""
     with open(filepath, 'w') as f:
@@ -118,29 +191,14 @@ def check_eesystem_safeguard(evidence: Dict) -> Dict:
     evidence_str = json.dumps(evidence).lower()
 
     # Check for EESystem mentions
-    eesystem_patterns = [
-        r'\beesystem\b',
-        r'\benergy enhancement system\b',
-        r'\bdr\.?\s*sandra\s*rose\s*michael\b',
-        r'\bmichael\s*scalar\b'
-    ]
-
-    has_eesystem = any(re.search(p, evidence_str, re.IGNORECASE) for p in eesystem_patterns)
+    has_eesystem = any(p.search(evidence_str) for p in _EESYSTEM_RES)
 
     if not has_eesystem:
         return {'violates': False, 'reason': 'No EESystem mention', 'action': 'admit'}
 
     # Check context - is it about Jason's fraud or EESystem's legitimacy?
-    tls_patterns = [
-        r'\bthe light system\b',
-        r'\btls\b',
-        r'jason.*stole.*testimonial',
-        r'jason.*used.*eesystem.*testimonial',
-        r'fraudulently.*used.*eesystem'
-    ]
-
-    # Check if it's about Jason defrauding using EESystem's reputation
-    jason_fraud_context = any(re.search(p, evidence_str, re.IGNORECASE) for p in tls_patterns)
+    # i.e. Jason defrauding using EESystem's reputation
+    jason_fraud_context = any(p.search(evidence_str) for p in _TLS_CONTEXT_RES)
 
     if jason_fraud_context:
         return {
@@ -150,25 +208,10 @@ def check_eesystem_safeguard(evidence: Dict) -> Dict:
         }
 
     # Check for direct critique of EESystem technology
-    eesystem_fraud_patterns = [
-        r'eesystem.*\b(fraud|scam|pseudoscience|fake)\b',
-        r'\b(fraud|scam|pseudoscience|fake)\b.*eesystem',
-        r'energy enhancement.*\b(fraud|scam|pseudoscience|fake)\b'
-    ]
-
-    eesystem_implicated = any(re.search(p, evidence_str, re.IGNORECASE) for p in eesystem_fraud_patterns)
+    eesystem_implicated = any(p.search(evidence_str) for p in _EESYSTEM_FRAUD_RES)
 
     # BUT: Check for protective patterns (conflict, victim, used by Jason)
-    protective_patterns = [
-        r'conflict.*eesystem',
-        r'eesystem.*conflict',
-        r'jason.*defraud.*eesystem',
-        r'eesystem.*victim',
-        r'versus.*eesystem',
-        r'unifyd.*eesystem.*conflict'
-    ]
-
-    is_protective = any(re.search(p, evidence_str, re.IGNORECASE) for p in protective_patterns)
+    is_protective = any(p.search(evidence_str) for p in _PROTECTIVE_RES)
 
     if eesystem_implicated and not is_protective:
         return {
@@ -428,6 +471,117 @@ def audit_evidence(evidence: Dict, evidence_id: str) -> Dict:
 
     return audit
 
+def audit_rules_version() -> str:
+    """Hash of every rule input to audit_evidence; a change invalidates all memoised audits"""
+    rules = {
+        'revision': AUDIT_RULES_REVISION,
+        'notebook_discount': NOTEBOOK_DISCOUNT,
+        'tier2_threshold': TIER2_THRESHOLD,
+        'tier3_threshold': TIER3_THRESHOLD,
+        'patterns': [EESYSTEM_PATTERNS, TLS_CONTEXT_PATTERNS, EESYSTEM_FRAUD_PATTERNS, PROTECTIVE_PATTERNS]
+    }
+    return hashlib.sha256(json.dumps(rules, sort_keys=True).encode('utf-8')).hexdigest()[:16]
+
+def evidence_hash(evidence: Dict) -> str:
+    """Content hash of an evidence item (key order matters: the safeguard regexes see json.dumps order)"""
+    return hashlib.sha256(json.dumps(evidence).encode('utf-8')).hexdigest()
+
+def load_audit_cache(cache_file: Path, rules_version: str) -> Dict[str, Dict]:
+    """evidence_id -> {'hash', 'audit'} from the previous run (empty if the rules changed)"""
+    if not cache_file.exists():
+        return {}
+    try:
+        with open(cache_file, 'r') as f:
+            cache = json.load(f)
+    except (json.JSONDecodeError, OSError) as e:
+        print(f"Warning: Ignoring unreadable audit cache {cache_file}: {e}")
+        return {}
+    if cache.get('rules_version') != rules_version:
+        print("Audit rules changed - re-auditing all evidence")
+        return {}
+    return cache.get('audits', {})
+
+def save_audit_cache(cache_file: Path, rules_version: str, audits: Dict[str, Dict]):
+    """Atomically persist memoised audits (only items seen this run are kept)"""
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = cache_file.with_suffix('.tmp')
+    with open(tmp_file, 'w') as f:
+        json.dump({'rules_version': rules_version, 'audits': audits}, f)
+    os.replace(tmp_file, cache_file)
+
+def _audit_item(args: Tuple[str, Dict]) -> Dict:
+    evidence_id, evidence = args
+    return audit_evidence(evidence, evidence_id)
+
+def iter_audits(evidence_stream: Iterable[Tuple[str, Dict]], cache: Dict[str, Dict], fresh_cache: Dict[str, Dict],
+                max_workers: Optional[int] = None, window: int = AUDIT_WINDOW) -> Iterator[Tuple[str, Dict, Dict]]:
+    """
+    Yield (evidence_id, evidence, audit) in input order, consuming the stream
+    AUDIT_WINDOW items at a time. Items whose content hash matches the cache
+    reuse the memoised audit; the rest are audited (across a process pool when
+    a window has PARALLEL_MIN_ITEMS or more). fresh_cache is filled with this
+    run's entries.
+    """
+    stream = iter(evidence_stream)
+    workers = max_workers or os.cpu_count() or 1
+    pool = None
+    reused = audited = 0
+
+    try:
+        while True:
+            batch = list(islice(stream, window))
+            if not batch:
+                break
+            hashes = [evidence_hash(evidence) for _, evidence in batch]
+            misses = [item for item, digest in zip(batch, hashes)
+                      if cache.get(item[0], {}).get('hash') != digest]
+            reused += len(batch) - len(misses)
+            audited += len(misses)
+
+            if len(misses) >= PARALLEL_MIN_ITEMS and max_workers != 1:
+                if pool is None:
+                    pool = ProcessPoolExecutor(max_workers=workers)
+                fresh_audits = pool.map(_audit_item, misses, chunksize=max(1, len(misses) // (workers * 4)))
+            else:
+                fresh_audits = map(_audit_item, misses)
+
+            for (evidence_id, evidence), digest in zip(batch, hashes):
+                entry = cache.get(evidence_id)
+                if entry is not None and entry.get('hash') == digest:
+                    audit = entry['audit']
+                else:
+                    audit = next(fresh_audits)
+                fresh_cache[evidence_id] = {'hash': digest, 'audit': audit}
+                yield evidence_id, evidence, audit
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    print(f"Memoised audits reused: {reused}, re-audited: {audited}")
+
+class JsonObjectWriter:
+    """
+    Writes a JSON object one member at a time, byte-identical to json.dump(..., indent=2).
+    Members go to a .tmp file that replaces filepath on close(), so a failed run keeps
+    the previous output.
+    """
+
+    def __init__(self, filepath: Path):
+        self.filepath = filepath
+        self.tmp_file = filepath.with_suffix('.tmp')
+        self.f = open(self.tmp_file, 'w')
+        self.count = 0
+
+    def add(self, key: str, value: Any):
+        body = json.dumps(value, indent=2).replace('\n', '\n  ')
+        self.f.write(('{\n  ' if self.count == 0 else ',\n  ') + f"{json.dumps(key)}: {body}")
+        self.count += 1
+
+    def close(self):
+        self.f.write('\n}' if self.count else '{}')
+        self.f.close()
+        os.replace(self.tmp_file, self.filepath)
+        print(f"✓ Saved: {self.filepath}")
+
 def main():
     """Execute Phase 3 TIER audit"""
 
@@ -441,26 +595,23 @@ def main():
     # Load all evidence sources
     print("Loading evidence files...")
 
-    shadowlens = load_json(COORD_DIR / "shadowlens_evidence.json")
+    shadowlens_items = iter_shadowlens_items(COORD_DIR / "shadowlens_evidence.json")
     blockchain = load_json(COORD_DIR / "blockchain_validated_evidence.json")
     validated = load_json(COORD_DIR / "validated_evidence.json")
 
-    if not shadowlens:
+    if shadowlens_items is None:
         print("ERROR: Could not load shadowlens_evidence.json")
         return
 
-    # Aggregate all evidence
-    all_evidence = {}
-
-    # shadowLens evidence (463 items - PRIORITY)
-    if shadowlens and 'evidence_items' in shadowlens:
-        print(f"✓ Loaded {len(shadowlens['evidence_items'])} shadowLens evidence items")
-        all_evidence.update(shadowlens['evidence_items'])
+    # Evidence from the other sources; shadowLens items (463 items - PRIORITY) are
+    # streamed ahead of them during the audit rather than collected here
+    later_evidence = {}
+    print("✓ Streaming shadowLens evidence items")
 
     # Blockchain evidence (1,426 transactions)
     if blockchain and 'evidence_items' in blockchain:
         print(f"✓ Loaded {len(blockchain['evidence_items'])} blockchain evidence items")
-        all_evidence.update(blockchain['evidence_items'])
+        later_evidence.update(blockchain['evidence_items'])
 
     # Phase 2 validated evidence - has structure {admitted: {}, flagged: {}, rejected: {}}
     if validated:
@@ -476,24 +627,23 @@ def main():
                 # Wrap in evidence_id if not present
                 if 'evidence_id' not in item:
                     item['evidence_id'] = eid
-                all_evidence[eid] = item
+                later_evidence[eid] = item
 
         # Add flagged evidence (will be re-evaluated with Phase 3 rules)
         if isinstance(flagged, dict):
             for eid, item in flagged.items():
                 if 'evidence_id' not in item:
                     item['evidence_id'] = eid
-                all_evidence[eid] = item
+                later_evidence[eid] = item
 
-    print(f"\nTotal evidence to audit: {len(all_evidence)}")
     print()
 
     # Audit all evidence
     print("Auditing evidence...")
     print("-" * 80)
 
-    audit_results = []
-    approved_evidence = {}
+    approved_count = 0
+    approved_with_placeholders = 0
     flagged_evidence = []
     rejected_evidence = []
     eesystem_violations = []
@@ -501,9 +651,16 @@ def main():
     tier_stats = {1: 0, 2: 0, 3: 0}
     decision_stats = {}
 
-    for evidence_id, evidence in all_evidence.items():
-        audit = audit_evidence(evidence, evidence_id)
-        audit_results.append(audit)
+    # Approved evidence is streamed to disk as it is audited
+    rules_version = audit_rules_version()
+    cache = load_audit_cache(AUDIT_CACHE_FILE, rules_version)
+    fresh_cache = {}
+    approved_writer = JsonObjectWriter(COORD_DIR / "approved_evidence_list.json")
+
+    total_evidence = 0
+    for evidence_id, evidence, audit in iter_audits(iter_all_evidence(shadowlens_items, later_evidence),
+                                                    cache, fresh_cache):
+        total_evidence += 1
 
         # Track decision
         decision = audit['decision']
@@ -511,7 +668,7 @@ def main():
 
         # Route evidence based on decision
         if audit['approved']:
-            approved_evidence[evidence_id] = {
+            approved_writer.add(evidence_id, {
                 'evidence': evidence,
                 'audit': {
                     'approved': True,
@@ -520,7 +677,10 @@ def main():
                     'sources': audit['validation_checks'].get('sources', {}),
                     'decision': decision
                 }
-            }
+            })
+            approved_count += 1
+            if audit.get('validation_checks', {}).get('placeholders', {}).get('found', False):
+                approved_with_placeholders += 1
             tier_stats[audit['actual_tier']] = tier_stats.get(audit['actual_tier'], 0) + 1
 
         elif decision == 'FLAGGED' or decision == 'FLAGGED_LEGAL_REVIEW':
@@ -546,15 +706,18 @@ def main():
                     'evidence_snippet': str(evidence)[:500]
                 })
 
+    approved_writer.close()
+    save_audit_cache(AUDIT_CACHE_FILE, rules_version, fresh_cache)
+
     # Generate summary
     print()
     print("=" * 80)
     print("AUDIT SUMMARY")
     print("=" * 80)
-    print(f"Total Evidence Audited: {len(all_evidence)}")
-    print(f"  ✓ Approved: {len(approved_evidence)} ({len(approved_evidence)/len(all_evidence)*100:.1f}%)")
-    print(f"  ⚠  Flagged: {len(flagged_evidence)} ({len(flagged_evidence)/len(all_evidence)*100:.1f}%)")
-    print(f"  ✗ Rejected: {len(rejected_evidence)} ({len(rejected_evidence)/len(all_evidence)*100:.1f}%)")
+    print(f"Total Evidence Audited: {total_evidence}")
+    print(f"  ✓ Approved: {approved_count} ({approved_count/total_evidence*100:.1f}%)")
+    print(f"  ⚠  Flagged: {len(flagged_evidence)} ({len(flagged_evidence)/total_evidence*100:.1f}%)")
+    print(f"  ✗ Rejected: {len(rejected_evidence)} ({len(rejected_evidence)/total_evidence*100:.1f}%)")
     print()
     print("Approved Evidence by TIER:")
     print(f"  TIER 1: {tier_stats.get(1, 0)}")
@@ -571,15 +734,14 @@ def main():
     # Save outputs
     print("Saving output files...")
 
-    # 1. Approved evidence list
-    save_json(approved_evidence, COORD_DIR / "approved_evidence_list.json")
+    # 1. Approved evidence list (already streamed to approved_evidence_list.json)
 
     # 2. Full audit report
     audit_report = {
         'run_id': 'cert1-phase3-shadowlens-20251121',
         'audit_date': datetime.now(timezone.utc).isoformat(),
-        'total_evidence': len(all_evidence),
-        'validation_passed': len(approved_evidence),
+        'total_evidence': total_evidence,
+        'validation_passed': approved_count,
         'validation_flagged': len(flagged_evidence),
         'validation_rejected': len(rejected_evidence),
         'tier_distribution': {
@@ -597,12 +759,9 @@ def main():
         'rejected_items': rejected_evidence[:50],
         'eesystem_violations_count': len(eesystem_violations),
         'success_criteria': {
-            'total_approved_150_plus': len(approved_evidence) >= 150,
+            'total_approved_150_plus': approved_count >= 150,
             'all_tier1_valid': tier_stats.get(1, 0) > 0,
-            'zero_placeholders': all(
-                not audit.get('validation_checks', {}).get('placeholders', {}).get('found', False)
-                for audit in audit_results if audit.get('approved')
-            ),
+            'zero_placeholders': approved_with_placeholders == 0,
             'eesystem_violations_zero': len(eesystem_violations) == 0
         }
     }
@@ -628,8 +787,8 @@ def main():
         'status': 'completed',
         'phase': 'HANDOFF',
         'last_updated': datetime.now(timezone.utc).isoformat(),
-        'evidence_audited': len(all_evidence),
-        'evidence_approved': len(approved_evidence),
+        'evidence_audited': total_evidence,
+        'evidence_approved': approved_count,
         'evidence_flagged': len(flagged_evidence),
         'evidence_rejected': len(rejected_evidence),
         'outputs': [
@@ -5,46 +5,34 @@ Analyzes deep-crawl-results.ndjson and classifies platforms, detects Light Syste
 flags fraud indicators, and generates fraud scores.
 """
 
+import csv
+import heapq
 import json
-import re
-import pandas as pd
+import sys
+from collections import Counter
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, Iterable, Iterator, List, Any, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from pattern_bank import BANK, URL_FRAUD_KEYWORD_WEIGHTS, Hit, normalize
 
 # File paths
 INPUT_FILE = "/Users/breydentaylor/certainly/shurka-dump/recon_intel/harvest/deep-crawl-results.ndjson"
 OUTPUT_FILE = "/Users/breydentaylor/certainly/visualizations/url_classifications.csv"
+TOP_OUTPUT_FILE = "/Users/breydentaylor/certainly/visualizations/url_classifications_top50.csv"
+
+# Number of highest-scoring URLs kept for the top report
+TOP_K = 50
 
-# Fraud indicator keywords
-FRAUD_KEYWORDS = {
-    'quantum': 3,
-    'healing': 2,
-    'fda': 3,
-    'frequency': 2,
-    'energy': 1,
-    'cure': 3,
-    'miracle': 3,
-    'certified': 2,
-    'approved': 2,
-    'medical': 2,
-    'doctor': 1,
-    'therapy': 1,
-    'treatment': 2,
-    'disease': 2,
-    'cancer': 3,
-    'pain': 1,
-    'revolutionary': 2,
-    'breakthrough': 2,
-    'scientifically': 2,
-    'clinically': 2,
-}
-
-# Pricing patterns
-PRICE_PATTERNS = [
-    r'\$\s*(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)\s*k',  # $25k, $50k
-    r'\$\s*(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)',      # $25000, $50,000
+# CSV column order (matches the keys returned by analyze_url)
+OUTPUT_COLUMNS = [
+    'url', 'post_id', 'platform', 'light_system_mention', 'fraud_keywords',
+    'fraud_score', 'tier_recommendation', 'pricing_claims', 'status',
 ]
 
+# Fraud indicator keywords (keyword -> weight), shared with the pattern bank
+FRAUD_KEYWORDS = URL_FRAUD_KEYWORD_WEIGHTS
+
 
 def classify_platform(url: str, record_type: str) -> str:
     """Classify the platform based on URL and type."""
@@ -88,52 +76,49 @@ def extract_text_content(data: Dict) -> str:
     return ' '.join(text_parts).lower()
 
 
-def detect_light_system_mention(text: str, url: str) -> bool:
-    """Detect if Light System is mentioned in content or URL."""
-    patterns = [
-        r'\blight\s+system\b',
-        r'\bthe\s+light\s+system\b',
-        r'\btls\b',
-        r'thelightsystems\.com',
-        r'tlsmarketplace',
-    ]
+def scan_record(text: str, url: str) -> Dict[str, List[Hit]]:
+    """Normalise a record once and run every URL detector over it."""
+    combined = normalize(text, url)
+    hits = BANK.match(combined, ('light_system', 'url_fraud_keyword'))
+    # Pricing claims only count in the scraped text: the match is bounded at its end,
+    # so a trailing "k" can't be borrowed from the URL
+    hits['url_price'] = BANK.scan('url_price', combined, endpos=len(text))
+    return hits
 
-    combined = (text + ' ' + url).lower()
 
-    for pattern in patterns:
-        if re.search(pattern, combined):
-            return True
-
-    return False
+def detect_light_system_mention(text: str, url: str, hits: Dict[str, List[Hit]] = None) -> bool:
+    """Detect if Light System is mentioned in content or URL."""
+    if hits is None:
+        return bool(BANK.scan('light_system', normalize(text, url), limit=1))
+    return bool(hits['light_system'])
 
 
-def find_fraud_keywords(text: str, url: str) -> List[str]:
+def find_fraud_keywords(text: str, url: str, hits: Dict[str, List[Hit]] = None) -> List[str]:
     """Find fraud indicator keywords in text and URL."""
-    combined = (text + ' ' + url).lower()
-    found_keywords = []
-
-    for keyword in FRAUD_KEYWORDS.keys():
-        if re.search(r'\b' + keyword + r'\b', combined):
-            found_keywords.append(keyword)
+    if hits is None:
+        hits = {'url_fraud_keyword': BANK.scan('url_fraud_keyword', normalize(text, url))}
+    found = {hit.index: hit.label for hit in hits['url_fraud_keyword']}
+    return [found[index] for index in sorted(found)]
 
-    return found_keywords
 
-
-def extract_pricing(text: str) -> List[str]:
+def extract_pricing(text: str, hits: Dict[str, List[Hit]] = None) -> List[str]:
     """Extract pricing claims from text."""
+    if hits is None:
+        hits = {'url_price': BANK.scan('url_price', text)}
+
+    # "$25k"-style claims first, then every dollar amount (as before the pattern bank)
+    suffixed = [hit for hit in hits['url_price'] if hit.text.rstrip().lower().endswith('k')]
     prices = []
 
-    for pattern in PRICE_PATTERNS:
-        matches = re.findall(pattern, text, re.IGNORECASE)
-        for match in matches:
-            # Clean and convert
-            price_str = match.replace(',', '')
-            try:
-                price_val = float(price_str)
-                if price_val >= 1000:  # Only flag high prices
-                    prices.append(f"${match}")
-            except ValueError:
-                continue
+    for hit in suffixed + hits['url_price']:
+        # Clean and convert
+        price_str = hit.value.replace(',', '')
+        try:
+            price_val = float(price_str)
+            if price_val >= 1000:  # Only flag high prices
+                prices.append(f"${hit.value}")
+        except ValueError:
+            continue
 
     return prices
 
@@ -212,14 +197,17 @@ def analyze_url(record: Dict) -> Dict:
     # Platform classification
     platform = classify_platform(url, record_type)
 
+    # One normalisation + pattern bank pass for all detectors
+    hits = scan_record(text, url)
+
     # Light System detection
-    light_system_mention = detect_light_system_mention(text, url)
+    light_system_mention = detect_light_system_mention(text, url, hits)
 
     # Fraud keyword detection
-    fraud_keywords = find_fraud_keywords(text, url)
+    fraud_keywords = find_fraud_keywords(text, url, hits)
 
     # Pricing extraction
-    pricing = extract_pricing(text)
+    pricing = extract_pricing(text, hits)
 
     # Calculate fraud score
     fraud_score = calculate_fraud_score(
@@ -246,69 +234,138 @@ def analyze_url(record: Dict) -> Dict:
     }
 
 
-def main():
-    """Main processing function."""
-    print("Starting URL analysis...")
-    print(f"Input file: {INPUT_FILE}")
-    print(f"Output file: {OUTPUT_FILE}")
-
-    # Read NDJSON file
-    records = []
-    with open(INPUT_FILE, 'r', encoding='utf-8') as f:
+def iter_records(input_file: str) -> Iterator[Dict]:
+    """Stream records from an NDJSON file one line at a time."""
+    with open(input_file, 'r', encoding='utf-8') as f:
         for i, line in enumerate(f, 1):
+            if not line.strip():
+                continue
             try:
-                record = json.loads(line.strip())
-                records.append(record)
+                yield json.loads(line)
             except json.JSONDecodeError as e:
                 print(f"Error parsing line {i}: {e}")
                 continue
 
-    print(f"Loaded {len(records)} records")
 
-    # Analyze all URLs
-    results = []
+def analyze_records(records: Iterable[Dict]) -> Iterator[Dict]:
+    """Lazily analyze a stream of URL records."""
     for i, record in enumerate(records, 1):
         if i % 100 == 0:
-            print(f"Processing record {i}/{len(records)}...")
-
-        result = analyze_url(record)
-        results.append(result)
+            print(f"Processing record {i}...")
+        yield analyze_url(record)
+
+
+class AnalysisSummary:
+    """Constant-memory running statistics and top-K tracker for analyzed URLs."""
+
+    def __init__(self, top_k: int = TOP_K):
+        self.top_k = top_k
+        self.total = 0
+        self.platforms = Counter()
+        self.tiers = Counter()
+        self.light_system_mentions = 0
+        self.score_histogram = Counter()
+        self.score_sum = 0
+        # Min-heap of (fraud_score, -sequence, row); the sequence keeps ties in input order
+        self._heap: List[Tuple[int, int, Dict]] = []
+
+    def add(self, row: Dict):
+        score = row['fraud_score']
+        self.total += 1
+        self.platforms[row['platform']] += 1
+        self.tiers[row['tier_recommendation']] += 1
+        self.light_system_mentions += int(bool(row['light_system_mention']))
+        self.score_histogram[score] += 1
+        self.score_sum += score
+
+        entry = (score, -self.total, row)
+        if len(self._heap) < self.top_k:
+            heapq.heappush(self._heap, entry)
+        elif entry[:2] > self._heap[0][:2]:
+            heapq.heapreplace(self._heap, entry)
+
+    def top(self) -> List[Dict]:
+        """Top-K rows by fraud score, descending."""
+        return [row for _, _, row in sorted(self._heap, key=lambda e: e[:2], reverse=True)]
+
+    @property
+    def mean(self) -> float:
+        return self.score_sum / self.total if self.total else 0.0
+
+    @property
+    def median(self) -> float:
+        """Exact median from the integer score histogram."""
+        if not self.total:
+            return 0.0
+        lower_rank = (self.total - 1) // 2
+        upper_rank = self.total // 2
+        lower = upper = None
+        seen = 0
+        for score in sorted(self.score_histogram):
+            seen += self.score_histogram[score]
+            if lower is None and seen > lower_rank:
+                lower = score
+            if seen > upper_rank:
+                upper = score
+                break
+        return (lower + upper) / 2
+
+
+def write_rows(rows: Iterable[Dict], output_file: str, summary: AnalysisSummary) -> AnalysisSummary:
+    """Write analyzed rows to CSV incrementally while accumulating the summary."""
+    with open(output_file, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=OUTPUT_COLUMNS)
+        writer.writeheader()
+        for row in rows:
+            writer.writerow(row)
+            summary.add(row)
+    return summary
 
-    # Create DataFrame
-    df = pd.DataFrame(results)
 
-    # Sort by fraud score (descending)
-    df = df.sort_values('fraud_score', ascending=False)
+def main():
+    """Main processing function."""
+    print("Starting URL analysis...")
+    print(f"Input file: {INPUT_FILE}")
+    print(f"Output file: {OUTPUT_FILE}")
 
-    # Save to CSV
-    df.to_csv(OUTPUT_FILE, index=False)
+    # Stream records -> analysis -> CSV, keeping only running stats and the top K
+    summary = write_rows(analyze_records(iter_records(INPUT_FILE)), OUTPUT_FILE, AnalysisSummary())
     print(f"\nCSV saved to: {OUTPUT_FILE}")
 
+    top_rows = summary.top()
+    with open(TOP_OUTPUT_FILE, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=OUTPUT_COLUMNS)
+        writer.writeheader()
+        writer.writerows(top_rows)
+    print(f"Top {len(top_rows)} CSV saved to: {TOP_OUTPUT_FILE}")
+
     # Generate statistics
     print("\n" + "="*80)
     print("ANALYSIS SUMMARY")
     print("="*80)
 
-    print(f"\nTotal URLs analyzed: {len(df)}")
+    print(f"\nTotal URLs analyzed: {summary.total}")
     print(f"\nPlatform distribution:")
-    print(df['platform'].value_counts())
+    for platform, count in summary.platforms.most_common():
+        print(f"  {platform:<12} {count}")
 
-    print(f"\nLight System mentions: {df['light_system_mention'].sum()}")
+    print(f"\nLight System mentions: {summary.light_system_mentions}")
 
     print(f"\nTier distribution:")
-    print(df['tier_recommendation'].value_counts().sort_index())
+    for tier in sorted(summary.tiers):
+        print(f"  Tier {tier}: {summary.tiers[tier]}")
 
-    print(f"\nFraud score statistics:")
-    print(f"  Mean: {df['fraud_score'].mean():.2f}")
-    print(f"  Median: {df['fraud_score'].median():.2f}")
-    print(f"  Max: {df['fraud_score'].max()}")
-    print(f"  Min: {df['fraud_score'].min()}")
+    if summary.total:
+        print(f"\nFraud score statistics:")
+        print(f"  Mean: {summary.mean:.2f}")
+        print(f"  Median: {summary.median:.2f}")
+        print(f"  Max: {max(summary.score_histogram)}")
+        print(f"  Min: {min(summary.score_histogram)}")
 
     print(f"\nTop 10 most fraudulent URLs:")
     print("="*80)
 
-    top_10 = df.head(10)
-    for idx, row in top_10.iterrows():
+    for row in top_rows[:10]:
         print(f"\n{row['fraud_score']:.0f} | {row['platform'].upper()} | Tier {row['tier_recommendation']}")
         print(f"    {row['url'][:100]}")
         if row['fraud_keywords']:
@@ -317,11 +374,11 @@ def main():
             print(f"    ⚠️  Light System mention detected")
 
     print("\n" + "="*80)
-    print(f"Top 50 URLs by fraud score have been flagged in the CSV")
+    print(f"Top {TOP_K} URLs by fraud score have been written to {TOP_OUTPUT_FILE}")
     print("="*80)
 
-    return df
+    return summary
 
 
 if __name__ == '__main__':
-    df = main()
+    summary = main()
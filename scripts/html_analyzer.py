@@ -5,26 +5,12 @@ Generates word frequency data for word cloud visualization
 """
 
 import json
-import re
 from collections import Counter, defaultdict
 from pathlib import Path
 import sys
 
-# Prosecution indicators and keywords
-INDICATOR_CATEGORIES = {
-    'fraud': ['scam', 'fraud', 'fake', 'stolen', 'laundering', 'launder', 'ponzi',
-              'scheme', 'deceptive', 'misleading', 'counterfeit', 'forged', 'embezzle'],
-    'victim': ['victim', 'complaint', 'loss', 'frozen', 'seized', 'damaged',
-               'harmed', 'affected', 'plaintiff', 'claimant', 'injured'],
-    'money': ['usd', 'btc', 'eth', 'usdt', 'wallet', 'crypto', 'cryptocurrency',
-              'bitcoin', 'ethereum', 'tether', 'payment', 'transaction', 'transfer'],
-    'entity': ['jason', 'shurka', 'unifyd', 'tls', 'ray', 'havakok', 'gadish',
-               'sig', 'signature', 'investment', 'group'],
-    'legal': ['court', 'judge', 'lawsuit', 'indictment', 'prosecution', 'evidence',
-              'testimony', 'subpoena', 'warrant', 'conviction', 'charges', 'rico'],
-    'criminal': ['conspiracy', 'racketeering', 'organized', 'crime', 'criminal',
-                 'illegal', 'unlawful', 'violation', 'offense', 'felony']
-}
+# Prosecution indicators and keywords (shared pattern bank)
+from pattern_bank import INDICATOR_CATEGORIES, INDICATOR_WORD_CATEGORY, NON_WORD_RE, WHITESPACE_RE
 
 # Define 8 logical chunk categories based on prosecution case structure
 CHUNK_CATEGORIES = {
@@ -43,9 +29,9 @@ def clean_text(text):
     # Convert to lowercase
     text = text.lower()
     # Remove special characters and emojis
-    text = re.sub(r'[^\w\s-]', ' ', text)
+    text = NON_WORD_RE.sub(' ', text)
     # Remove extra whitespace
-    text = re.sub(r'\s+', ' ', text)
+    text = WHITESPACE_RE.sub(' ', text)
     return text.strip()
 
 def is_meaningful_word(word):
@@ -67,11 +53,7 @@ def is_meaningful_word(word):
 
 def categorize_word(word):
     """Categorize word by indicator type"""
-    word_lower = word.lower()
-    for category, keywords in INDICATOR_CATEGORIES.items():
-        if word_lower in keywords:
-            return category
-    return 'other'
+    return INDICATOR_WORD_CATEGORY.get(word.lower(), 'other')
 
 def extract_word_frequencies(chunks, chunk_range=None):
     """Extract word frequencies from chunks"""
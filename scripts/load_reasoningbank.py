@@ -2,10 +2,17 @@
 """
 ReasoningBank_Manager - Load approved evidence into memory.db
 Phase 3, Agent 7/9 - RICO evidence processing pipeline
+
+Usage: load_reasoningbank.py [--json-columns]
+  --json-columns  also add indexed JSON1 generated columns to claude-flow's patterns table
+                  (off by default: only the evidence_* side tables are created)
 """
 
+import hashlib
 import json
 import sqlite3
+import sys
+from contextlib import contextmanager
 from pathlib import Path
 from datetime import datetime
 from collections import defaultdict
@@ -19,9 +26,64 @@ STATE_FILE = BASE_DIR / "state/reasoningbank_manager.state.json"
 MEMORY_DIR = BASE_DIR / "memory"
 COORDINATION_DIR = BASE_DIR / "coordination"
 
-# Ensure directories exist
-MEMORY_DIR.mkdir(exist_ok=True)
-COORDINATION_DIR.mkdir(exist_ok=True)
+# Bulk load tuning
+BULK_BATCH_SIZE = 5000     # rows per executemany call
+BULK_CACHE_SIZE_KB = 65536  # page cache during the load (PRAGMA cache_size is negative for KiB)
+
+# Reused stdlib encoder: same bytes as json.dumps(obj), so stored rows and content hashes
+# don't depend on which optional packages are installed
+_json_encoder = json.JSONEncoder()
+
+# Normalised evidence side tables (populated alongside patterns by load_evidence_to_db)
+EVIDENCE_SCHEMA = [
+    """CREATE TABLE IF NOT EXISTS evidence_items (
+        evidence_id TEXT PRIMARY KEY,
+        tier INTEGER,
+        type TEXT,
+        category TEXT,
+        corpus_count INTEGER,
+        notebook_count INTEGER,
+        temporal_anchor TEXT,
+        source_file TEXT,
+        content_hash TEXT
+    )""",
+    """CREATE TABLE IF NOT EXISTS evidence_principals (
+        evidence_id TEXT NOT NULL,
+        principal TEXT NOT NULL,
+        PRIMARY KEY (evidence_id, principal)
+    ) WITHOUT ROWID""",
+    """CREATE TABLE IF NOT EXISTS evidence_predicates (
+        evidence_id TEXT NOT NULL,
+        predicate TEXT NOT NULL,
+        PRIMARY KEY (evidence_id, predicate)
+    ) WITHOUT ROWID""",
+    """CREATE TABLE IF NOT EXISTS evidence_sources (
+        evidence_id TEXT NOT NULL,
+        source TEXT NOT NULL,
+        kind TEXT NOT NULL,
+        PRIMARY KEY (evidence_id, source, kind)
+    ) WITHOUT ROWID""",
+    "CREATE INDEX IF NOT EXISTS idx_evidence_items_tier ON evidence_items(tier, category)",
+    "CREATE INDEX IF NOT EXISTS idx_evidence_items_source_file ON evidence_items(source_file)",
+    "CREATE INDEX IF NOT EXISTS idx_evidence_principals_principal ON evidence_principals(principal, evidence_id)",
+    "CREATE INDEX IF NOT EXISTS idx_evidence_predicates_predicate ON evidence_predicates(predicate, evidence_id)",
+    "CREATE INDEX IF NOT EXISTS idx_evidence_sources_source ON evidence_sources(source, evidence_id)",
+    # What each approved-list item (rejected ones included) last contributed to entity_to_evidence_map
+    """CREATE TABLE IF NOT EXISTS evidence_xref_items (
+        evidence_id TEXT PRIMARY KEY,
+        xref_hash TEXT NOT NULL,
+        principals TEXT NOT NULL
+    )""",
+]
+
+# Optional JSON1 generated columns on patterns: column -> pattern_data path
+PATTERN_JSON_COLUMNS = {
+    'evidence_tier': '$.tier',
+    'evidence_category': '$.category',
+    'evidence_source_file': '$.source_file',
+}
+
+EVIDENCE_SIDE_TABLES = ('evidence_principals', 'evidence_predicates', 'evidence_sources')
 
 def initialize_database():
     """Connect to existing database"""
@@ -29,6 +91,175 @@ def initialize_database():
     # Database already exists with claude-flow schema
     return conn
 
+def encode_json(obj) -> str:
+    """Serialise pattern_data exactly as json.dumps(obj) would"""
+    return _json_encoder.encode(obj)
+
+@contextmanager
+def bulk_load_pragmas(conn):
+    """
+    WAL journaling, relaxed fsync and a larger page cache for the duration of a bulk load.
+    Everything written inside the block is one transaction: committed at the end, rolled back on error.
+    """
+    conn.commit()  # journal_mode cannot change inside a transaction
+    cursor = conn.cursor()
+    journal_mode = cursor.execute("PRAGMA journal_mode").fetchone()[0]
+    synchronous = cursor.execute("PRAGMA synchronous").fetchone()[0]
+    cache_size = cursor.execute("PRAGMA cache_size").fetchone()[0]
+
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute(f"PRAGMA cache_size=-{BULK_CACHE_SIZE_KB}")
+    cursor.execute("BEGIN")  # explicit, so index DDL before the first write is inside it too
+    try:
+        yield conn
+        conn.commit()
+    except BaseException:
+        conn.rollback()
+        raise
+    finally:
+        cursor.execute(f"PRAGMA cache_size={cache_size}")
+        cursor.execute(f"PRAGMA synchronous={synchronous}")
+        if journal_mode.lower() != 'wal':
+            try:
+                cursor.execute(f"PRAGMA journal_mode={journal_mode}")
+            except sqlite3.OperationalError as e:
+                # Another connection holds the database open; WAL stays on
+                print(f"Warning: Could not restore journal_mode={journal_mode}: {e}")
+
+def drop_secondary_indexes(conn, table='patterns'):
+    """Drop a table's explicit indexes, returning their CREATE statements for rebuild_indexes"""
+    cursor = conn.cursor()
+    indexes = cursor.execute("""
+        SELECT name, sql FROM sqlite_master
+        WHERE type = 'index' AND tbl_name = ? AND sql IS NOT NULL
+    """, (table,)).fetchall()
+    for name, _ in indexes:
+        cursor.execute(f'DROP INDEX IF EXISTS "{name}"')
+    return [sql for _, sql in indexes]
+
+def rebuild_indexes(conn, index_sql):
+    """Recreate indexes dropped by drop_secondary_indexes (one sorted build each)"""
+    cursor = conn.cursor()
+    for sql in index_sql:
+        cursor.execute(sql)
+
+def executemany_batched(conn, sql, rows, batch_size=BULK_BATCH_SIZE):
+    """executemany in batch_size slices inside the caller's transaction (the caller commits)"""
+    cursor = conn.cursor()
+    for start in range(0, len(rows), batch_size):
+        cursor.executemany(sql, rows[start:start + batch_size])
+
+def insert_patterns(conn, rows, batch_size=BULK_BATCH_SIZE):
+    """INSERT OR REPLACE (id, type, pattern_data, confidence, usage_count) rows in batches"""
+    executemany_batched(conn, """
+        INSERT OR REPLACE INTO patterns (id, type, pattern_data, confidence, usage_count)
+        VALUES (?, ?, ?, ?, ?)
+    """, rows, batch_size)
+
+def initialize_evidence_tables(conn, json_columns=False):
+    """Create the evidence side tables; json_columns also adds indexed JSON1 columns to patterns"""
+    cursor = conn.cursor()
+    for statement in EVIDENCE_SCHEMA:
+        cursor.execute(statement)
+    # Tables created before change detection lack the hash column
+    if 'content_hash' not in {row[1] for row in cursor.execute("PRAGMA table_info(evidence_items)")}:
+        cursor.execute("ALTER TABLE evidence_items ADD COLUMN content_hash TEXT")
+    conn.commit()
+
+    if not json_columns:
+        return
+    existing = {row[1] for row in cursor.execute("PRAGMA table_xinfo(patterns)")}
+    try:
+        for column, path in PATTERN_JSON_COLUMNS.items():
+            if column not in existing:
+                cursor.execute(f"""
+                    ALTER TABLE patterns ADD COLUMN {column} GENERATED ALWAYS AS (
+                        CASE WHEN json_valid(pattern_data) THEN json_extract(pattern_data, '{path}') END
+                    ) VIRTUAL
+                """)
+            cursor.execute(f"CREATE INDEX IF NOT EXISTS idx_patterns_{column} ON patterns({column})")
+        conn.commit()
+    except sqlite3.OperationalError as e:
+        # Generated columns need SQLite 3.31+ with JSON1
+        conn.rollback()
+        print(f"⚠️  JSON1 generated columns unavailable, side tables only: {e}")
+
+def content_hash(pattern_json):
+    """Change-detection hash of an item's serialised pattern_data"""
+    return hashlib.sha256(pattern_json.encode('utf-8')).hexdigest()
+
+def evidence_side_rows(evidence_id, evidence_type, tier, category, item, metadata, sources, digest):
+    """Rows for evidence_items and the principal/predicate/source link tables"""
+    source_file = metadata.get('source_file', None)
+    item_row = (
+        evidence_id, tier, evidence_type, category,
+        sources.get('corpus_count', 0), sources.get('notebook_count', 0),
+        metadata.get('temporal_anchor', None), source_file, digest
+    )
+    principals = [(evidence_id, p) for p in dict.fromkeys(metadata.get('principals_exposed', []))]
+    predicates = [(evidence_id, p) for p in dict.fromkeys(metadata.get('rico_predicate', []))]
+    source_rows = [(evidence_id, source_file, 'source_file')] if source_file else []
+    corpus_sources = (item.get('validation') or {}).get('corpus_sources') or []
+    source_rows += [(evidence_id, str(s), 'corpus') for s in dict.fromkeys(corpus_sources)]
+    return item_row, principals, predicates, source_rows
+
+def insert_evidence_tables(conn, item_rows, principal_rows, predicate_rows, source_rows,
+                           batch_size=BULK_BATCH_SIZE):
+    """Replace the side-table rows of every loaded evidence item"""
+    ids = [(row[0],) for row in item_rows]
+    for table in EVIDENCE_SIDE_TABLES:
+        executemany_batched(conn, f"DELETE FROM {table} WHERE evidence_id = ?", ids, batch_size)
+    executemany_batched(conn, "INSERT OR REPLACE INTO evidence_items VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                        item_rows, batch_size)
+    executemany_batched(conn, "INSERT OR IGNORE INTO evidence_principals VALUES (?, ?)", principal_rows, batch_size)
+    executemany_batched(conn, "INSERT OR IGNORE INTO evidence_predicates VALUES (?, ?)", predicate_rows, batch_size)
+    executemany_batched(conn, "INSERT OR IGNORE INTO evidence_sources VALUES (?, ?, ?)", source_rows, batch_size)
+
+def delete_evidence(conn, evidence_ids, batch_size=BULK_BATCH_SIZE):
+    """Remove evidence items from patterns and every side table"""
+    ids = [(evidence_id,) for evidence_id in evidence_ids]
+    executemany_batched(conn, "DELETE FROM patterns WHERE id = ?", ids, batch_size)
+    for table in ('evidence_items', *EVIDENCE_SIDE_TABLES):
+        executemany_batched(conn, f"DELETE FROM {table} WHERE evidence_id = ?", ids, batch_size)
+
+def query_evidence(conn, tier=None, principal=None, predicate=None, source=None, category=None,
+                   include_data=False):
+    """
+    Indexed evidence lookup over the side tables, e.g.
+    query_evidence(conn, tier=1, principal='Jason Shurka', predicate='Wire Fraud').
+    Returns evidence IDs, or (evidence_id, pattern_data dict) pairs with include_data.
+    """
+    joins, where, params = [], [], []
+    if principal is not None:
+        joins.append("JOIN evidence_principals p ON p.evidence_id = e.evidence_id AND p.principal = ?")
+        params.append(principal)
+    if predicate is not None:
+        joins.append("JOIN evidence_predicates r ON r.evidence_id = e.evidence_id AND r.predicate = ?")
+        params.append(predicate)
+    if include_data:
+        joins.append("JOIN patterns pt ON pt.id = e.evidence_id")
+    if tier is not None:
+        where.append("e.tier = ?")
+        params.append(tier)
+    if category is not None:
+        where.append("e.category = ?")
+        params.append(category)
+    if source is not None:
+        where.append("EXISTS (SELECT 1 FROM evidence_sources s WHERE s.source = ? AND s.evidence_id = e.evidence_id)")
+        params.append(source)
+
+    columns = "e.evidence_id, pt.pattern_data" if include_data else "e.evidence_id"
+    sql = f"SELECT {columns} FROM evidence_items e {' '.join(joins)}"
+    if where:
+        sql += " WHERE " + " AND ".join(where)
+    sql += " ORDER BY e.evidence_id"
+
+    rows = conn.execute(sql, params).fetchall()
+    if include_data:
+        return [(evidence_id, json.loads(data)) for evidence_id, data in rows]
+    return [row[0] for row in rows]
+
 def check_current_evidence_count(conn):
     """Check how many evidence items are already in database"""
     cursor = conn.cursor()
@@ -79,9 +310,19 @@ def validate_evidence_item(item):
 
     return True, "OK"
 
-def load_evidence_to_db(conn, evidence_list):
-    """Load all evidence items to ReasoningBank"""
-    cursor = conn.cursor()
+def load_evidence_to_db(conn, evidence_list, batch_size=BULK_BATCH_SIZE, rebuild_secondary_indexes=False,
+                        incremental=False):
+    """
+    Load all evidence items to ReasoningBank in bulk: rows are prepared first, then
+    written with executemany in batches under WAL. With rebuild_secondary_indexes
+    the patterns and side-table indexes are dropped for the load and rebuilt once afterwards.
+    The evidence side tables (see initialize_evidence_tables) are filled in the same pass.
+
+    With incremental, items whose content hash matches the stored one are skipped and
+    items no longer approved are deleted; stats['delta'] records what changed. The whole
+    delta (deletes, patterns, side tables) is a single transaction, so a crash leaves the
+    previous load intact and the next run sees the same delta again.
+    """
 
     stats = {
         'loaded': 0,
@@ -94,6 +335,11 @@ def load_evidence_to_db(conn, evidence_list):
     }
 
     rejections = []
+    rows = []
+    item_rows, principal_rows, predicate_rows, source_rows = [], [], [], []
+    stored_hashes = dict(conn.execute("SELECT evidence_id, content_hash FROM evidence_items")) if incremental else {}
+    current_ids = set()
+    unchanged = 0
 
     for item in evidence_list:
         evidence_id = item.get('evidence_id')
@@ -142,18 +388,30 @@ def load_evidence_to_db(conn, evidence_list):
             'source_file': metadata.get('source_file', None)
         }
 
-        # Store in ReasoningBank using claude-flow schema
-        # id = evidence_id, type = tier namespace, pattern_data = full evidence JSON
-        cursor.execute("""
-            INSERT OR REPLACE INTO patterns (id, type, pattern_data, confidence, usage_count)
-            VALUES (?, ?, ?, ?, ?)
-        """, (
-            evidence_id,
-            evidence_type,
-            json.dumps(pattern_data),
-            1.0,  # High confidence - already vetted
-            0     # Initial usage count
-        ))
+        pattern_json = encode_json(pattern_data)
+        digest = content_hash(pattern_json)
+        current_ids.add(evidence_id)
+
+        if stored_hashes.get(evidence_id) == digest:
+            unchanged += 1
+        else:
+            # Store in ReasoningBank using claude-flow schema
+            # id = evidence_id, type = tier namespace, pattern_data = full evidence JSON
+            rows.append((
+                evidence_id,
+                evidence_type,
+                pattern_json,
+                1.0,  # High confidence - already vetted
+                0     # Initial usage count
+            ))
+
+            item_row, principals, predicates, sources_for_item = evidence_side_rows(
+                evidence_id, evidence_type, tier, category, item, metadata, sources, digest
+            )
+            item_rows.append(item_row)
+            principal_rows.extend(principals)
+            predicate_rows.extend(predicates)
+            source_rows.extend(sources_for_item)
 
         # Update stats
         stats['loaded'] += 1
@@ -181,28 +439,44 @@ def load_evidence_to_db(conn, evidence_list):
         elif 'website' in source_file.lower():
             stats['corpus_coverage']['websites_crawl'] += 1
 
-    conn.commit()
+    deleted_ids = sorted(set(stored_hashes) - current_ids)
+
+    with bulk_load_pragmas(conn):
+        delete_evidence(conn, deleted_ids, batch_size)
+        index_sql = []
+        if rebuild_secondary_indexes:
+            for table in ('patterns', 'evidence_items', *EVIDENCE_SIDE_TABLES):
+                index_sql += drop_secondary_indexes(conn, table)
+        insert_patterns(conn, rows, batch_size)
+        insert_evidence_tables(conn, item_rows, principal_rows, predicate_rows, source_rows, batch_size)
+        rebuild_indexes(conn, index_sql)
 
     # Convert set to list
     stats['principals_list'] = sorted(list(stats['principals_set']))
     del stats['principals_set']
 
-    return stats, rejections
+    stats['delta'] = {
+        'written': len(rows),
+        'unchanged': unchanged,
+        'deleted': deleted_ids
+    }
 
-def build_cross_reference_index(conn, evidence_list):
-    """Build entity -> evidence -> predicate cross-reference"""
-    cursor = conn.cursor()
+    return stats, rejections
 
+def cross_reference_entries(evidence_list, principals=None):
+    """Entity -> evidence/predicate/tier entries, optionally restricted to some principals"""
     cross_references = {}
 
     for item in evidence_list:
         evidence_id = item.get('evidence_id')
         metadata = item.get('metadata', {})
-        principals = metadata.get('principals_exposed', [])
+        principals_exposed = metadata.get('principals_exposed', [])
         predicates = metadata.get('rico_predicate', [])
         tier = item.get('tier', 3)
 
-        for principal in principals:
+        for principal in principals_exposed:
+            if principals is not None and principal not in principals:
+                continue
             if principal not in cross_references:
                 cross_references[principal] = {
                     'evidence_ids': [],
@@ -218,24 +492,106 @@ def build_cross_reference_index(conn, evidence_list):
         cross_references[principal]['predicates'] = sorted(list(cross_references[principal]['predicates']))
         cross_references[principal]['tier_breakdown'] = dict(cross_references[principal]['tier_breakdown'])
 
-    # Store in ReasoningBank using claude-flow schema
-    cursor.execute("""
-        INSERT OR REPLACE INTO patterns (id, type, pattern_data, confidence, usage_count)
-        VALUES (?, ?, ?, ?, ?)
-    """, (
-        'entity_to_evidence_map',
-        'evidence_index',
-        json.dumps({
-            'cross_references': cross_references,
-            'total_entities': len(cross_references)
-        }),
-        1.0,
-        0
-    ))
+    return cross_references
 
-    conn.commit()
+def load_cross_reference_index(conn):
+    """Stored entity_to_evidence_map cross-references, or None if not built yet"""
+    row = conn.execute("SELECT pattern_data FROM patterns WHERE id = 'entity_to_evidence_map'").fetchone()
+    if row is None:
+        return None
+    try:
+        return json.loads(row[0]).get('cross_references')
+    except (json.JSONDecodeError, AttributeError):
+        return None
+
+def xref_signatures(evidence_list):
+    """
+    evidence_id -> (hash, principals) of what its items contribute to the cross-reference,
+    over the same items and fields cross_reference_entries reads
+    """
+    contributions = defaultdict(list)
+    for item in evidence_list:
+        metadata = item.get('metadata', {})
+        contributions[str(item.get('evidence_id'))].append([
+            item.get('tier', 3),
+            metadata.get('principals_exposed', []),
+            metadata.get('rico_predicate', [])
+        ])
+    signatures = {}
+    for evidence_id, entries in contributions.items():
+        principals = sorted({p for _, exposed, _ in entries for p in exposed})
+        signatures[evidence_id] = (content_hash(encode_json(entries)), encode_json(principals))
+    return signatures
+
+def build_cross_reference_index(conn, evidence_list, incremental=False):
+    """
+    Build entity -> evidence -> predicate cross-reference. With incremental, only the
+    principals of items whose contribution changed since the stored map (per
+    evidence_xref_items) are recomputed and merged in; the row is left untouched when
+    nothing changed. The map and the item signatures are written in one transaction.
+    Returns (cross_references, affected principals or None after a full rebuild).
+    """
+    signatures = xref_signatures(evidence_list)
+    stored_signatures = {
+        evidence_id: (xref_hash, principals)
+        for evidence_id, xref_hash, principals in conn.execute(
+            "SELECT evidence_id, xref_hash, principals FROM evidence_xref_items"
+        )
+    }
+    stored = load_cross_reference_index(conn) if incremental and stored_signatures else None
+
+    changed = [i for i, sig in signatures.items() if stored_signatures.get(i, (None,))[0] != sig[0]]
+    deleted = [i for i in stored_signatures if i not in signatures]
+
+    if stored is None:
+        affected_principals = None
+        cross_references = cross_reference_entries(evidence_list)
+    else:
+        if not changed and not deleted:
+            return stored, set()
+        # Old links of changed/deleted items plus the new links of changed ones
+        affected_principals = set()
+        for evidence_id in changed + deleted:
+            for sig in (stored_signatures.get(evidence_id), signatures.get(evidence_id)):
+                if sig is not None:
+                    affected_principals.update(json.loads(sig[1]))
+        updated = cross_reference_entries(evidence_list, affected_principals)
+        # Same key order as a full rebuild: first appearance in evidence_list
+        order = dict.fromkeys(
+            principal for item in evidence_list
+            for principal in item.get('metadata', {}).get('principals_exposed', [])
+        )
+        cross_references = {p: updated[p] if p in affected_principals else stored[p] for p in order}
 
-    return cross_references
+    cursor = conn.cursor()
+    try:
+        # Store in ReasoningBank using claude-flow schema
+        cursor.execute("""
+            INSERT OR REPLACE INTO patterns (id, type, pattern_data, confidence, usage_count)
+            VALUES (?, ?, ?, ?, ?)
+        """, (
+            'entity_to_evidence_map',
+            'evidence_index',
+            encode_json({
+                'cross_references': cross_references,
+                'total_entities': len(cross_references)
+            }),
+            1.0,
+            0
+        ))
+        if stored is None:
+            cursor.execute("DELETE FROM evidence_xref_items")
+            changed = list(signatures)
+        executemany_batched(conn, "DELETE FROM evidence_xref_items WHERE evidence_id = ?",
+                            [(i,) for i in deleted])
+        executemany_batched(conn, "INSERT OR REPLACE INTO evidence_xref_items VALUES (?, ?, ?)",
+                            [(i, *signatures[i]) for i in changed])
+        conn.commit()
+    except BaseException:
+        conn.rollback()
+        raise
+
+    return cross_references, affected_principals
 
 def generate_evidence_manifest(stats, cross_references):
     """Generate evidence manifest output"""
@@ -284,9 +640,11 @@ def generate_loading_report(stats, rejections):
         'status': 'complete',
         'items_loaded': stats['loaded'],
         'items_rejected': stats['rejected'],
+        'load_delta': stats.get('delta', {}),
         'rejected_items': rejections,
         'database_path': str(DB_PATH),
         'namespaces_created': ['evidence_tier1', 'evidence_tier2', 'evidence_tier3', 'evidence_index'],
+        'evidence_tables': ['evidence_items', *EVIDENCE_SIDE_TABLES],
         'verification': {
             'all_items_have_corpus_sources': all_have_sources,
             'tier_distribution_matches': tier_match,
@@ -307,11 +665,17 @@ def generate_loading_report(stats, rejections):
     print(f"✓ Loading report written to {output_path}")
     return report
 
-def update_state_file(stats, outputs):
+def approved_list_hash():
+    """sha256 of the approved evidence list (reruns on an unchanged list are skipped)"""
+    with open(APPROVED_LIST, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+def update_state_file(stats, outputs, input_hash=None):
     """Update state file to signal completion"""
     state = {
         'run_id': 'cert1-phase3-shadowlens-20251121',
         'status': 'completed',
+        'input_hash': input_hash,
         'phase': 'HANDOFF',
         'evidence_loaded': stats['loaded'],
         'evidence_rejected': stats['rejected'],
@@ -339,16 +703,22 @@ def main():
     # STATE 1: INITIALIZE
     print("\n[STATE 1: INITIALIZE]")
 
-    # Check if already completed
+    # Ensure directories exist
+    MEMORY_DIR.mkdir(exist_ok=True)
+    COORDINATION_DIR.mkdir(exist_ok=True)
+
+    # Skip only if the last completed run loaded this exact approved list
+    input_hash = approved_list_hash()
     if STATE_FILE.exists():
         with open(STATE_FILE, 'r') as f:
             state = json.load(f)
-        if state.get('status') == 'completed':
-            print("✓ Already completed. Exiting.")
+        if state.get('status') == 'completed' and state.get('input_hash') == input_hash:
+            print("✓ Already completed for this approved list. Exiting.")
             return
 
     # Initialize database
     conn = initialize_database()
+    initialize_evidence_tables(conn, json_columns='--json-columns' in sys.argv[1:])
     current_count = check_current_evidence_count(conn)
     print(f"✓ Database initialized: {DB_PATH}")
     print(f"✓ Current evidence count: {current_count}")
@@ -359,11 +729,13 @@ def main():
 
     # STATE 2: LOAD EVIDENCE
     print("\n[STATE 2: LOAD EVIDENCE TO REASONINGBANK]")
-    stats, rejections = load_evidence_to_db(conn, evidence_list)
+    stats, rejections = load_evidence_to_db(conn, evidence_list, incremental=True)
 
     print(f"✓ Loaded: {stats['loaded']}")
     print(f"✓ Rejected: {stats['rejected']}")
     print(f"✓ Tier breakdown: {dict(stats['tier_breakdown'])}")
+    delta = stats['delta']
+    print(f"✓ Written: {delta['written']}, unchanged: {delta['unchanged']}, deleted: {len(delta['deleted'])}")
 
     if rejections:
         print("\nRejections:")
@@ -372,8 +744,10 @@ def main():
 
     # STATE 3: BUILD CROSS-REFERENCE INDEX
     print("\n[STATE 3: BUILD CROSS-REFERENCE INDEX]")
-    cross_references = build_cross_reference_index(conn, evidence_list)
+    cross_references, affected_principals = build_cross_reference_index(conn, evidence_list, incremental=True)
     print(f"✓ Cross-reference index built: {len(cross_references)} entities")
+    if affected_principals is not None:
+        print(f"✓ Entities updated incrementally: {len(affected_principals)}")
 
     # STATE 4: GENERATE OUTPUTS
     print("\n[STATE 4: GENERATE OUTPUTS]")
@@ -386,7 +760,7 @@ def main():
         "memory/evidence_manifest.json",
         "coordination/evidence_loading_report.json"
     ]
-    state = update_state_file(stats, outputs)
+    state = update_state_file(stats, outputs, input_hash)
 
     # Close database
     conn.close()
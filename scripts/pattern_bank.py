@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+"""
+Pattern Bank - shared, precompiled detector patterns
+Used by url_analysis.py, fraud_scorer.py and html_analyzer.py
+
+Every detector is compiled once at import into a single alternation, so a
+record is scanned once per detector instead of once per pattern.
+SubstringMatcher covers the plain "which of these names occurs first" lookups
+(evidence_integrator.py) with one Aho-Corasick pass per text. Bump
+PATTERN_BANK_VERSION whenever a pattern or keyword list changes; caches
+keyed on detector output (e.g. the fraud score cache) use it to invalidate.
+"""
+
+import re
+from collections import deque, namedtuple
+from typing import Dict, Iterable, List, Optional, Tuple
+
+try:
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
+
+PATTERN_BANK_VERSION = '1'
+
+# ============================================================================
+# URL / deep-crawl detectors (url_analysis.py)
+# ============================================================================
+
+# Light System mentions in content or URL
+LIGHT_SYSTEM_PATTERNS = [
+    r'\blight\s+system\b',
+    r'\bthe\s+light\s+system\b',
+    r'\btls\b',
+    r'thelightsystems\.com',
+    r'tlsmarketplace',
+]
+
+# Fraud indicator keywords and their score weights
+URL_FRAUD_KEYWORD_WEIGHTS = {
+    'quantum': 3,
+    'healing': 2,
+    'fda': 3,
+    'frequency': 2,
+    'energy': 1,
+    'cure': 3,
+    'miracle': 3,
+    'certified': 2,
+    'approved': 2,
+    'medical': 2,
+    'doctor': 1,
+    'therapy': 1,
+    'treatment': 2,
+    'disease': 2,
+    'cancer': 3,
+    'pain': 1,
+    'revolutionary': 2,
+    'breakthrough': 2,
+    'scientifically': 2,
+    'clinically': 2,
+}
+
+# Pricing claims: $25000, $50,000, $25k (the optional "k" suffix is kept in the hit text)
+URL_PRICE_PATTERN = r'\$\s*(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)(?:\s*k)?'
+
+# ============================================================================
+# Telegram post detectors (fraud_scorer.py)
+# ============================================================================
+
+TELEGRAM_FRAUD_KEYWORDS = [
+    'healing', 'energy', 'quantum', 'frequency', 'scalar', 'biophoton',
+    'cellular', 'detox', 'cure', 'disease', 'fda', 'approved', 'clinical',
+    'proven', 'guaranteed', 'miracle', 'revolutionary', 'breakthrough'
+]
+
+# Call-to-Action patterns
+CTA_PATTERNS = [
+    r'\bjoin\b', r'\bsubscribe\b', r'\bwatch\b', r'\blive\b', r'\bbuy\b',
+    r'\bsale\b', r'\bannouncement\b', r'\bmembership\b', r'\bfree trial\b',
+    r'\bdiscount\b', r'\bearly access\b', r'\bregister\b', r'\bdonate\b',
+    r'\bget your ticket\b', r'\bgrab your\b', r'\bsecure your\b',
+    r'\bbook a session\b', r'\bget yours\b', r'\bcheck it out\b'
+]
+
+# Medical claim patterns (without disclaimer)
+MEDICAL_CLAIM_KEYWORDS = ['healing', 'cure', 'disease', 'treatment', 'remedy']
+DISCLAIMER_KEYWORDS = ['consult', 'physician', 'doctor', 'medical advice', 'not intended to diagnose']
+MEDICAL_SPECIFICITY_TERMS = ['cellular', 'quantum', 'frequency', 'energy', 'biophoton', 'scalar']
+
+# Price pattern (looking for $1000+)
+TELEGRAM_PRICE_PATTERN = r'\$\s*([0-9,]+)'
+
+# ============================================================================
+# Binder word-frequency indicators (html_analyzer.py)
+# ============================================================================
+
+INDICATOR_CATEGORIES = {
+    'fraud': ['scam', 'fraud', 'fake', 'stolen', 'laundering', 'launder', 'ponzi',
+              'scheme', 'deceptive', 'misleading', 'counterfeit', 'forged', 'embezzle'],
+    'victim': ['victim', 'complaint', 'loss', 'frozen', 'seized', 'damaged',
+               'harmed', 'affected', 'plaintiff', 'claimant', 'injured'],
+    'money': ['usd', 'btc', 'eth', 'usdt', 'wallet', 'crypto', 'cryptocurrency',
+              'bitcoin', 'ethereum', 'tether', 'payment', 'transaction', 'transfer'],
+    'entity': ['jason', 'shurka', 'unifyd', 'tls', 'ray', 'havakok', 'gadish',
+               'sig', 'signature', 'investment', 'group'],
+    'legal': ['court', 'judge', 'lawsuit', 'indictment', 'prosecution', 'evidence',
+              'testimony', 'subpoena', 'warrant', 'conviction', 'charges', 'rico'],
+    'criminal': ['conspiracy', 'racketeering', 'organized', 'crime', 'criminal',
+                 'illegal', 'unlawful', 'violation', 'offense', 'felony']
+}
+
+# Word -> category (first category wins, matching the old list scan order)
+INDICATOR_WORD_CATEGORY = {}
+for _category, _words in INDICATOR_CATEGORIES.items():
+    for _word in _words:
+        INDICATOR_WORD_CATEGORY.setdefault(_word, _category)
+
+# Text cleanup for word-frequency analysis
+NON_WORD_RE = re.compile(r'[^\w\s-]')
+WHITESPACE_RE = re.compile(r'\s+')
+
+
+# ============================================================================
+# Matcher
+# ============================================================================
+
+# label: keyword/pattern the hit came from; value: first capture group (or full match)
+Hit = namedtuple('Hit', ['label', 'index', 'text', 'value', 'start', 'end'])
+
+
+def word_patterns(words: Iterable[str]) -> List[Tuple[str, str]]:
+    """(label, regex) pairs matching each word on word boundaries"""
+    return [(word, r'\b' + re.escape(word) + r'\b') for word in words]
+
+
+def substring_patterns(terms: Iterable[str]) -> List[Tuple[str, str]]:
+    """(label, regex) pairs matching each term anywhere"""
+    return [(term, re.escape(term)) for term in terms]
+
+
+def regex_patterns(patterns: Iterable[str]) -> List[Tuple[str, str]]:
+    """(label, regex) pairs for raw regexes, labelled by the regex itself"""
+    return [(pattern, pattern) for pattern in patterns]
+
+
+class PatternBank:
+    """Named detectors, each compiled once into a single alternation"""
+
+    def __init__(self, detectors: Dict[str, List[Tuple[str, str]]], version: str):
+        self.version = version
+        self.detectors = {}
+        for name, patterns in detectors.items():
+            labels = [label for label, _ in patterns]
+            compiled = re.compile(
+                '|'.join(f'(?P<_p{i}>{regex})' for i, (_, regex) in enumerate(patterns)),
+                re.IGNORECASE
+            )
+            # Group number of each alternative, and whether it has inner capture groups
+            group_info = {}
+            for i, (_, regex) in enumerate(patterns):
+                group_info[f'_p{i}'] = (i, compiled.groupindex[f'_p{i}'], re.compile(regex).groups > 0)
+            self.detectors[name] = (compiled, labels, group_info)
+
+    def scan(self, name: str, text: str, limit: int = None, endpos: int = None) -> List[Hit]:
+        """All non-overlapping hits of one detector, in text order (text[:endpos] when given)"""
+        compiled, labels, group_info = self.detectors[name]
+        hits = []
+        for m in compiled.finditer(text, 0, len(text) if endpos is None else endpos):
+            index, group, has_inner = group_info[m.lastgroup]
+            value = m.group(group + 1) if has_inner else m.group(group)
+            hits.append(Hit(labels[index], index, m.group(group), value, m.start(), m.end()))
+            if limit is not None and len(hits) >= limit:
+                break
+        return hits
+
+    def match(self, text: str, detectors: Iterable[str] = None) -> Dict[str, List[Hit]]:
+        """
+        Run several detectors over one normalised text, returning every detector's hits.
+        This is one finditer per detector, not one combined pass: detectors overlap
+        (e.g. 'healing' is both a fraud keyword and a medical claim), and a single alternation
+        across detectors would report only one of them per position.
+        """
+        names = self.detectors if detectors is None else detectors
+        return {name: self.scan(name, text) for name in names}
+
+
+class SubstringMatcher:
+    """
+    Multi-pattern substring matcher (Aho-Corasick): first(text) returns the lowest
+    index of any pattern occurring in text, i.e. the same answer as
+    next(i for i, p in enumerate(patterns) if p in text), in one pass over text
+    """
+
+    def __init__(self, patterns: Iterable[str]):
+        self.patterns = list(patterns)
+        # '' occurs in every text
+        self.empty_index = next((i for i, p in enumerate(self.patterns) if p == ''), None)
+        priority = {}
+        for i, pattern in enumerate(self.patterns):
+            if pattern:
+                priority.setdefault(pattern, i)
+
+        if HAS_AHOCORASICK:
+            self.automaton = ahocorasick.Automaton()
+            for pattern, i in priority.items():
+                self.automaton.add_word(pattern, i)
+            if priority:
+                self.automaton.make_automaton()
+            return
+        self.automaton = None
+
+        # goto[state][char] -> state; best[state]: lowest pattern index ending here (via suffix links)
+        self.goto = [{}]
+        self.best = [None]
+        for pattern, i in priority.items():
+            state = 0
+            for char in pattern:
+                nxt = self.goto[state].get(char)
+                if nxt is None:
+                    nxt = len(self.goto)
+                    self.goto[state][char] = nxt
+                    self.goto.append({})
+                    self.best.append(None)
+                state = nxt
+            self.best[state] = i
+
+        self.fail = [0] * len(self.goto)
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            inherited = self.best[self.fail[state]]
+            if inherited is not None and (self.best[state] is None or inherited < self.best[state]):
+                self.best[state] = inherited
+            for char, nxt in self.goto[state].items():
+                fallback = self.fail[state]
+                while fallback and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                target = self.goto[fallback].get(char, 0)
+                self.fail[nxt] = target if target != nxt else 0
+                queue.append(nxt)
+
+    def first(self, text: str) -> Optional[int]:
+        """Lowest index of a pattern found in text (None if none occur)"""
+        best = self.empty_index
+        if best == 0:
+            return 0
+
+        if self.automaton is not None:
+            if len(self.automaton):
+                for _, i in self.automaton.iter(text):
+                    if best is None or i < best:
+                        best = i
+            return best
+
+        goto, fail, found = self.goto, self.fail, self.best
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            i = found[state]
+            if i is not None and (best is None or i < best):
+                best = i
+                if best == 0:
+                    break
+        return best
+
+
+def normalize(text: str, url: str = '') -> str:
+    """Single normalisation step per record: text and URL joined and lowercased"""
+    return (text + ' ' + url).lower() if url else text.lower()
+
+
+def hits_by_pattern_order(hits: List[Hit]) -> List[Hit]:
+    """Order hits by detector pattern order (stable within a pattern)"""
+    return sorted(hits, key=lambda hit: hit.index)
+
+
+BANK = PatternBank({
+    # url_analysis.py
+    'light_system': regex_patterns(LIGHT_SYSTEM_PATTERNS),
+    'url_fraud_keyword': word_patterns(URL_FRAUD_KEYWORD_WEIGHTS),
+    'url_price': [('price', URL_PRICE_PATTERN)],
+    # fraud_scorer.py
+    'telegram_fraud_keyword': word_patterns(TELEGRAM_FRAUD_KEYWORDS),
+    'cta': regex_patterns(CTA_PATTERNS),
+    'medical_claim': word_patterns(MEDICAL_CLAIM_KEYWORDS),
+    'disclaimer': substring_patterns(DISCLAIMER_KEYWORDS),
+    'medical_specificity': substring_patterns(MEDICAL_SPECIFICITY_TERMS),
+    'telegram_price': [('price', TELEGRAM_PRICE_PATTERN)],
+}, version=PATTERN_BANK_VERSION)
+
+TELEGRAM_DETECTORS = ('telegram_fraud_keyword', 'cta', 'medical_claim', 'disclaimer',
+                      'medical_specificity', 'telegram_price')
@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""
+Provenance - shared corpus file IDs and source-support bitmaps
+Used by 03_validation_orchestrator.py and gap_filler_main.py
+
+Every corpus file gets a stable integer ID (append-only, persisted to
+FILE_IDS_PATH by the validation stage) and an evidence item's support is a
+bitmap of those IDs. Distinct-source counts for the tier rules are bitmap
+cardinalities instead of sets of path strings, and corroboration queries
+("items sharing >= 2 sources with X") run over a file -> items inverted index.
+The validation stage persists item supports and that index to
+SUPPORT_INDEX_PATH so later stages can query them.
+
+Bitmaps are pyroaring BitMaps when pyroaring is installed, otherwise plain
+Python ints used as bitsets. Only use the functions below on them so callers
+work with either representation.
+"""
+
+import json
+import os
+import threading
+from collections import Counter
+from functools import reduce
+from operator import and_, or_
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+try:
+    from pyroaring import BitMap
+    HAS_PYROARING = True
+except ImportError:
+    HAS_PYROARING = False
+
+FILE_IDS_PATH = Path("/Users/breydentaylor/certainly/visualizations/coordination/corpus_file_ids.json")
+SUPPORT_INDEX_PATH = FILE_IDS_PATH.with_name("corpus_support_index.json")
+
+
+# ============================================================================
+# Bitmap operations (pyroaring BitMap or int bitset)
+# ============================================================================
+
+def empty():
+    return BitMap() if HAS_PYROARING else 0
+
+
+def from_ids(file_ids: Iterable[int]):
+    """Bitmap with the given file IDs set"""
+    if HAS_PYROARING:
+        return BitMap(file_ids)
+    ids = np.fromiter(file_ids, dtype=np.int64)
+    if not len(ids):
+        return 0
+    # Set the bits in one byte array and convert once (OR-ing in 1 << i copies the whole int per ID)
+    bits = np.zeros(int(ids.max()) + 1, dtype=np.uint8)
+    bits[ids] = 1
+    return int.from_bytes(np.packbits(bits, bitorder='little').tobytes(), 'little')
+
+
+def union(*bitmaps):
+    if not bitmaps:
+        return empty()
+    if HAS_PYROARING:
+        return BitMap.union(*bitmaps)
+    return reduce(or_, bitmaps)
+
+
+def intersection(*bitmaps):
+    if not bitmaps:
+        return empty()
+    if HAS_PYROARING:
+        return BitMap.intersection(*bitmaps)
+    return reduce(and_, bitmaps)
+
+
+def difference(bitmap, other):
+    """IDs in bitmap but not in other"""
+    return bitmap - other if HAS_PYROARING else bitmap & ~other
+
+
+def cardinality(bitmap) -> int:
+    """Number of distinct files in a bitmap"""
+    return len(bitmap) if HAS_PYROARING else bitmap.bit_count()
+
+
+def to_ids(bitmap) -> List[int]:
+    """File IDs in ascending order"""
+    return id_array(bitmap).tolist()
+
+
+def id_array(bitmap) -> np.ndarray:
+    """File IDs in ascending order as an int64 array"""
+    if HAS_PYROARING:
+        return np.fromiter(bitmap, dtype=np.int64, count=len(bitmap))
+    if not bitmap:
+        return np.empty(0, dtype=np.int64)
+    raw = np.frombuffer(bitmap.to_bytes((bitmap.bit_length() + 7) // 8, 'little'), dtype=np.uint8)
+    return np.flatnonzero(np.unpackbits(raw, bitorder='little'))
+
+
+# ============================================================================
+# File registry and per-item support
+# ============================================================================
+
+class Provenance:
+    """Corpus path <-> integer file ID registry plus per-item support bitmaps"""
+
+    def __init__(self, files: Iterable[str] = ()):
+        self.files: List[str] = []
+        self.file_ids: Dict[str, int] = {}
+        self._lock = threading.Lock()  # ID assignment is safe from worker threads
+        for path in files:
+            self.file_id(path)
+
+        self.support: Dict[str, object] = {}
+        self._items_by_file: Optional[Dict[int, List[str]]] = None
+        self._path_rank: Optional[np.ndarray] = None
+
+    @classmethod
+    def load(cls, path: Path = FILE_IDS_PATH, support_path: Optional[Path] = None) -> "Provenance":
+        """
+        Registry with the persisted file IDs (empty if none saved yet), plus the
+        persisted item supports when support_path is given and was saved against
+        these IDs
+        """
+        try:
+            with open(path, 'r') as f:
+                registry = cls(json.load(f).get('files', []))
+        except (OSError, json.JSONDecodeError, AttributeError):
+            return cls()
+        if support_path is not None:
+            registry.load_support(support_path)
+        return registry
+
+    def save(self, path: Path = FILE_IDS_PATH):
+        """Persist file IDs; IDs are append-only so earlier ones never move"""
+        path = Path(path)
+        tmp_path = path.with_name(path.name + '.tmp')
+        with open(tmp_path, 'w') as f:
+            json.dump({'files': self.files}, f)
+        os.replace(tmp_path, path)
+
+    def file_id(self, path: str) -> int:
+        """ID for a corpus path, assigning the next one on first sight"""
+        file_id = self.file_ids.get(path)
+        if file_id is None:
+            with self._lock:
+                file_id = self.file_ids.get(path)
+                if file_id is None:
+                    file_id = len(self.files)
+                    self.files.append(path)
+                    self.file_ids[path] = file_id
+        return file_id
+
+    def bitmap(self, paths: Iterable[str]):
+        """Support bitmap for a collection of corpus paths"""
+        return from_ids(self.file_id(path) for path in paths)
+
+    def count(self, paths: Iterable[str]) -> int:
+        """Distinct corpus files among paths"""
+        return cardinality(self.bitmap(paths))
+
+    def paths(self, bitmap) -> List[str]:
+        """Sorted corpus paths in a bitmap"""
+        files = self.files
+        rank = self._path_rank
+        if rank is None or len(rank) != len(files):
+            # rank[file_id] = position of the path in sorted order
+            snapshot = np.array(files, dtype=object)
+            rank = np.empty(len(snapshot), dtype=np.int64)
+            rank[np.argsort(snapshot, kind='stable')] = np.arange(len(snapshot))
+            self._path_rank = rank
+        ids = id_array(bitmap)
+        return [files[i] for i in ids[np.argsort(rank[ids], kind='stable')].tolist()]
+
+    def add_support(self, item_id: str, bitmap):
+        """Record (or extend) an evidence item's support"""
+        with self._lock:
+            current = self.support.get(item_id)
+            added = bitmap if current is None else difference(bitmap, current)
+            self.support[item_id] = bitmap if current is None else union(current, bitmap)
+            # Keep a built inverted index current instead of rebuilding it
+            if self._items_by_file is not None:
+                for file_id in to_ids(added):
+                    self._items_by_file.setdefault(file_id, []).append(item_id)
+
+    def items_by_file(self) -> Dict[int, List[str]]:
+        """file ID -> items it supports (built on first use unless loaded)"""
+        if self._items_by_file is None:
+            index: Dict[int, List[str]] = {}
+            for item_id, bitmap in self.support.items():
+                for file_id in to_ids(bitmap):
+                    index.setdefault(file_id, []).append(item_id)
+            self._items_by_file = index
+        return self._items_by_file
+
+    def corroborating(self, item_id: str, min_shared: int = 2) -> List[Tuple[str, int]]:
+        """Items sharing >= min_shared sources with item_id, most shared first"""
+        bitmap = self.support.get(item_id)
+        if bitmap is None:
+            return []
+        index = self.items_by_file()
+        shared = Counter()
+        for file_id in to_ids(bitmap):
+            shared.update(index.get(file_id, ()))
+        shared.pop(item_id, None)
+        return sorted(
+            ((other, n) for other, n in shared.items() if n >= min_shared),
+            key=lambda x: (-x[1], x[0])
+        )
+
+    def save_support(self, path: Path = SUPPORT_INDEX_PATH):
+        """Persist item supports and the file -> items index (as file IDs)"""
+        path = Path(path)
+        tmp_path = path.with_name(path.name + '.tmp')
+        with open(tmp_path, 'w') as f:
+            json.dump({
+                'file_count': len(self.files),
+                'support': {item_id: to_ids(bitmap) for item_id, bitmap in self.support.items()},
+                'items_by_file': {str(file_id): items for file_id, items in self.items_by_file().items()}
+            }, f)
+        os.replace(tmp_path, path)
+
+    def load_support(self, path: Path = SUPPORT_INDEX_PATH) -> bool:
+        """Replace supports with the persisted ones; False if missing or saved against unknown IDs"""
+        try:
+            with open(path, 'r') as f:
+                saved = json.load(f)
+            if saved['file_count'] > len(self.files):
+                return False
+            support = {item_id: from_ids(ids) for item_id, ids in saved['support'].items()}
+            items_by_file = {int(file_id): items for file_id, items in saved['items_by_file'].items()}
+        except (OSError, json.JSONDecodeError, KeyError, TypeError, ValueError):
+            return False
+        with self._lock:
+            self.support = support
+            self._items_by_file = items_by_file
+        return True
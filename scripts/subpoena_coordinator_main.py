@@ -7,16 +7,296 @@ Run ID: cert1-phase4-autonomous-20251121
 Mission: Generate prioritized subpoena package for 771 Tier 2 evidence items
 """
 
+import hashlib
 import json
 import os
 from datetime import datetime, timedelta
 from collections import defaultdict
 from pathlib import Path
 
+from pattern_bank import SubstringMatcher
+
 BASE_DIR = Path("/Users/breydentaylor/certainly/visualizations")
 COORDINATION_DIR = BASE_DIR / "coordination"
 STATE_DIR = BASE_DIR / "state"
 
+# Subpoena target groups, in report order
+SUBPOENA_TARGET_GROUPS = {
+    'cryptocurrency_exchanges': ['Coinbase', 'Binance', 'Kraken', 'Unknown/Other'],
+    'government_records': ['Nassau County Clerk', 'NY State Court System', 'Other Courts'],
+    'financial_institutions': ['PDI Bank', 'US Banks (Chase/BofA/Wells)', 'Other Banks'],
+    'corporate_registries': ['Secretary of State Offices']
+}
+
+# Routing rules per evidence type: (substrings of the lowercased subpoena_target,
+# category, target). The first rule with any substring present wins; add an
+# exchange, court or bank by adding a row.
+ROUTING_RULES = {
+    # Type 9: Blockchain transactions -> cryptocurrency exchanges
+    9: [
+        (['coinbase'], 'cryptocurrency_exchanges', 'Coinbase'),
+        (['binance'], 'cryptocurrency_exchanges', 'Binance'),
+        (['kraken'], 'cryptocurrency_exchanges', 'Kraken'),
+    ],
+    # Type 10: shadowLens summaries -> government/court records
+    10: [
+        (['nassau'], 'government_records', 'Nassau County Clerk'),
+        (['ny state', 'new york state'], 'government_records', 'NY State Court System'),
+        (['pdi bank'], 'financial_institutions', 'PDI Bank'),
+        (['chase', 'bofa', 'wells', 'bank of america'], 'financial_institutions', 'US Banks (Chase/BofA/Wells)'),
+        (['court', 'clerk'], 'government_records', 'Other Courts'),
+    ],
+}
+
+# Route when no rule matches (type 11 and other types are entity linkage)
+DEFAULT_ROUTES = {
+    9: ('cryptocurrency_exchanges', 'Unknown/Other'),
+    10: ('corporate_registries', 'Secretary of State Offices'),  # Some shadowlens might be entity-related
+}
+FALLBACK_ROUTE = ('corporate_registries', 'Secretary of State Offices')
+
+# ============================================================================
+# Package templates (bump SUBPOENA_TEMPLATE_VERSION when editing any of them;
+# it invalidates the rendered-section cache)
+# ============================================================================
+
+SUBPOENA_TEMPLATE_VERSION = '1'
+SECTION_CACHE_FILE = STATE_DIR / "subpoena_section_cache.json"
+
+PACKAGE_HEADER_TEMPLATE = """# SUBPOENA COORDINATION PACKAGE
+**Run ID**: cert1-phase4-autonomous-20251121
+**Agent**: Subpoena_Coordinator
+**Generated**: {timestamp}
+**Status**: COMPLETED
+
+---
+
+## EXECUTIVE SUMMARY
+
+This package identifies **{total_targets}** subpoena targets to upgrade **{expected_tier1}+** evidence items from Tier 2 to Tier 1 (prosecution-ready).
+
+### Priority Breakdown
+- **P1 (High Priority)**: {p1_count} targets - Expected 30-60 day turnaround
+- **P2 (Medium Priority)**: {p2_count} targets - Expected 60-120 day turnaround
+- **P3 (Lower Priority)**: {p3_count} targets - Expected 120-180 day turnaround
+
+### Expected Outcomes
+- **Total Tier 1 upgrades**: {expected_tier1} items
+- **Total USD value**: ${total_usd:,}
+- **Estimated timeline**: 3-6 months for P1 targets
+
+---
+
+## PRIORITY 1 TARGETS (IMMEDIATE ACTION REQUIRED)
+
+"""
+
+# (priority, heading written before its sections, detailed sections)
+PRIORITY_SECTIONS = [
+    ('P1', "", True),
+    ('P2', "\n---\n\n## PRIORITY 2 TARGETS (SECONDARY PRIORITIES)\n\n", False),
+    ('P3', "\n---\n\n## PRIORITY 3 TARGETS (DEFERRED)\n\n", False)
+]
+
+RECOMMENDATIONS_TEMPLATE = """
+---
+
+## KEY RECOMMENDATIONS
+
+### Immediate Actions (Next 30 days)
+1. **Issue P1 subpoenas immediately** - These cover {p1_items} high-value evidence items
+2. **Coordinate with exchanges** - Establish legal contacts at Coinbase, Binance
+3. **Nassau County engagement** - Critical for documentary evidence on asset concealment
+
+### Resource Allocation
+- **Focus 70% effort on P1 targets** - Fastest ROI, highest yield
+- **Allocate 20% to P2 targets** - Secondary priorities, moderate complexity
+- **Reserve 10% for P3 targets** - Long-term supporting evidence
+
+### Legal Safeguards
+- ✅ **EESystem protection maintained** - No subpoenas targeting EESystem distributors
+- ✅ **Specific wallet targeting** - Avoid fishing expeditions
+- ✅ **RICO legal basis clear** - All requests tied to 18 U.S.C. § 1962
+
+### Timeline Management
+- **P1 targets**: Expect responses within 60 days (US jurisdiction, clear KYC requirements)
+- **P2 targets**: Expect 90-120 days (international cooperation, multiple agencies)
+- **P3 targets**: Plan for 120-180 days (corporate records, lower urgency)
+
+---
+
+## METHODOLOGY
+
+**Evidence Selection**: All Tier 2 items with tier_if_confirmed = 1 or 2
+**Prioritization**: Based on expected yield, transaction value, and response timeline
+**Legal Basis**: RICO investigation under 18 U.S.C. § 1962
+**Safeguards**: EESystem exclusion per LEGAL_SAFEGUARDS.md
+
+---
+
+**Next Steps**: Review package, approve P1 targets, coordinate with legal team for issuance.
+
+"""
+
+SECTION_HEADER_TEMPLATE = """
+### {target_name} ({target_id})
+
+**Priority**: {priority}
+**Category**: {category}
+**Expected Yield**: {tier1_items} items → Tier 1
+"""
+CRYPTO_SUMMARY_TEMPLATE = "**Total Transaction Value**: ${usd_value:,}\n**Wallet Addresses**: {wallet_count} unique addresses\n"
+GOVERNMENT_SUMMARY_TEMPLATE = "**Document Count**: {document_count} shadowLens items\n"
+TIMELINE_TEMPLATE = "**Timeline**: Response expected by {expected_response}\n"
+WALLET_LINE_TEMPLATE = "{i}. `{wallet}`\n"
+
+CRYPTO_DETAIL = """
+#### Information Requested
+
+For each wallet address associated with this exchange:
+
+1. **Account Holder Information**
+   - Full legal name
+   - Residential address
+   - Email address(es) on file
+   - Phone number(s) on file
+   - Government ID used for verification
+
+2. **Account Details**
+   - Account creation date
+   - Account status (active/closed/suspended)
+   - Verification level (KYC tier)
+   - Business vs personal account designation
+
+3. **Transaction History**
+   - All deposits (fiat and crypto)
+   - All withdrawals (fiat and crypto)
+   - Date range: 2019-01-01 to present
+
+4. **Related Accounts**
+   - Other accounts with same email/phone/address/ID
+
+5. **Beneficial Ownership** (if business account)
+   - Business name and structure
+   - Beneficial owner name(s)
+
+#### Legal Authority
+
+This request is issued pursuant to ongoing RICO investigation under 18 U.S.C. § 1962. The requested information is material and relevant to:
+
+1. Establishing attribution of cryptocurrency transactions to specific individuals and entities
+2. Tracing proceeds of wire fraud and false advertising schemes
+3. Demonstrating benefit to RICO enterprise (UNIFYD Healing / Jason Shurka organization)
+4. Establishing timeline of fraudulent conduct (2019-2025)
+
+#### Sample Wallet Addresses (Top 10)
+"""
+
+GOVERNMENT_DETAIL = """
+#### Documents Requested
+
+**Subject Individuals**:
+- Emmanuel (Manny) Shurka
+- Malka Shurka
+- Efraim Shurka
+- Esther Zernitsky
+- Jason Yosef Shurka
+
+**Date Range**: 1995-01-01 to present
+
+**Document Categories**:
+
+1. **Real Property Records**
+   - All deeds, mortgages, and property transfers
+   - Property tax records
+   - Liens and encumbrances
+
+2. **Creditor-Proof Agreements** (Priority)
+   - Specifically: January 18, 2002 agreement mentioned in investigative records
+   - Any asset protection trust documents
+
+3. **Surrogate's Court Filings**
+   - Estate filings
+   - Will probate records
+   - Trust administration records
+
+4. **Court Judgments**
+   - Civil judgments against any subject individuals
+   - Creditor claims
+
+#### Legal Authority
+
+This request supports RICO investigation under 18 U.S.C. § 1962. The requested documents are material to:
+
+1. Establishing pattern of asset concealment (RICO predicate)
+2. Demonstrating intent to defraud creditors
+3. Tracing proceeds of fraud schemes
+4. Establishing family enterprise structure
+"""
+
+
+class SubpoenaRouter:
+    """ROUTING_RULES compiled into one multi-pattern matcher per evidence type"""
+
+    def __init__(self, rules=ROUTING_RULES, defaults=DEFAULT_ROUTES, fallback=FALLBACK_ROUTE):
+        self.defaults = defaults
+        self.fallback = fallback
+        self.matchers = {}
+        for item_type, type_rules in rules.items():
+            # Patterns are flattened in rule order, so the lowest matching
+            # pattern index belongs to the first matching rule
+            patterns, routes = [], []
+            for substrings, category, target in type_rules:
+                for substring in substrings:
+                    patterns.append(substring)
+                    routes.append((category, target))
+            self.matchers[item_type] = (SubstringMatcher(patterns), routes)
+        self._cache = {}
+
+    def route(self, item_type, subpoena_target: str):
+        """(category, target) for an item type and lowercased subpoena_target"""
+        key = (item_type, subpoena_target)
+        route = self._cache.get(key)
+        if route is None:
+            if item_type not in self.matchers:
+                route = self.fallback
+            else:
+                matcher, routes = self.matchers[item_type]
+                index = matcher.first(subpoena_target)
+                route = routes[index] if index is not None else self.defaults.get(item_type, self.fallback)
+            self._cache[key] = route
+        return route
+
+
+def subpoena_target_text(item):
+    """Lowercased subpoena_target the item is routed on"""
+    metadata = item.get('metadata', {})
+    if item.get('type') == 9:
+        # Check attribution first, then metadata
+        return (item.get('attribution', {}).get('subpoena_target', '') or metadata.get('subpoena_target', '')).lower()
+    if item.get('type') == 10:
+        return metadata.get('subpoena_target', '').lower()
+    return ''
+
+
+def item_usd(item):
+    return (
+        item.get('transaction', {}).get('amount_usd', 0) or
+        item.get('metadata', {}).get('amount_usd', 0) or
+        0
+    )
+
+
+def item_wallets(item):
+    """Known wallet addresses on an item (attribution first, then transaction)"""
+    attribution = item.get('attribution', {})
+    transaction = item.get('transaction', {})
+
+    from_addr = attribution.get('from_wallet') or transaction.get('from_address', '')
+    to_addr = attribution.get('to_wallet') or transaction.get('to_address', '')
+
+    return [addr for addr in (from_addr, to_addr) if addr and addr != 'UNKNOWN']
+
 def load_evidence_data():
     """Task 1: Load all evidence and filter for items needing subpoenas"""
     print("=" * 80)
@@ -91,122 +371,91 @@ def load_evidence_data():
 
     return subpoena_candidates
 
-def group_by_subpoena_target(evidence_items):
-    """Task 2: Group items by subpoena target category"""
+def new_group_stats():
+    return {'item_count': 0, 'total_usd': 0, 'tier1_items': 0, 'tier2_items': 0, 'wallets': {}}
+
+
+def add_group_item(stats, item, category):
+    """Accumulate one routed item into its group's running totals"""
+    stats['item_count'] += 1
+    stats['total_usd'] += item_usd(item)
+    tier_if_confirmed = item.get('tier_if_confirmed')
+    if tier_if_confirmed == 1:
+        stats['tier1_items'] += 1
+    elif tier_if_confirmed == 2:
+        stats['tier2_items'] += 1
+    if category == 'cryptocurrency_exchanges':
+        for wallet in item_wallets(item):
+            stats['wallets'][wallet] = None  # insertion-ordered set
+
+
+def group_by_subpoena_target(evidence_items, router=None):
+    """
+    Task 2: Group items by subpoena target category
+
+    Routing, counts, USD totals, expected yield and wallet sets are all
+    accumulated in one pass. Returns (target_groups, group_stats).
+    """
     print("\n" + "=" * 80)
     print("TASK 2: Grouping by subpoena target categories")
     print("=" * 80)
 
+    router = router or SubpoenaRouter()
+
     # Initialize target groups
     target_groups = {
-        'cryptocurrency_exchanges': {
-            'Coinbase': [],
-            'Binance': [],
-            'Kraken': [],
-            'Unknown/Other': []
-        },
-        'government_records': {
-            'Nassau County Clerk': [],
-            'NY State Court System': [],
-            'Other Courts': []
-        },
-        'financial_institutions': {
-            'PDI Bank': [],
-            'US Banks (Chase/BofA/Wells)': [],
-            'Other Banks': []
-        },
-        'corporate_registries': {
-            'Secretary of State Offices': []
-        }
+        category: {target: [] for target in targets}
+        for category, targets in SUBPOENA_TARGET_GROUPS.items()
+    }
+    group_stats = {
+        category: {target: new_group_stats() for target in targets}
+        for category, targets in SUBPOENA_TARGET_GROUPS.items()
     }
 
     for item in evidence_items:
-        item_type = item.get('type')
-        metadata = item.get('metadata', {})
-        attribution = item.get('attribution', {})
-
-        # Type 9: Blockchain transactions -> cryptocurrency exchanges
-        if item_type == 9:
-            # Check attribution first, then metadata
-            subpoena_target = attribution.get('subpoena_target', '') or metadata.get('subpoena_target', '')
-            subpoena_target = subpoena_target.lower()
-
-            if 'coinbase' in subpoena_target:
-                target_groups['cryptocurrency_exchanges']['Coinbase'].append(item)
-            elif 'binance' in subpoena_target:
-                target_groups['cryptocurrency_exchanges']['Binance'].append(item)
-            elif 'kraken' in subpoena_target:
-                target_groups['cryptocurrency_exchanges']['Kraken'].append(item)
-            else:
-                # Default blockchain items to Unknown for now
-                target_groups['cryptocurrency_exchanges']['Unknown/Other'].append(item)
-
-        # Type 10: shadowLens summaries -> government/court records
-        elif item_type == 10:
-            subpoena_target = metadata.get('subpoena_target', '').lower()
-
-            if 'nassau' in subpoena_target:
-                target_groups['government_records']['Nassau County Clerk'].append(item)
-            elif 'ny state' in subpoena_target or 'new york state' in subpoena_target:
-                target_groups['government_records']['NY State Court System'].append(item)
-            elif 'pdi bank' in subpoena_target:
-                target_groups['financial_institutions']['PDI Bank'].append(item)
-            elif any(bank in subpoena_target for bank in ['chase', 'bofa', 'wells', 'bank of america']):
-                target_groups['financial_institutions']['US Banks (Chase/BofA/Wells)'].append(item)
-            elif 'court' in subpoena_target or 'clerk' in subpoena_target:
-                target_groups['government_records']['Other Courts'].append(item)
-            else:
-                # Some shadowlens might be entity-related
-                target_groups['corporate_registries']['Secretary of State Offices'].append(item)
-
-        # Type 11 or other: Entity linkage -> corporate registries
-        else:
-            target_groups['corporate_registries']['Secretary of State Offices'].append(item)
+        category, target = router.route(item.get('type'), subpoena_target_text(item))
+        target_groups[category][target].append(item)
+        add_group_item(group_stats[category][target], item, category)
 
     # Print summary
     print(f"\nCryptocurrency Exchanges:")
-    for exchange, items in target_groups['cryptocurrency_exchanges'].items():
-        total_usd = sum(
-            item.get('transaction', {}).get('amount_usd', 0) or
-            item.get('metadata', {}).get('amount_usd', 0) or
-            0
-            for item in items
-        )
-        print(f"  {exchange}: {len(items)} items, ${total_usd:,.0f} total")
+    for exchange, stats in group_stats['cryptocurrency_exchanges'].items():
+        print(f"  {exchange}: {stats['item_count']} items, ${stats['total_usd']:,.0f} total")
 
     print(f"\nGovernment Records:")
-    for office, items in target_groups['government_records'].items():
-        print(f"  {office}: {len(items)} items")
+    for office, stats in group_stats['government_records'].items():
+        print(f"  {office}: {stats['item_count']} items")
 
     print(f"\nFinancial Institutions:")
-    for bank, items in target_groups['financial_institutions'].items():
-        print(f"  {bank}: {len(items)} items")
+    for bank, stats in group_stats['financial_institutions'].items():
+        print(f"  {bank}: {stats['item_count']} items")
 
     print(f"\nCorporate Registries:")
-    for registry, items in target_groups['corporate_registries'].items():
-        print(f"  {registry}: {len(items)} items")
+    for registry, stats in group_stats['corporate_registries'].items():
+        print(f"  {registry}: {stats['item_count']} items")
 
-    return target_groups
+    return target_groups, group_stats
 
-def prioritize_and_generate_subpoenas(target_groups):
+def prioritize_and_generate_subpoenas(target_groups, group_stats=None):
     """Task 3: Prioritize targets and create subpoena package"""
     print("\n" + "=" * 80)
     print("TASK 3: Prioritizing targets and generating subpoena language")
     print("=" * 80)
 
+    if group_stats is None:
+        group_stats = {}
+        for category, groups in target_groups.items():
+            group_stats[category] = {}
+            for target, items in groups.items():
+                stats = group_stats[category][target] = new_group_stats()
+                for item in items:
+                    add_group_item(stats, item, category)
+
     subpoena_targets = []
     target_id_counter = 1
 
     # Function to calculate priority
-    def calculate_priority(items, category_type):
-        item_count = len(items)
-        total_usd = sum(
-            item.get('transaction', {}).get('amount_usd', 0) or
-            item.get('metadata', {}).get('amount_usd', 0) or
-            0
-            for item in items
-        )
-
+    def calculate_priority(item_count, total_usd, category_type):
         # P1: 20+ items, >$1M (or high item count if USD unknown), US jurisdiction
         # P2: 5-20 items, $100K-$1M, moderate complexity
         # P3: <5 items, <$100K, long timeline
@@ -241,28 +490,10 @@ def prioritize_and_generate_subpoenas(target_groups):
         if not items:
             continue
 
-        priority = calculate_priority(items, 'crypto_exchange')
-        total_usd = sum(
-            item.get('transaction', {}).get('amount_usd', 0) or
-            item.get('metadata', {}).get('amount_usd', 0) or
-            0
-            for item in items
-        )
-
-        # Get wallet addresses
-        wallet_addresses = set()
-        for item in items:
-            # Check attribution first, then transaction
-            attribution = item.get('attribution', {})
-            transaction = item.get('transaction', {})
-
-            from_addr = attribution.get('from_wallet') or transaction.get('from_address', '')
-            to_addr = attribution.get('to_wallet') or transaction.get('to_address', '')
-
-            if from_addr and from_addr != 'UNKNOWN':
-                wallet_addresses.add(from_addr)
-            if to_addr and to_addr != 'UNKNOWN':
-                wallet_addresses.add(to_addr)
+        stats = group_stats['cryptocurrency_exchanges'][exchange]
+        total_usd = stats['total_usd']
+        priority = calculate_priority(stats['item_count'], total_usd, 'crypto_exchange')
+        wallet_addresses = list(stats['wallets'])
 
         subpoena_targets.append({
             'target_id': f'SUB-{target_id_counter:03d}',
@@ -271,8 +502,8 @@ def prioritize_and_generate_subpoenas(target_groups):
             'priority': priority,
             'status': 'pending_issuance',
             'expected_yield': {
-                'tier1_items': len([i for i in items if i.get('tier_if_confirmed') == 1]),
-                'tier2_items': len([i for i in items if i.get('tier_if_confirmed') == 2]),
+                'tier1_items': stats['tier1_items'],
+                'tier2_items': stats['tier2_items'],
                 'total_usd_value': total_usd
             },
             'wallet_count': len(wallet_addresses),
@@ -282,7 +513,7 @@ def prioritize_and_generate_subpoenas(target_groups):
                 'expected_response': (datetime.now() + timedelta(days=60)).isoformat()
             },
             'dependent_evidence': [item.get('evidence_id') for item in items[:10]],  # Sample
-            'wallet_addresses': list(wallet_addresses)[:50]  # Top 50
+            'wallet_addresses': wallet_addresses[:50]  # Top 50
         })
         target_id_counter += 1
 
@@ -291,7 +522,8 @@ def prioritize_and_generate_subpoenas(target_groups):
         if not items:
             continue
 
-        priority = calculate_priority(items, 'government')
+        stats = group_stats['government_records'][office]
+        priority = calculate_priority(stats['item_count'], stats['total_usd'], 'government')
 
         subpoena_targets.append({
             'target_id': f'SUB-{target_id_counter:03d}',
@@ -300,8 +532,8 @@ def prioritize_and_generate_subpoenas(target_groups):
             'priority': priority,
             'status': 'pending_issuance',
             'expected_yield': {
-                'tier1_items': len([i for i in items if i.get('tier_if_confirmed') == 1]),
-                'tier2_items': len([i for i in items if i.get('tier_if_confirmed') == 2])
+                'tier1_items': stats['tier1_items'],
+                'tier2_items': stats['tier2_items']
             },
             'document_count': len(items),
             'timeline': {
@@ -317,7 +549,8 @@ def prioritize_and_generate_subpoenas(target_groups):
         if not items:
             continue
 
-        priority = calculate_priority(items, 'bank')
+        stats = group_stats['financial_institutions'][bank]
+        priority = calculate_priority(stats['item_count'], stats['total_usd'], 'bank')
 
         subpoena_targets.append({
             'target_id': f'SUB-{target_id_counter:03d}',
@@ -326,8 +559,8 @@ def prioritize_and_generate_subpoenas(target_groups):
             'priority': priority,
             'status': 'pending_issuance',
             'expected_yield': {
-                'tier1_items': len([i for i in items if i.get('tier_if_confirmed') == 1]),
-                'tier2_items': len([i for i in items if i.get('tier_if_confirmed') == 2])
+                'tier1_items': stats['tier1_items'],
+                'tier2_items': stats['tier2_items']
             },
             'account_count': len(items),
             'timeline': {
@@ -344,6 +577,8 @@ def prioritize_and_generate_subpoenas(target_groups):
         if not items:
             continue
 
+        stats = group_stats['corporate_registries'][registry]
+
         subpoena_targets.append({
             'target_id': f'SUB-{target_id_counter:03d}',
             'target_name': registry,
@@ -351,8 +586,8 @@ def prioritize_and_generate_subpoenas(target_groups):
             'priority': 'P3',
             'status': 'pending_issuance',
             'expected_yield': {
-                'tier1_items': len([i for i in items if i.get('tier_if_confirmed') == 1]),
-                'tier2_items': len([i for i in items if i.get('tier_if_confirmed') == 2])
+                'tier1_items': stats['tier1_items'],
+                'tier2_items': stats['tier2_items']
             },
             'entity_count': len(items),
             'timeline': {
@@ -377,218 +612,150 @@ def prioritize_and_generate_subpoenas(target_groups):
 
     return subpoena_targets
 
-def generate_package_markdown(subpoena_targets):
-    """Generate comprehensive markdown package with draft subpoena language"""
-
-    md_content = """# SUBPOENA COORDINATION PACKAGE
-**Run ID**: cert1-phase4-autonomous-20251121
-**Agent**: Subpoena_Coordinator
-**Generated**: {timestamp}
-**Status**: COMPLETED
-
----
-
-## EXECUTIVE SUMMARY
-
-This package identifies **{total_targets}** subpoena targets to upgrade **{expected_tier1}+** evidence items from Tier 2 to Tier 1 (prosecution-ready).
-
-### Priority Breakdown
-- **P1 (High Priority)**: {p1_count} targets - Expected 30-60 day turnaround
-- **P2 (Medium Priority)**: {p2_count} targets - Expected 60-120 day turnaround
-- **P3 (Lower Priority)**: {p3_count} targets - Expected 120-180 day turnaround
-
-### Expected Outcomes
-- **Total Tier 1 upgrades**: {expected_tier1} items
-- **Total USD value**: ${total_usd:,}
-- **Estimated timeline**: 3-6 months for P1 targets
-
----
-
-## PRIORITY 1 TARGETS (IMMEDIATE ACTION REQUIRED)
+def render_package(subpoena_targets, write, section_cache=None, fresh_cache=None):
+    """
+    Render the package markdown through write() piece by piece.
+
+    Targets are partitioned by priority and totalled in one pass; each target
+    section is rendered once, or reused from section_cache (key -> markdown,
+    keyed by the hash of its inputs). fresh_cache, if given, is filled with
+    this run's sections. Returns (sections_rendered, sections_reused).
+    """
+    partitions = {'P1': [], 'P2': [], 'P3': []}
+    expected_tier1 = 0
+    total_usd = 0
+    for target in subpoena_targets:
+        partitions.setdefault(target['priority'], []).append(target)
+        expected_tier1 += target['expected_yield']['tier1_items']
+        total_usd += target['expected_yield'].get('total_usd_value', 0)
 
-""".format(
+    write(PACKAGE_HEADER_TEMPLATE.format(
         timestamp=datetime.now().isoformat(),
         total_targets=len(subpoena_targets),
-        expected_tier1=sum(t['expected_yield']['tier1_items'] for t in subpoena_targets),
-        p1_count=len([t for t in subpoena_targets if t['priority'] == 'P1']),
-        p2_count=len([t for t in subpoena_targets if t['priority'] == 'P2']),
-        p3_count=len([t for t in subpoena_targets if t['priority'] == 'P3']),
-        total_usd=sum(t['expected_yield'].get('total_usd_value', 0) for t in subpoena_targets)
-    )
-
-    # Add P1 targets with full detail
-    p1_targets = [t for t in subpoena_targets if t['priority'] == 'P1']
-    for target in p1_targets:
-        md_content += generate_target_section(target, detailed=True)
-
-    # Add P2 targets
-    md_content += "\n---\n\n## PRIORITY 2 TARGETS (SECONDARY PRIORITIES)\n\n"
-    p2_targets = [t for t in subpoena_targets if t['priority'] == 'P2']
-    for target in p2_targets:
-        md_content += generate_target_section(target, detailed=False)
-
-    # Add P3 targets
-    md_content += "\n---\n\n## PRIORITY 3 TARGETS (DEFERRED)\n\n"
-    p3_targets = [t for t in subpoena_targets if t['priority'] == 'P3']
-    for target in p3_targets:
-        md_content += generate_target_section(target, detailed=False)
-
-    # Add recommendations
-    md_content += """
----
-
-## KEY RECOMMENDATIONS
-
-### Immediate Actions (Next 30 days)
-1. **Issue P1 subpoenas immediately** - These cover {p1_items} high-value evidence items
-2. **Coordinate with exchanges** - Establish legal contacts at Coinbase, Binance
-3. **Nassau County engagement** - Critical for documentary evidence on asset concealment
-
-### Resource Allocation
-- **Focus 70% effort on P1 targets** - Fastest ROI, highest yield
-- **Allocate 20% to P2 targets** - Secondary priorities, moderate complexity
-- **Reserve 10% for P3 targets** - Long-term supporting evidence
-
-### Legal Safeguards
-- ✅ **EESystem protection maintained** - No subpoenas targeting EESystem distributors
-- ✅ **Specific wallet targeting** - Avoid fishing expeditions
-- ✅ **RICO legal basis clear** - All requests tied to 18 U.S.C. § 1962
-
-### Timeline Management
-- **P1 targets**: Expect responses within 60 days (US jurisdiction, clear KYC requirements)
-- **P2 targets**: Expect 90-120 days (international cooperation, multiple agencies)
-- **P3 targets**: Plan for 120-180 days (corporate records, lower urgency)
-
----
-
-## METHODOLOGY
-
-**Evidence Selection**: All Tier 2 items with tier_if_confirmed = 1 or 2
-**Prioritization**: Based on expected yield, transaction value, and response timeline
-**Legal Basis**: RICO investigation under 18 U.S.C. § 1962
-**Safeguards**: EESystem exclusion per LEGAL_SAFEGUARDS.md
-
----
-
-**Next Steps**: Review package, approve P1 targets, coordinate with legal team for issuance.
+        expected_tier1=expected_tier1,
+        p1_count=len(partitions['P1']),
+        p2_count=len(partitions['P2']),
+        p3_count=len(partitions['P3']),
+        total_usd=total_usd
+    ))
+
+    rendered = reused = 0
+    for priority, heading, detailed in PRIORITY_SECTIONS:
+        write(heading)
+        for target in partitions[priority]:
+            key = section_key(target, detailed) if section_cache is not None or fresh_cache is not None else None
+            section = section_cache.get(key) if section_cache is not None else None
+            if section is None:
+                section = generate_target_section(target, detailed)
+                rendered += 1
+            else:
+                reused += 1
+            if fresh_cache is not None:
+                fresh_cache[key] = section
+            write(section)
 
-""".format(
-        p1_items=sum(t['expected_yield']['tier1_items'] for t in p1_targets)
-    )
+    write(RECOMMENDATIONS_TEMPLATE.format(
+        p1_items=sum(t['expected_yield']['tier1_items'] for t in partitions['P1'])
+    ))
+    return rendered, reused
 
-    return md_content
+def generate_package_markdown(subpoena_targets):
+    """Generate comprehensive markdown package with draft subpoena language"""
+    parts = []
+    render_package(subpoena_targets, parts.append)
+    return ''.join(parts)
+
+def write_package_markdown(subpoena_targets, package_file, cache_file=SECTION_CACHE_FILE):
+    """
+    Stream the package straight to package_file (atomically replaced), reusing
+    target sections whose inputs are unchanged since the previous run.
+    Returns (sections_rendered, sections_reused).
+    """
+    section_cache = load_section_cache(cache_file)
+    fresh_cache = {}
+
+    tmp_file = Path(str(package_file) + '.tmp')
+    with open(tmp_file, 'w') as f:
+        counts = render_package(subpoena_targets, f.write, section_cache, fresh_cache)
+    os.replace(tmp_file, package_file)
+
+    try:
+        save_section_cache(cache_file, fresh_cache)
+    except OSError as e:
+        print(f"Warning: Could not persist section cache {cache_file}: {e}")
+    return counts
+
+def section_key(target, detailed):
+    """Hash of everything generate_target_section reads from a target"""
+    inputs = {
+        'template_version': SUBPOENA_TEMPLATE_VERSION,
+        'detailed': detailed,
+        'target_name': target['target_name'],
+        'target_id': target['target_id'],
+        'priority': target['priority'],
+        'category': target['category'],
+        'tier1_items': target['expected_yield']['tier1_items'],
+        'total_usd_value': target['expected_yield'].get('total_usd_value', 0),
+        'wallet_count': target.get('wallet_count'),
+        'document_count': target.get('document_count'),
+        'expected_response': target['timeline']['expected_response'][:10],
+        'wallet_sample': target.get('wallet_addresses', [])[:10]
+    }
+    return hashlib.sha256(json.dumps(inputs, sort_keys=True).encode('utf-8')).hexdigest()
+
+def load_section_cache(cache_file):
+    """section key -> rendered markdown from the previous run"""
+    if not cache_file.exists():
+        return {}
+    try:
+        with open(cache_file, 'r') as f:
+            cache = json.load(f)
+    except (json.JSONDecodeError, OSError) as e:
+        print(f"Warning: Ignoring unreadable section cache {cache_file}: {e}")
+        return {}
+    return cache.get('sections', {})
+
+def save_section_cache(cache_file, sections):
+    """Atomically persist this run's rendered sections"""
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = cache_file.with_suffix('.tmp')
+    with open(tmp_file, 'w') as f:
+        json.dump({'sections': sections}, f)
+    os.replace(tmp_file, cache_file)
 
 def generate_target_section(target, detailed=True):
     """Generate markdown section for a single subpoena target"""
-
-    section = f"""
-### {target['target_name']} ({target['target_id']})
-
-**Priority**: {target['priority']}
-**Category**: {target['category']}
-**Expected Yield**: {target['expected_yield']['tier1_items']} items → Tier 1
-"""
-
-    if target['category'] == 'cryptocurrency_exchange':
-        usd_value = target['expected_yield'].get('total_usd_value', 0)
-        section += f"**Total Transaction Value**: ${usd_value:,}\n"
-        section += f"**Wallet Addresses**: {target['wallet_count']} unique addresses\n"
-    elif target['category'] == 'government_records':
-        section += f"**Document Count**: {target['document_count']} shadowLens items\n"
-
-    section += f"**Timeline**: Response expected by {target['timeline']['expected_response'][:10]}\n"
-
-    if detailed and target['category'] == 'cryptocurrency_exchange':
-        section += f"""
-#### Information Requested
-
-For each wallet address associated with this exchange:
-
-1. **Account Holder Information**
-   - Full legal name
-   - Residential address
-   - Email address(es) on file
-   - Phone number(s) on file
-   - Government ID used for verification
-
-2. **Account Details**
-   - Account creation date
-   - Account status (active/closed/suspended)
-   - Verification level (KYC tier)
-   - Business vs personal account designation
-
-3. **Transaction History**
-   - All deposits (fiat and crypto)
-   - All withdrawals (fiat and crypto)
-   - Date range: 2019-01-01 to present
-
-4. **Related Accounts**
-   - Other accounts with same email/phone/address/ID
-
-5. **Beneficial Ownership** (if business account)
-   - Business name and structure
-   - Beneficial owner name(s)
-
-#### Legal Authority
-
-This request is issued pursuant to ongoing RICO investigation under 18 U.S.C. § 1962. The requested information is material and relevant to:
-
-1. Establishing attribution of cryptocurrency transactions to specific individuals and entities
-2. Tracing proceeds of wire fraud and false advertising schemes
-3. Demonstrating benefit to RICO enterprise (UNIFYD Healing / Jason Shurka organization)
-4. Establishing timeline of fraudulent conduct (2019-2025)
-
-#### Sample Wallet Addresses (Top 10)
-"""
+    category = target['category']
+    parts = [SECTION_HEADER_TEMPLATE.format(
+        target_name=target['target_name'],
+        target_id=target['target_id'],
+        priority=target['priority'],
+        category=category,
+        tier1_items=target['expected_yield']['tier1_items']
+    )]
+
+    if category == 'cryptocurrency_exchange':
+        parts.append(CRYPTO_SUMMARY_TEMPLATE.format(
+            usd_value=target['expected_yield'].get('total_usd_value', 0),
+            wallet_count=target['wallet_count']
+        ))
+    elif category == 'government_records':
+        parts.append(GOVERNMENT_SUMMARY_TEMPLATE.format(document_count=target['document_count']))
+
+    parts.append(TIMELINE_TEMPLATE.format(expected_response=target['timeline']['expected_response'][:10]))
+
+    if detailed and category == 'cryptocurrency_exchange':
+        parts.append(CRYPTO_DETAIL)
         if 'wallet_addresses' in target:
-            for i, wallet in enumerate(target['wallet_addresses'][:10], 1):
-                section += f"{i}. `{wallet}`\n"
-
-    elif detailed and target['category'] == 'government_records':
-        section += f"""
-#### Documents Requested
-
-**Subject Individuals**:
-- Emmanuel (Manny) Shurka
-- Malka Shurka
-- Efraim Shurka
-- Esther Zernitsky
-- Jason Yosef Shurka
-
-**Date Range**: 1995-01-01 to present
-
-**Document Categories**:
-
-1. **Real Property Records**
-   - All deeds, mortgages, and property transfers
-   - Property tax records
-   - Liens and encumbrances
-
-2. **Creditor-Proof Agreements** (Priority)
-   - Specifically: January 18, 2002 agreement mentioned in investigative records
-   - Any asset protection trust documents
-
-3. **Surrogate's Court Filings**
-   - Estate filings
-   - Will probate records
-   - Trust administration records
-
-4. **Court Judgments**
-   - Civil judgments against any subject individuals
-   - Creditor claims
-
-#### Legal Authority
-
-This request supports RICO investigation under 18 U.S.C. § 1962. The requested documents are material to:
-
-1. Establishing pattern of asset concealment (RICO predicate)
-2. Demonstrating intent to defraud creditors
-3. Tracing proceeds of fraud schemes
-4. Establishing family enterprise structure
-"""
+            parts.extend(
+                WALLET_LINE_TEMPLATE.format(i=i, wallet=wallet)
+                for i, wallet in enumerate(target['wallet_addresses'][:10], 1)
+            )
+    elif detailed and category == 'government_records':
+        parts.append(GOVERNMENT_DETAIL)
 
-    section += "\n"
-    return section
+    parts.append("\n")
+    return ''.join(parts)
 
 def generate_outputs(subpoena_targets, total_evidence_count):
     """Task 4: Generate all output files"""
@@ -598,11 +765,9 @@ def generate_outputs(subpoena_targets, total_evidence_count):
 
     # 1. Generate subpoena_package.md
     print("\nGenerating subpoena_package.md...")
-    package_md = generate_package_markdown(subpoena_targets)
     package_file = COORDINATION_DIR / "subpoena_package.md"
-    with open(package_file, 'w') as f:
-        f.write(package_md)
-    print(f"✓ Created: {package_file}")
+    rendered, reused = write_package_markdown(subpoena_targets, package_file)
+    print(f"✓ Created: {package_file} ({rendered} sections rendered, {reused} unchanged)")
 
     # 2. Generate subpoena_targets.json
     print("\nGenerating subpoena_targets.json...")
@@ -727,10 +892,10 @@ def main():
     evidence_items = load_evidence_data()
 
     # Task 2: Group by target
-    target_groups = group_by_subpoena_target(evidence_items)
+    target_groups, group_stats = group_by_subpoena_target(evidence_items)
 
     # Task 3: Prioritize and generate subpoenas
-    subpoena_targets = prioritize_and_generate_subpoenas(target_groups)
+    subpoena_targets = prioritize_and_generate_subpoenas(target_groups, group_stats)
 
     # Task 4: Generate outputs
     output_files = generate_outputs(subpoena_targets, len(evidence_items))
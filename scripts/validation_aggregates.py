@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Validation aggregates - every view of validated_evidence.json in one pass.
+Used by 04_update_global_scope.py, 06_generate_evidence_manifest.py and 07_generate_gaps.py
+
+Purpose:
+- Stream the admitted/flagged/rejected buckets once and build the tier,
+  category, entity, near-threshold and data-quality views together
+- Cache the result next to the input, keyed by the input's content hash
+
+Why this matters:
+- The three downstream scripts used to load the whole file and re-walk
+  each bucket several times; now they render from the same aggregates
+- Reruns on an unchanged validation file skip parsing entirely
+"""
+
+import hashlib
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Dict, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent / "generators"))
+from shadowlens_reader import iter_members
+
+AGGREGATES_VERSION = "1"
+BUCKETS = ("admitted", "flagged", "rejected")
+
+# Manifest ordering (06): TIER 1 first; unknown tiers sort with TIER 5
+TIER_ORDER = {"TIER 1": 1, "TIER 2": 2, "TIER 3": 3, "TIER 4": 4, "TIER 5": 5}
+
+
+def file_hash(path: Path) -> str:
+    """sha256 of the file contents"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def rico_predicates(category, metadata) -> list:
+    """RICO predicates an admitted item maps to"""
+    predicates = []
+    if category == "blockchain":
+        predicates.append("money_laundering")
+    if category in ["telegram", "urls"]:
+        predicates.append("wire_fraud")
+    if "medical" in str(metadata).lower():
+        predicates.extend(["wire_fraud", "fraudulent_claims"])
+    return predicates
+
+
+class ValidationAggregator:
+    """Accumulates every downstream view from one (bucket, evidence_id, evidence) stream"""
+
+    def __init__(self):
+        self.ids = {bucket: [] for bucket in BUCKETS}
+        self.admitted_by_category: Dict[str, list] = {}
+        self.rejected_by_category: Dict[str, list] = {}
+        self.validated_entities = []  # admitted entity_name values, in order (with repeats)
+        self.near_threshold = []      # flagged items with exactly 2 sources
+        self.missing_tx_hash = []
+        self.placeholder = []
+        self.unknown_identifiers = []
+        self.osint_candidates = []
+        # Manifest entries per tier rank; concatenating ranks gives the stable tier sort
+        self.manifest_ranks = {rank: [] for rank in range(1, 6)}
+
+    def add(self, bucket: str, evidence_id: str, evidence: Dict):
+        self.ids[bucket].append(evidence_id)
+        metadata = evidence.get("metadata", {})
+        validation = evidence.get("validation", {})
+
+        if bucket == "admitted":
+            category = evidence.get("category", "unknown")
+            self.admitted_by_category.setdefault(str(category), []).append(evidence_id)
+            if "entity_name" in metadata:
+                self.validated_entities.append(metadata["entity_name"])
+
+            tier = evidence.get("tier", "TIER 5")
+            source_count = validation.get("source_count", 0)
+            self.manifest_ranks[TIER_ORDER.get(tier, 5)].append((evidence_id, {
+                "tier": tier,
+                "category": category,
+                "rico_predicates": rico_predicates(category, metadata),
+                "metadata": metadata,
+                "corpus_sources": validation.get("corpus_sources", []),
+                "source_count": source_count,
+                "prosecution_ready": source_count >= 3
+            }))
+
+        elif bucket == "flagged":
+            if validation.get("source_count", 0) == 2:
+                self.near_threshold.append(evidence_id)
+
+        else:  # rejected
+            category = evidence.get("category", "unknown")
+            self.rejected_by_category.setdefault(str(category), []).append(evidence_id)
+            if category == "blockchain" and "tx_hash" not in metadata:
+                self.missing_tx_hash.append(evidence_id)
+            if metadata.get("amount_usd") == 0 or metadata.get("total_volume") == 0:
+                self.placeholder.append(evidence_id)
+            if metadata.get("entity_name") == "unknown" or metadata.get("exchange") == "unknown":
+                self.unknown_identifiers.append(evidence_id)
+            if metadata.get("from_address") or metadata.get("url"):
+                self.osint_candidates.append(evidence_id)
+
+    def manifest(self) -> Dict:
+        """Admitted items in tier order with their tier/category/predicate buckets (06)"""
+        by_tier, by_category, by_predicate, items = {}, {}, {}, {}
+        for rank in range(1, 6):
+            for evidence_id, entry in self.manifest_ranks[rank]:
+                by_tier.setdefault(entry["tier"], []).append(evidence_id)
+                by_category.setdefault(entry["category"], []).append(evidence_id)
+                for predicate in entry["rico_predicates"]:
+                    by_predicate.setdefault(predicate, []).append(evidence_id)
+                items[evidence_id] = entry
+        return {
+            "evidence_by_tier": by_tier,
+            "evidence_by_category": by_category,
+            "rico_predicate_mapping": by_predicate,
+            "evidence_items": items
+        }
+
+    def result(self, validation_metadata: Optional[Dict]) -> Dict:
+        return {
+            "validation_metadata": validation_metadata,
+            "counts": {bucket: len(ids) for bucket, ids in self.ids.items()},
+            "ids": self.ids,
+            "admitted_by_category": self.admitted_by_category,
+            "rejected_by_category": self.rejected_by_category,
+            "validated_entities": self.validated_entities,
+            "near_threshold": self.near_threshold,
+            "data_quality": {
+                "missing_tx_hash": self.missing_tx_hash,
+                "placeholder": self.placeholder,
+                "unknown_identifiers": self.unknown_identifiers
+            },
+            "osint_candidates": self.osint_candidates,
+            "manifest": self.manifest()
+        }
+
+
+def aggregate_validation(validation_results: Dict) -> Dict:
+    """Aggregates from already-loaded validation results"""
+    aggregator = ValidationAggregator()
+    for bucket in BUCKETS:
+        for evidence_id, evidence in validation_results[bucket].items():
+            aggregator.add(bucket, evidence_id, evidence)
+    return aggregator.result(validation_results.get("validation_metadata"))
+
+
+def load_aggregates(validation_path, cache_path: Optional[Path] = None) -> Dict:
+    """
+    Aggregates for a validated_evidence.json file: reused from the cache when
+    the file's content hash is unchanged, otherwise built in one streaming scan
+    """
+    validation_path = Path(validation_path)
+    cache_path = Path(cache_path) if cache_path else validation_path.with_name(validation_path.name + ".agg.json")
+    input_hash = file_hash(validation_path)
+
+    if cache_path.exists():
+        try:
+            with open(cache_path, 'r') as f:
+                cached = json.load(f)
+            if cached.get("version") == AGGREGATES_VERSION and cached.get("input_hash") == input_hash:
+                print(f"   Using cached aggregates ({cache_path.name})")
+                return cached["aggregates"]
+        except (json.JSONDecodeError, OSError, KeyError):
+            pass
+
+    aggregator = ValidationAggregator()
+    metadata = {}
+    for bucket, evidence_id, evidence in iter_members(validation_path, BUCKETS, metadata):
+        aggregator.add(bucket, evidence_id, evidence)
+    aggregates = aggregator.result(metadata.get("validation_metadata"))
+
+    try:
+        tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+        with open(tmp_path, 'w') as f:
+            json.dump({"version": AGGREGATES_VERSION, "input_hash": input_hash, "aggregates": aggregates}, f)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        print(f"Warning: Could not cache aggregates to {cache_path}: {e}")
+    return aggregates
@@ -0,0 +1,99 @@
+"""
+Telegram fraud scorer: golden NDJSON -> CSV output, and the per-post score
+cache reproducing a fresh scoring run
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts" / "generators"))
+import fraud_scorer
+
+POSTS = [
+    '{"externalId": "101", "uid": "2023-01-05", "body": "Quantum HEALING frequency cures disease! Join now and buy the $2,500 session. Healing, healing."}',
+    '{"externalId": "102", "uid": "2023-01-06", "body": "Consult your doctor first. This healing energy is not a cure for any disease."}',
+    '{"externalId": "103", "uid": "2023-01-07", "body": "Watch LIVE: subscribe and get your ticket - early access for $500 only"}',
+    '{"externalId": "104", "uid": "2023-01-08"}',
+    'not json',
+    '{"body": "$ 12,000 miracle detox, FDA approved, guaranteed clinical and proven: a revolutionary breakthrough in scalar biophoton cellular treatment. Book a session, grab your spot!"}',
+    '{"externalId": "107", "uid": "2023-01-10", "body": "Free trial membership announcement: donate, register, secure your seat. Sale! Discount! Check it out, get yours."}',
+]
+
+# Output of the scorer before the cache and the pattern bank were introduced
+EXPECTED_CSV = """\
+post_id,external_id,date,fraud_score,fraud_keywords,fraud_keyword_count,cta_phrases,cta_count,has_price_claim,price_value,has_medical_claim,medical_specificity_score,tier_recommendation
+1,101,2023-01-05,100,healing|healing|healing|quantum|frequency|disease,6,join|buy,2,True,2500,True,0.6666666666666666,CRITICAL
+2,102,2023-01-06,20,healing|energy|cure|disease,4,,0,False,0,False,0.0,LOW
+3,103,2023-01-07,50,,0,subscribe|watch|live|early access|get your ticket,5,False,0,False,0.0,MEDIUM
+4,104,2023-01-08,0,,0,,0,False,0,False,0.0,LOW
+6,,,100,scalar|biophoton|cellular|detox|fda|approved|clinical|proven|guaranteed|miracle,12,grab your|book a session,2,True,12000,True,1.0,CRITICAL
+7,107,2023-01-10,100,,0,sale|announcement|membership|free trial|discount|register|donate|secure your|get yours|check it out,10,False,0,False,0.0,CRITICAL
+"""
+
+
+def write_posts(path, lines):
+    path.write_text('\n'.join(lines) + '\n', encoding='utf-8')
+    return str(path)
+
+
+@pytest.fixture
+def posts_file(tmp_path):
+    return write_posts(tmp_path / "posts.ndjson", POSTS)
+
+
+def test_golden_csv_without_cache(posts_file):
+    df = fraud_scorer.process_ndjson_file(posts_file)
+
+    assert df.to_csv(index=False) == EXPECTED_CSV
+
+
+def test_cached_run_matches_fresh_run(tmp_path, posts_file, capsys):
+    cache_file = tmp_path / "fraud_score_cache.json"
+
+    first = fraud_scorer.process_ndjson_file(posts_file, cache_file=cache_file)
+    assert "Scored 6 new/changed posts, reused 0 cached scores" in capsys.readouterr().out
+    second = fraud_scorer.process_ndjson_file(posts_file, cache_file=cache_file)
+    assert "Scored 0 new/changed posts, reused 6 cached scores" in capsys.readouterr().out
+
+    assert first.to_csv(index=False) == EXPECTED_CSV
+    assert second.to_csv(index=False) == EXPECTED_CSV
+
+
+def test_changed_and_removed_posts_are_rescored_and_pruned(tmp_path, posts_file, capsys):
+    cache_file = tmp_path / "fraud_score_cache.json"
+    fraud_scorer.process_ndjson_file(posts_file, cache_file=cache_file)
+
+    edited = list(POSTS)
+    post = json.loads(edited[1])
+    post['body'] = "Miracle cure! Buy now for $3,000."
+    edited[1] = json.dumps(post)
+    del edited[2]
+    posts_file = write_posts(tmp_path / "posts.ndjson", edited)
+    capsys.readouterr()
+
+    cached = fraud_scorer.process_ndjson_file(posts_file, cache_file=cache_file)
+    # The post without an ID is keyed by line number, which moved up by one
+    assert "Scored 2 new/changed posts, reused 3 cached scores" in capsys.readouterr().out
+    fresh = fraud_scorer.process_ndjson_file(write_posts(tmp_path / "fresh.ndjson", edited))
+
+    assert cached.to_csv(index=False) == fresh.to_csv(index=False)
+    with open(cache_file, 'r', encoding='utf-8') as f:
+        assert sorted(json.load(f)['posts']) == ['101|2023-01-05', '102|2023-01-06', '104|2023-01-08',
+                                                '107|2023-01-10', 'line:5']
+
+
+def test_rule_change_discards_cache(tmp_path, posts_file, monkeypatch, capsys):
+    cache_file = tmp_path / "fraud_score_cache.json"
+    fraud_scorer.process_ndjson_file(posts_file, cache_file=cache_file)
+
+    monkeypatch.setitem(fraud_scorer.SCORE_WEIGHTS, 'cta', 1)
+    capsys.readouterr()
+    df = fraud_scorer.process_ndjson_file(posts_file, cache_file=cache_file)
+
+    out = capsys.readouterr().out
+    assert "Scoring rules changed" in out
+    assert "Scored 6 new/changed posts" in out
+    assert df['fraud_score'].tolist() == [100, 20, 5, 0, 100, 10]
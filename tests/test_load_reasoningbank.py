@@ -0,0 +1,219 @@
+"""
+Incremental ReasoningBank load: add / modify / delete / crash paths of the
+content-hash delta and the cross-reference map, checked against a full reload
+"""
+
+import copy
+import json
+import sqlite3
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+import load_reasoningbank as rb
+
+PATTERNS_SCHEMA = """
+    CREATE TABLE patterns (
+        id TEXT PRIMARY KEY,
+        type TEXT NOT NULL,
+        pattern_data TEXT NOT NULL,
+        confidence REAL NOT NULL DEFAULT 0.5,
+        usage_count INTEGER NOT NULL DEFAULT 0,
+        created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+        last_used TEXT
+    )
+"""
+
+TABLES = ('patterns', 'evidence_items', *rb.EVIDENCE_SIDE_TABLES, 'evidence_xref_items')
+
+
+def make_item(n, tier=1, principals=('Jason Shurka',), predicates=('Wire Fraud',), corpus_count=2):
+    return {
+        'evidence_id': f'EV-{n:03d}',
+        'tier': tier,
+        'category': 'telegram',
+        'metadata': {
+            'principals_exposed': list(principals),
+            'rico_predicate': list(predicates),
+            'source_file': f'telegram/post_{n}.json',
+            'evidence_act': 'Jason solicits payment',
+        },
+        'validation': {'corpus_sources': [f'corpus/{n}.txt']},
+        'audit': {'tier': tier, 'sources': {'corpus_count': corpus_count, 'notebook_count': 0}},
+    }
+
+
+def base_list():
+    items = [make_item(n, principals=('Jason Shurka', f'Promoter {n % 3}')) for n in range(1, 9)]
+    # Rejected by validate_evidence_item (no sources) but still read by the cross-reference
+    items.append(make_item(9, principals=('Rejected Person',), corpus_count=0))
+    return items
+
+
+def connect(path):
+    conn = sqlite3.connect(path)
+    conn.execute(PATTERNS_SCHEMA)
+    rb.initialize_evidence_tables(conn)
+    return conn
+
+
+def load(conn, evidence_list, incremental=True):
+    stats, _ = rb.load_evidence_to_db(conn, evidence_list, incremental=incremental)
+    cross_references, _ = rb.build_cross_reference_index(conn, evidence_list, incremental=incremental)
+    return stats, cross_references
+
+
+def snapshot(conn):
+    state = {}
+    for table in TABLES:
+        columns = '*' if table != 'patterns' else 'id, type, pattern_data, confidence, usage_count'
+        state[table] = sorted(conn.execute(f"SELECT {columns} FROM {table}").fetchall())
+    return state
+
+
+def full_reload(tmp_path, evidence_list):
+    conn = connect(tmp_path / "fresh.db")
+    _, cross_references = load(conn, evidence_list, incremental=False)
+    state = snapshot(conn)
+    conn.close()
+    return state, cross_references
+
+
+@pytest.fixture
+def loaded(tmp_path):
+    conn = connect(tmp_path / "memory.db")
+    evidence_list = base_list()
+    load(conn, evidence_list, incremental=False)
+    yield conn, evidence_list
+    conn.close()
+
+
+def assert_matches_full_reload(tmp_path, conn, evidence_list, cross_references):
+    expected_state, expected_map = full_reload(tmp_path, evidence_list)
+    assert snapshot(conn) == expected_state
+    assert cross_references == expected_map
+    assert list(cross_references) == list(expected_map)
+    assert rb.load_cross_reference_index(conn) == expected_map
+
+
+def test_unchanged_rerun_writes_nothing(loaded):
+    conn, evidence_list = loaded
+    before = snapshot(conn)
+    stats, _ = rb.load_evidence_to_db(conn, evidence_list, incremental=True)
+    cross_references, affected = rb.build_cross_reference_index(conn, evidence_list, incremental=True)
+
+    assert stats['delta'] == {'written': 0, 'unchanged': 8, 'deleted': []}
+    assert affected == set()
+    assert snapshot(conn) == before
+    assert cross_references == rb.load_cross_reference_index(conn)
+
+
+def test_add_modify_delete_matches_full_reload(tmp_path, loaded):
+    conn, evidence_list = loaded
+    evidence_list = copy.deepcopy(evidence_list)
+    evidence_list[0]['metadata']['principals_exposed'] = ['New Principal']   # modify (principal moves)
+    evidence_list[1]['audit']['tier'] = 2                                     # modify (tier only)
+    del evidence_list[2]                                                      # delete
+    evidence_list.append(make_item(20, principals=('Jason Shurka', 'Late Entry')))  # add
+
+    stats, cross_references = load(conn, evidence_list)
+
+    assert stats['delta']['written'] == 3
+    assert stats['delta']['deleted'] == ['EV-003']
+    assert 'New Principal' in cross_references and 'Late Entry' in cross_references
+    assert_matches_full_reload(tmp_path, conn, evidence_list, cross_references)
+
+
+def test_rejected_item_change_updates_cross_reference(tmp_path, loaded):
+    conn, evidence_list = loaded
+    evidence_list = copy.deepcopy(evidence_list)
+    evidence_list[-1]['metadata']['principals_exposed'] = ['Someone Else']
+
+    stats, cross_references = load(conn, evidence_list)
+
+    assert stats['delta']['written'] == 0  # rejected items never reach evidence_items
+    assert 'Rejected Person' not in cross_references
+    assert cross_references['Someone Else']['evidence_ids'] == ['EV-009']
+    assert_matches_full_reload(tmp_path, conn, evidence_list, cross_references)
+
+
+def test_crash_mid_delta_leaves_previous_load_and_is_repaired(tmp_path, loaded, monkeypatch):
+    conn, evidence_list = loaded
+    before = snapshot(conn)
+    evidence_list = copy.deepcopy(evidence_list)
+    evidence_list[0]['metadata']['principals_exposed'] = ['New Principal']
+    del evidence_list[3]
+
+    real_executemany = rb.executemany_batched
+
+    def crash_on_links(conn, sql, rows, batch_size=rb.BULK_BATCH_SIZE):
+        if 'evidence_principals VALUES' in sql:
+            raise sqlite3.OperationalError("disk I/O error")
+        return real_executemany(conn, sql, rows, batch_size)
+
+    monkeypatch.setattr(rb, 'executemany_batched', crash_on_links)
+    with pytest.raises(sqlite3.OperationalError):
+        rb.load_evidence_to_db(conn, evidence_list, incremental=True)
+    assert snapshot(conn) == before
+
+    monkeypatch.setattr(rb, 'executemany_batched', real_executemany)
+    stats, cross_references = load(conn, evidence_list)
+    assert stats['delta']['written'] == 1
+    assert stats['delta']['deleted'] == ['EV-004']
+    assert_matches_full_reload(tmp_path, conn, evidence_list, cross_references)
+
+
+def test_crash_before_cross_reference_is_repaired_next_run(tmp_path, loaded, monkeypatch):
+    conn, evidence_list = loaded
+    evidence_list = copy.deepcopy(evidence_list)
+    evidence_list[0]['metadata']['principals_exposed'] = ['New Principal']
+
+    rb.load_evidence_to_db(conn, evidence_list, incremental=True)
+
+    def crash(*args, **kwargs):
+        raise sqlite3.OperationalError("disk I/O error")
+
+    monkeypatch.setattr(rb, 'executemany_batched', crash)
+    with pytest.raises(sqlite3.OperationalError):
+        rb.build_cross_reference_index(conn, evidence_list, incremental=True)
+    assert 'New Principal' not in rb.load_cross_reference_index(conn)
+    monkeypatch.undo()
+
+    stats, cross_references = load(conn, evidence_list)
+    assert stats['delta']['written'] == 0
+    assert_matches_full_reload(tmp_path, conn, evidence_list, cross_references)
+
+
+def test_main_reruns_only_when_approved_list_changes(tmp_path, monkeypatch, capsys):
+    approved = tmp_path / "approved_evidence_list.json"
+    evidence_list = base_list()
+
+    def write_approved(items):
+        with open(approved, 'w') as f:
+            json.dump({
+                item['evidence_id']: {'evidence': {k: v for k, v in item.items() if k != 'audit'},
+                                      'audit': item['audit']}
+                for item in items
+            }, f)
+
+    monkeypatch.setattr(rb, 'APPROVED_LIST', approved)
+    monkeypatch.setattr(rb, 'DB_PATH', tmp_path / "memory.db")
+    monkeypatch.setattr(rb, 'STATE_FILE', tmp_path / "state.json")
+    monkeypatch.setattr(rb, 'MEMORY_DIR', tmp_path / "memory")
+    monkeypatch.setattr(rb, 'COORDINATION_DIR', tmp_path / "coordination")
+    conn = sqlite3.connect(tmp_path / "memory.db")
+    conn.execute(PATTERNS_SCHEMA)
+    conn.close()
+
+    write_approved(evidence_list)
+    rb.main()
+    rb.main()
+    assert "Already completed for this approved list" in capsys.readouterr().out
+
+    write_approved(evidence_list + [make_item(30)])
+    rb.main()
+    out = capsys.readouterr().out
+    assert "Already completed" not in out
+    assert "Written: 1, unchanged: 8, deleted: 0" in out
@@ -0,0 +1,102 @@
+"""
+Pattern bank golden hits: every detector over one normalised record and the
+bounded price scan; SubstringMatcher with and without pyahocorasick
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+import pattern_bank
+from pattern_bank import BANK, SubstringMatcher, hits_by_pattern_order, normalize
+
+TEXT = "Quantum HEALING cures disease: join TLS live, $25k or $ 1,500.00. Consult a physician."
+URL = "https://TheLightSystems.com/Healing"
+
+# detector -> [(label, text, value, start, end)]
+EXPECTED_HITS = {
+    'light_system': [
+        (r'\btls\b', 'tls', 'tls', 36, 39),
+        (r'thelightsystems\.com', 'thelightsystems.com', 'thelightsystems.com', 95, 114),
+    ],
+    'url_fraud_keyword': [
+        ('quantum', 'quantum', 'quantum', 0, 7),
+        ('healing', 'healing', 'healing', 8, 15),
+        ('disease', 'disease', 'disease', 22, 29),
+        ('healing', 'healing', 'healing', 115, 122),
+    ],
+    'url_price': [
+        ('price', '$25k', '25', 46, 50),
+        ('price', '$ 1,500.00', '1,500.00', 54, 64),
+    ],
+    'telegram_fraud_keyword': [
+        ('quantum', 'quantum', 'quantum', 0, 7),
+        ('healing', 'healing', 'healing', 8, 15),
+        ('disease', 'disease', 'disease', 22, 29),
+        ('healing', 'healing', 'healing', 115, 122),
+    ],
+    'cta': [
+        (r'\bjoin\b', 'join', 'join', 31, 35),
+        (r'\blive\b', 'live', 'live', 40, 44),
+    ],
+    'medical_claim': [
+        ('healing', 'healing', 'healing', 8, 15),
+        ('disease', 'disease', 'disease', 22, 29),
+        ('healing', 'healing', 'healing', 115, 122),
+    ],
+    'disclaimer': [
+        ('consult', 'consult', 'consult', 66, 73),
+        ('physician', 'physician', 'physician', 76, 85),
+    ],
+    'medical_specificity': [
+        ('quantum', 'quantum', 'quantum', 0, 7),
+    ],
+    'telegram_price': [
+        ('price', '$25', '25', 46, 49),
+        ('price', '$ 1,500', '1,500', 54, 61),
+    ],
+}
+
+
+def summarize(hits):
+    return [(hit.label, hit.text, hit.value, hit.start, hit.end) for hit in hits]
+
+
+def test_match_golden_hits():
+    hits = BANK.match(normalize(TEXT, URL))
+
+    assert {name: summarize(found) for name, found in hits.items()} == EXPECTED_HITS
+
+
+def test_overlapping_detectors_each_report_their_hits():
+    hits = BANK.match(normalize(TEXT, URL), ('telegram_fraud_keyword', 'medical_claim'))
+
+    # 'healing' belongs to both detectors and is reported by both
+    assert [hit.label for hit in hits_by_pattern_order(hits['telegram_fraud_keyword'])] == [
+        'healing', 'healing', 'quantum', 'disease'
+    ]
+    assert [hit.label for hit in hits['medical_claim']] == ['healing', 'disease', 'healing']
+
+
+def test_scan_endpos_and_limit():
+    text = "only $5,000 kajabi"
+
+    assert summarize(BANK.scan('url_price', text)) == [('price', '$5,000 k', '5,000', 5, 13)]
+    assert summarize(BANK.scan('url_price', text, endpos=11)) == [('price', '$5,000', '5,000', 5, 11)]
+    assert len(BANK.scan('cta', "join join join", limit=2)) == 2
+
+
+@pytest.mark.parametrize('has_ahocorasick', [False, pattern_bank.HAS_AHOCORASICK])
+def test_substring_matcher_first(monkeypatch, has_ahocorasick):
+    monkeypatch.setattr(pattern_bank, 'HAS_AHOCORASICK', has_ahocorasick)
+    patterns = ['she', 'he', 'hers', 'his', 'he']
+
+    matcher = SubstringMatcher(patterns)
+    for text in ['ushers', 'ahis', 'the hero', 'hers', 'zzz', '']:
+        expected = next((i for i, p in enumerate(patterns) if p in text), None)
+        assert matcher.first(text) == expected
+
+    assert SubstringMatcher(['doctor', '', 'x']).first('none') == 1
+    assert SubstringMatcher([]).first('anything') is None
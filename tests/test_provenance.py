@@ -0,0 +1,124 @@
+"""
+Provenance support index: corroborating() against brute-force set
+intersection, incremental and persisted file -> items indexes, and the
+validation stage recording every item's support
+"""
+
+import importlib
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+import provenance
+from provenance import Provenance
+
+BACKENDS = [False] + ([True] if provenance.HAS_PYROARING else [])
+
+
+@pytest.fixture(params=BACKENDS, ids=lambda roaring: 'pyroaring' if roaring else 'int')
+def backend(request, monkeypatch):
+    monkeypatch.setattr(provenance, 'HAS_PYROARING', request.param)
+
+
+def random_supports(seed=7, n_files=80, n_items=150):
+    rng = random.Random(seed)
+    files = [f"corpus/file_{i:03d}.txt" for i in range(n_files)]
+    supports = {}
+    for n in range(n_items):
+        # A few hub files make large overlaps likely
+        k = rng.randint(0, 8)
+        supports[f"EV-{n:03d}"] = set(rng.sample(files[:10], min(k, 3)) + rng.sample(files, k))
+    return files, supports
+
+
+def brute_force(supports, item_id, min_shared):
+    mine = supports[item_id]
+    shared = [(other, len(mine & theirs)) for other, theirs in supports.items() if other != item_id]
+    return sorted(((other, n) for other, n in shared if n >= min_shared), key=lambda x: (-x[1], x[0]))
+
+
+def build(files, supports, split=False):
+    registry = Provenance(files)
+    for item_id, paths in supports.items():
+        paths = sorted(paths)
+        if split:
+            # Extending an item's support must match recording it whole
+            registry.add_support(item_id, registry.bitmap(paths[::2]))
+            registry.add_support(item_id, registry.bitmap(paths[1::2]))
+        else:
+            registry.add_support(item_id, registry.bitmap(paths))
+    return registry
+
+
+def assert_corroborating(registry, supports):
+    for item_id in supports:
+        for min_shared in (1, 2, 3):
+            assert registry.corroborating(item_id, min_shared) == brute_force(supports, item_id, min_shared)
+
+
+def test_corroborating_matches_brute_force(backend):
+    files, supports = random_supports()
+
+    assert_corroborating(build(files, supports), supports)
+    assert_corroborating(build(files, supports, split=True), supports)
+    assert build(files, supports).corroborating('EV-999') == []
+
+
+def test_index_built_before_adds_stays_current(backend):
+    files, supports = random_supports(seed=11)
+    registry = Provenance(files)
+    registry.items_by_file()  # built empty, then maintained incrementally
+
+    for item_id, paths in supports.items():
+        registry.add_support(item_id, registry.bitmap(paths))
+    assert_corroborating(registry, supports)
+
+    rebuilt = build(files, supports)
+    assert {k: sorted(v) for k, v in registry.items_by_file().items()} == \
+        {k: sorted(v) for k, v in rebuilt.items_by_file().items()}
+
+
+def test_support_index_round_trip(backend, tmp_path):
+    files, supports = random_supports(seed=3)
+    registry = build(files, supports)
+    registry.save(tmp_path / "corpus_file_ids.json")
+    registry.save_support(tmp_path / "corpus_support_index.json")
+
+    loaded = Provenance.load(tmp_path / "corpus_file_ids.json", support_path=tmp_path / "corpus_support_index.json")
+
+    assert loaded.items_by_file() == registry.items_by_file()
+    assert {k: provenance.to_ids(v) for k, v in loaded.support.items()} == \
+        {k: provenance.to_ids(v) for k, v in registry.support.items()}
+    assert_corroborating(loaded, supports)
+
+    # Supports saved against file IDs this registry doesn't know are ignored
+    assert not Provenance(files[:10]).load_support(tmp_path / "corpus_support_index.json")
+    assert Provenance.load(tmp_path / "corpus_file_ids.json").support == {}
+
+
+def test_validation_records_item_supports(backend):
+    orchestrator = importlib.import_module("03_validation_orchestrator")
+    corpus_mapping = {
+        "0xabc": {"matches": [{"file": "a.csv"}, {"file": "b.csv"}, {"file": "c.csv"}]},
+        "acme": {"matches": [{"file": "b.csv"}, {"file": "c.csv"}]},
+        "other": {"matches": [{"file": "d.csv"}]},
+    }
+    evidence_index = {
+        "EV-1": {"metadata": {"from_address": "0xabc"}},
+        "EV-2": {"metadata": {"entity_name": "acme"}},
+        "EV-3": {"metadata": {"entity_name": "other"}},
+    }
+    index = orchestrator.CorpusIndex(corpus_mapping, Provenance())
+
+    orchestrator.validate_all(evidence_index, index)
+
+    registry = index.provenance
+    assert {k: registry.paths(v) for k, v in registry.support.items()} == {
+        "EV-1": ["a.csv", "b.csv", "c.csv"],
+        "EV-2": ["b.csv", "c.csv"],
+        "EV-3": ["d.csv"],
+    }
+    assert registry.corroborating("EV-1") == [("EV-2", 2)]
@@ -0,0 +1,74 @@
+"""
+URL analysis: golden NDJSON -> CSV rows, the top-K report and summary
+statistics of the streaming pipeline
+"""
+
+import csv
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts" / "generators"))
+import url_analysis
+
+RECORDS = [
+    '{"url": "https://thelightsystems.com/quantum-healing", "postId": "p1", "type": "website", "status": "success", "data": {"title": "The Light System - Quantum Healing", "metaDescription": "FDA approved miracle cure for cancer and pain", "headings": ["Revolutionary frequency therapy", "Only $25k per bed"]}}',
+    # Price at the very end of the text, URL starting with "k": the claim stays $5,000
+    '{"url": "kajabi.com/offer", "postId": "p2", "type": "youtube", "status": "success", "data": {"title": "Energy medicine", "description": "Book a clinically proven treatment today for $5,000"}}',
+    '{"url": "https://t.me/tlsmarketplace/55", "postId": "p3", "type": "telegram", "status": "failed", "data": {}}',
+    '{"url": "https://unifyd.com/tv", "postId": "p4", "type": "other", "status": "success", "data": {"title": "UNIFYD healing doctor", "headings": "not a list"}}',
+    'not json',
+    '',
+    '{"url": "https://example.org/page", "postId": "p6", "type": "website", "status": "success", "data": {"title": "The Light System breakthrough", "headings": ["Certified scientifically", "$1,200.50 or $999 or $12,000"]}}',
+    '{"url": "https://youtu.be/abc", "postId": "p7", "type": "video", "status": "error"}',
+]
+
+# Rows the analysis produced before streaming and the pattern bank (input order)
+EXPECTED_ROWS = [
+    ['url', 'post_id', 'platform', 'light_system_mention', 'fraud_keywords', 'fraud_score',
+     'tier_recommendation', 'pricing_claims', 'status'],
+    ['https://thelightsystems.com/quantum-healing', 'p1', 'website', 'True',
+     'quantum,healing,fda,frequency,cure,miracle,approved,therapy,cancer,pain,revolutionary',
+     '70', '1', '', 'success'],
+    ['kajabi.com/offer', 'p2', 'youtube', 'False', 'energy,treatment,clinically', '30', '3', '$5,000', 'success'],
+    ['https://t.me/tlsmarketplace/55', 'p3', 'telegram', 'True', '', '30', '2', '', 'failed'],
+    ['https://unifyd.com/tv', 'p4', 'unifyd', 'False', 'healing,doctor', '8', '3', '', 'success'],
+    ['https://example.org/page', 'p6', 'website', 'True', 'certified,breakthrough,scientifically',
+     '66', '1', '$1,200.50,$12,000', 'success'],
+    ['https://youtu.be/abc', 'p7', 'youtube', 'False', '', '5', '3', '', 'error'],
+]
+
+
+def read_rows(path):
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        return list(csv.reader(f))
+
+
+def run_pipeline(tmp_path, top_k):
+    input_file = tmp_path / "deep-crawl-results.ndjson"
+    input_file.write_text('\n'.join(RECORDS) + '\n', encoding='utf-8')
+    output_file = tmp_path / "url_classifications.csv"
+    summary = url_analysis.write_rows(
+        url_analysis.analyze_records(url_analysis.iter_records(str(input_file))),
+        str(output_file),
+        url_analysis.AnalysisSummary(top_k=top_k)
+    )
+    return output_file, summary
+
+
+def test_golden_csv(tmp_path):
+    output_file, _ = run_pipeline(tmp_path, top_k=3)
+
+    assert read_rows(output_file) == EXPECTED_ROWS
+
+
+def test_summary_and_top_k(tmp_path):
+    _, summary = run_pipeline(tmp_path, top_k=3)
+
+    assert summary.total == 6
+    assert summary.platforms == {'website': 2, 'youtube': 2, 'telegram': 1, 'unifyd': 1}
+    assert summary.tiers == {1: 2, 2: 1, 3: 3}
+    assert summary.light_system_mentions == 3
+    assert summary.mean == (70 + 30 + 30 + 8 + 66 + 5) / 6
+    assert summary.median == 30
+    # Highest scores first; the tie at 30 keeps input order
+    assert [row['post_id'] for row in summary.top()] == ['p1', 'p6', 'p2']